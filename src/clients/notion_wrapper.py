@@ -1,7 +1,11 @@
 import asyncio
+import copy
 import os
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import aiohttp
 from notion_client import Client
@@ -13,6 +17,15 @@ from src.utils.task_status import TaskStatus
 
 logger = get_logger(__name__)
 
+# Maximum number of Notion requests in flight for a single batch call
+BATCH_REQUEST_WORKERS = 5
+
+# Seconds a retrieved or updated page may be served from memory by get_page
+PAGE_CACHE_TTL = 5.0
+
+# Maximum number of pages kept in the get_page cache
+PAGE_CACHE_SIZE = 512
+
 
 class NotionClientWrapper:
     def __init__(self, token: Optional[str] = None, database_id: Optional[str] = None, max_retries: int = 3):
@@ -53,6 +66,10 @@ class NotionClientWrapper:
 
         self.max_retries = max_retries
 
+        # page_id -> (stored_at, last_edited_time, page); most recently used entries at the end
+        self._page_cache: "OrderedDict[str, Tuple[float, str, Dict[str, Any]]]" = OrderedDict()
+        self._page_cache_lock = threading.Lock()
+
         try:
             self.client = Client(auth=self.token)
 
@@ -547,6 +564,7 @@ class NotionClientWrapper:
 
             # Clear existing files first
             self._retry_with_exponential_backoff(self.client.pages.update, page_id=page_id, properties=clear_property)
+            self._forget_page(page_id)
 
             logger.info(f"🧹 Cleared existing files from property '{property_name}'")
 
@@ -566,6 +584,7 @@ class NotionClientWrapper:
 
             # Update the page with file property
             updated_page = self._retry_with_exponential_backoff(self.client.pages.update, page_id=page_id, properties=file_property)
+            self._cache_page(page_id, updated_page)
 
             upload_result = {
                 "file_name": file_name,
@@ -755,17 +774,75 @@ class NotionClientWrapper:
 
         return rollback_results
 
-    def get_page(self, page_id: str) -> Dict[str, Any]:
+    def get_page(self, page_id: str, max_age: float = PAGE_CACHE_TTL) -> Dict[str, Any]:
+        """
+        Retrieve a page, serving a copy from the page cache when a recent version exists.
+
+        Callers that read a property in order to write it back (read-modify-write)
+        must pass max_age=0 so they never start from a stale version.
+
+        Args:
+            page_id: Notion page ID
+            max_age: Oldest cached copy (in seconds) that may be returned; 0 always fetches
+
+        Returns:
+            Notion page object
+        """
+        if max_age > 0:
+            cached_page = self._get_cached_page(page_id, max_age)
+            if cached_page is not None:
+                return cached_page
+
         try:
             page = self.client.pages.retrieve(page_id=page_id)
+            self._cache_page(page_id, page)
             return page
         except Exception as e:
             logger.error(f"Failed to retrieve page {page_id}: {e}")
             raise
 
+    def _get_cached_page(self, page_id: str, max_age: float) -> Optional[Dict[str, Any]]:
+        with self._page_cache_lock:
+            entry = self._page_cache.get(page_id)
+            if entry is None:
+                return None
+            stored_at, _, page = entry
+            if time.monotonic() - stored_at > max_age:
+                return None
+            self._page_cache.move_to_end(page_id)
+        # The cached dict is shared, so callers get their own copy to modify
+        return copy.deepcopy(page)
+
+    def _cache_page(self, page_id: str, page: Any) -> None:
+        """
+        Remember the newest known version of a page, evicting the least recently used entry when full.
+
+        Responses can arrive out of order when several threads update the same page,
+        so a page whose last_edited_time is older than the cached version is ignored.
+        """
+        if not isinstance(page, dict):
+            return
+        last_edited_time = page.get("last_edited_time") or ""
+        page = copy.deepcopy(page)
+        with self._page_cache_lock:
+            entry = self._page_cache.get(page_id)
+            # ISO 8601 timestamps from Notion share one format, so they compare as strings
+            if entry is not None and last_edited_time and last_edited_time < entry[1]:
+                return
+            self._page_cache[page_id] = (time.monotonic(), last_edited_time, page)
+            self._page_cache.move_to_end(page_id)
+            if len(self._page_cache) > PAGE_CACHE_SIZE:
+                self._page_cache.popitem(last=False)
+
+    def _forget_page(self, page_id: str) -> None:
+        with self._page_cache_lock:
+            self._page_cache.pop(page_id, None)
+
     def update_page(self, page_id: str, properties: Dict[str, Any]) -> Dict[str, Any]:
         try:
             updated_page = self._retry_with_exponential_backoff(self.client.pages.update, page_id=page_id, properties=properties)
+            # The update response is the newest version of the page
+            self._cache_page(page_id, updated_page)
             logger.info(f"Successfully updated page {page_id}")
             return updated_page
         except Exception as e:
@@ -834,6 +911,48 @@ class NotionClientWrapper:
             logger.error(f"❌ Failed to update property '{property_name}' for page {page_id}: {e}")
             raise
 
+    def batch_get_pages(self, page_ids: List[str], max_age: float = PAGE_CACHE_TTL) -> List[Optional[Dict[str, Any]]]:
+        """
+        Retrieve several pages concurrently.
+
+        Notion has no bulk read endpoint, so the requests are issued in parallel
+        and gathered in input order.
+
+        Args:
+            page_ids: Notion page IDs to retrieve
+            max_age: Maximum age in seconds of a cached page to accept, as for get_page
+
+        Returns:
+            Page objects in the same order as page_ids, None where retrieval failed
+        """
+        return self._gather_requests(lambda page_id: self.get_page(page_id, max_age=max_age), [(page_id,) for page_id in page_ids])
+
+    def batch_update_page_statuses(self, updates: List[Tuple[str, str]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Update the status of several pages concurrently.
+
+        Args:
+            updates: List of (page_id, status) tuples
+
+        Returns:
+            Updated page objects in the same order as updates, None where the update failed
+        """
+        return self._gather_requests(self.update_page_status, updates)
+
+    def _gather_requests(self, request: Callable[..., Dict[str, Any]], calls: List[Tuple]) -> List[Optional[Dict[str, Any]]]:
+        """Run request for each argument tuple on a small thread pool; failures (already logged) become None."""
+        if not calls:
+            return []
+
+        def invoke(args: Tuple) -> Optional[Dict[str, Any]]:
+            try:
+                return request(*args)
+            except Exception:
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(BATCH_REQUEST_WORKERS, len(calls)), thread_name_prefix="notion-batch") as executor:
+            return list(executor.map(invoke, calls))
+
     def get_page_content(self, page_id: str) -> str:
         try:
             blocks = self.client.blocks.children.list(block_id=page_id)
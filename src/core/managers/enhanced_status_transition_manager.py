@@ -7,6 +7,7 @@ Provides integrated workflow for task completion with validation and git operati
 """
 import threading
 import time
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -184,7 +185,7 @@ class EnhancedStatusTransitionManager(StatusTransitionManager):
         )
 
         # Thread-safe operation
-        with self._transition_lock:
+        with self._page_lock(page_id):
             try:
                 logger.info(f"🔄 Starting enhanced transition: {from_status} → {to_status} for page {page_id[:8]}...")
                 if ticket_id:
@@ -438,11 +439,12 @@ class EnhancedStatusTransitionManager(StatusTransitionManager):
             The finalized transition
         """
         # Add to enhanced history
-        self._enhanced_transition_history.append(transition)
+        with self._transition_lock.write():
+            self._enhanced_transition_history.append(transition)
 
-        # Keep history manageable
-        if len(self._enhanced_transition_history) > self._max_enhanced_history:
-            self._enhanced_transition_history = self._enhanced_transition_history[-self._max_enhanced_history :]
+            # Keep history manageable
+            if len(self._enhanced_transition_history) > self._max_enhanced_history:
+                self._enhanced_transition_history = self._enhanced_transition_history[-self._max_enhanced_history :]
 
         # Also add to base class history
         base_transition = StatusTransition(
@@ -505,25 +507,29 @@ class EnhancedStatusTransitionManager(StatusTransitionManager):
         """
         base_stats = super().get_statistics()
 
-        total_enhanced = len(self._enhanced_transition_history)
+        with self._transition_lock.read():
+            history = list(self._enhanced_transition_history)
+
+        total_enhanced = len(history)
         if total_enhanced == 0:
             return {**base_stats, "enhanced_transitions": 0}
 
-        # Enhanced transition statistics
-        successful_enhanced = len([t for t in self._enhanced_transition_history if t.result == EnhancedTransitionResult.SUCCESS])
-        validation_failed = len([t for t in self._enhanced_transition_history if t.result == EnhancedTransitionResult.CHECKBOX_VALIDATION_FAILED])
-        commit_failed = len([t for t in self._enhanced_transition_history if t.result == EnhancedTransitionResult.COMMIT_FAILED])
-        rollback_successful = len([t for t in self._enhanced_transition_history if t.result == EnhancedTransitionResult.ROLLBACK_SUCCESS])
+        # Enhanced transition statistics, counted in a single pass over the history
+        result_counts = Counter(t.result for t in history)
+        successful_enhanced = result_counts[EnhancedTransitionResult.SUCCESS]
+        validation_failed = result_counts[EnhancedTransitionResult.CHECKBOX_VALIDATION_FAILED]
+        commit_failed = result_counts[EnhancedTransitionResult.COMMIT_FAILED]
+        rollback_successful = result_counts[EnhancedTransitionResult.ROLLBACK_SUCCESS]
 
         # Validation statistics
-        validation_operations = [t.validation_operation for t in self._enhanced_transition_history if t.validation_operation is not None]
+        validation_operations = [t.validation_operation for t in history if t.validation_operation is not None]
         validation_success_rate = 0.0
         if validation_operations:
             successful_validations = len([v for v in validation_operations if v.result == ValidationResult.SUCCESS])
             validation_success_rate = (successful_validations / len(validation_operations)) * 100
 
         # Commit statistics
-        commit_operations = [t.commit_operation for t in self._enhanced_transition_history if t.commit_operation is not None]
+        commit_operations = [t.commit_operation for t in history if t.commit_operation is not None]
         commit_success_rate = 0.0
         if commit_operations:
             successful_commits = len([c for c in commit_operations if c.result == CommitResult.SUCCESS])
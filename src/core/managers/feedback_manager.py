@@ -182,7 +182,8 @@ class FeedbackManager:
             Current feedback content as string
         """
         try:
-            page = self.notion_client.get_page(page_id)
+            # Feedback is read-modify-written, so always start from the live page
+            page = self.notion_client.get_page(page_id, max_age=0)
             properties = page.get("properties", {})
             feedback_prop = properties.get("Feedback", {})
 
@@ -1,9 +1,14 @@
+import sys
 import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager, nullcontext
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from itertools import islice
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
 
 from src.clients.notion_wrapper import NotionClientWrapper
 from src.utils.logging_config import get_logger
@@ -11,6 +16,12 @@ from src.utils.task_status import TaskStatus
 
 logger = get_logger(__name__)
 
+# Maximum number of concurrent Notion requests issued by transition_batch
+BATCH_TRANSITION_CONCURRENCY = 5
+
+# Number of striped per-page locks serializing Notion calls for the same page
+PAGE_LOCK_STRIPES = 64
+
 
 class TransitionResult(str, Enum):
     SUCCESS = "success"
@@ -19,7 +30,77 @@ class TransitionResult(str, Enum):
     ROLLBACK_FAILED = "rollback_failed"
 
 
-@dataclass
+class ReadWriteLock:
+    """
+    Lock allowing many concurrent readers or a single writer.
+
+    The write side is reentrant and the writing thread may also take the read
+    side. Waiting writers block new readers so writes are not starved.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer: Optional[int] = None
+        self._write_depth = 0
+        self._writers_waiting = 0
+
+    @contextmanager
+    def read(self):
+        """Hold the lock in shared mode for the duration of the block."""
+        me = threading.get_ident()
+        with self._condition:
+            if self._writer != me:
+                while self._writer is not None or self._writers_waiting:
+                    self._condition.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write(self):
+        """Hold the lock in exclusive mode for the duration of the block."""
+        me = threading.get_ident()
+        with self._condition:
+            if self._writer == me:
+                self._write_depth += 1
+            else:
+                self._writers_waiting += 1
+                while self._writer is not None or self._readers:
+                    self._condition.wait()
+                self._writers_waiting -= 1
+                self._writer = me
+                self._write_depth = 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._write_depth -= 1
+                if not self._write_depth:
+                    self._writer = None
+                    self._condition.notify_all()
+
+
+class _UnsynchronizedLock:
+    """Drop-in for ReadWriteLock that does no locking, for managers confined to one thread."""
+
+    def read(self):
+        return nullcontext()
+
+    def write(self):
+        return nullcontext()
+
+
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__ of history entries
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class StatusTransition:
     """Represents a status transition operation"""
 
@@ -36,40 +117,62 @@ class StatusTransition:
 class StatusTransitionManager:
     """
     Manages atomic status transitions with error handling and rollback capabilities.
-    Thread-safe for concurrent ticket processing.
+    Thread-safe for concurrent ticket processing: transitions on different pages run in parallel,
+    and history and statistics reads do not block each other. Construct with thread_safe=False
+    to skip all locking when the manager is only ever used from a single thread.
     """
 
-    def __init__(self, notion_client: NotionClientWrapper):
+    # Valid status transitions mapping - complete workflow, built once and shared by all instances
+    _valid_transitions = {
+        # Early workflow stages
+        TaskStatus.IDEAS.value: [TaskStatus.TO_REFINE.value],
+        TaskStatus.TO_REFINE.value: [TaskStatus.REFINED.value],
+        TaskStatus.REFINED.value: [TaskStatus.PREPARE_TASKS.value],
+        TaskStatus.PREPARE_TASKS.value: [TaskStatus.PREPARING_TASKS.value],
+        TaskStatus.PREPARING_TASKS.value: [
+            TaskStatus.READY_TO_RUN.value,
+            TaskStatus.FAILED.value,
+        ],
+        # Queue workflow stages
+        TaskStatus.READY_TO_RUN.value: [TaskStatus.QUEUED_TO_RUN.value],
+        TaskStatus.QUEUED_TO_RUN.value: [TaskStatus.IN_PROGRESS.value],
+        TaskStatus.IN_PROGRESS.value: [TaskStatus.DONE.value, TaskStatus.FAILED.value],
+        # Error and final states
+        TaskStatus.FAILED.value: [
+            TaskStatus.QUEUED_TO_RUN.value,
+            TaskStatus.IN_PROGRESS.value,
+            TaskStatus.TO_REFINE.value,
+        ],
+        TaskStatus.DONE.value: [],  # Final state
+    }
+    _valid_pairs = frozenset((from_status, to_status) for from_status, targets in _valid_transitions.items() for to_status in targets)
+
+    def __init__(self, notion_client: NotionClientWrapper, thread_safe: bool = True):
+        """
+        Args:
+            notion_client: Notion client used to read and update pages
+            thread_safe: Guard history and per-page Notion calls with locks; pass False only
+                when a single thread uses the manager, since no locking is done at all then
+        """
         self.notion_client = notion_client
-        self._transition_lock = threading.RLock()  # Reentrant lock for nested operations
-        self._transition_history: List[StatusTransition] = []
+        self._thread_safe = thread_safe
+        if thread_safe:
+            self._transition_lock = ReadWriteLock()  # Shared for history reads, exclusive (reentrant) for history updates
+            self._page_locks = [threading.RLock() for _ in range(PAGE_LOCK_STRIPES)]  # Held across Notion calls for a page
+        else:
+            self._transition_lock = _UnsynchronizedLock()
+            self._page_locks = [nullcontext()] * PAGE_LOCK_STRIPES
         self._max_history = 1000  # Keep last 1000 transitions for debugging
+        self._transition_history: Deque[StatusTransition] = deque(maxlen=self._max_history)
+        self._history_by_page: Dict[str, Deque[StatusTransition]] = {}  # Same entries, grouped by page_id
+
+        # Running totals over the transitions currently held in history
+        self._count_success = 0
+        self._count_failed = 0
+        self._count_rollback_attempted = 0
+        self._count_rollback_success = 0
 
-        # Valid status transitions mapping - complete workflow
-        self._valid_transitions = {
-            # Early workflow stages
-            TaskStatus.IDEAS.value: [TaskStatus.TO_REFINE.value],
-            TaskStatus.TO_REFINE.value: [TaskStatus.REFINED.value],
-            TaskStatus.REFINED.value: [TaskStatus.PREPARE_TASKS.value],
-            TaskStatus.PREPARE_TASKS.value: [TaskStatus.PREPARING_TASKS.value],
-            TaskStatus.PREPARING_TASKS.value: [
-                TaskStatus.READY_TO_RUN.value,
-                TaskStatus.FAILED.value,
-            ],
-            # Queue workflow stages
-            TaskStatus.READY_TO_RUN.value: [TaskStatus.QUEUED_TO_RUN.value],
-            TaskStatus.QUEUED_TO_RUN.value: [TaskStatus.IN_PROGRESS.value],
-            TaskStatus.IN_PROGRESS.value: [TaskStatus.DONE.value, TaskStatus.FAILED.value],
-            # Error and final states
-            TaskStatus.FAILED.value: [
-                TaskStatus.QUEUED_TO_RUN.value,
-                TaskStatus.IN_PROGRESS.value,
-                TaskStatus.TO_REFINE.value,
-            ],
-            TaskStatus.DONE.value: [],  # Final state
-        }
-
-        logger.info("🔄 StatusTransitionManager initialized with thread-safe operations")
+        logger.info("🔄 StatusTransitionManager initialized with %s operations", "thread-safe" if thread_safe else "single-threaded")
 
     def is_valid_transition(self, from_status: str, to_status: str) -> bool:
         """
@@ -82,16 +185,16 @@ class StatusTransitionManager:
         Returns:
             True if transition is valid, False otherwise
         """
-        valid_targets = self._valid_transitions.get(from_status, [])
-        is_valid = to_status in valid_targets
+        if (from_status, to_status) in self._valid_pairs:
+            return True
 
-        if not is_valid:
-            logger.warning(f"⚠️ Invalid transition attempted: {from_status} → {to_status}")
-            logger.info(f"📋 Valid transitions from '{from_status}': {valid_targets}")
+        logger.warning("⚠️ Invalid transition attempted: %s → %s", from_status, to_status)
+        logger.info("📋 Valid transitions from '%s': %s", from_status, self._valid_transitions.get(from_status, []))
+        return False
 
-        return is_valid
-
-    def transition_status(self, page_id: str, from_status: str, to_status: str, validate_transition: bool = True) -> StatusTransition:
+    def transition_status(
+        self, page_id: str, from_status: str, to_status: str, validate_transition: bool = True, trust_from_status: bool = False
+    ) -> StatusTransition:
         """
         Perform an atomic status transition with error handling.
 
@@ -100,6 +203,7 @@ class StatusTransitionManager:
             from_status: Expected current status
             to_status: Target status
             validate_transition: Whether to validate transition rules
+            trust_from_status: Skip re-reading the page when the caller already knows its current status
 
         Returns:
             StatusTransition object with operation results
@@ -107,9 +211,9 @@ class StatusTransitionManager:
         transition = StatusTransition(page_id=page_id, from_status=from_status, to_status=to_status, timestamp=datetime.now())
 
         # Thread-safe operation
-        with self._transition_lock:
+        with self._page_lock(page_id):
             try:
-                logger.info(f"🔄 Starting status transition: {from_status} → {to_status} for page {page_id[:8]}...")
+                logger.info("🔄 Starting status transition: %s → %s for page %s...", from_status, to_status, page_id[:8])
 
                 # Validate transition if requested
                 if validate_transition and not self.is_valid_transition(from_status, to_status):
@@ -118,26 +222,27 @@ class StatusTransitionManager:
                     self._add_to_history(transition)
                     return transition
 
-                # Get current status to verify it matches expected from_status
-                try:
-                    current_page = self.notion_client.get_page(page_id)
-                    current_status = self._extract_current_status(current_page)
+                # Get current status to verify it matches expected from_status, unless the caller vouches for it
+                if not trust_from_status:
+                    try:
+                        current_page = self.notion_client.get_page(page_id, max_age=0)
+                        current_status = self._extract_current_status(current_page)
 
-                    if current_status != from_status:
-                        logger.warning(f"⚠️ Status mismatch: expected '{from_status}', found '{current_status}'")
-                        # Update from_status to actual current status for accuracy
-                        transition.from_status = current_status
+                        if current_status != from_status:
+                            logger.warning("⚠️ Status mismatch: expected '%s', found '%s'", from_status, current_status)
+                            # Update from_status to actual current status for accuracy
+                            transition.from_status = current_status
 
-                        # Re-validate with actual current status
-                        if validate_transition and not self.is_valid_transition(current_status, to_status):
-                            transition.result = TransitionResult.FAILED
-                            transition.error = f"Invalid transition from actual status: {current_status} → {to_status}"
-                            self._add_to_history(transition)
-                            return transition
+                            # Re-validate with actual current status
+                            if validate_transition and not self.is_valid_transition(current_status, to_status):
+                                transition.result = TransitionResult.FAILED
+                                transition.error = f"Invalid transition from actual status: {current_status} → {to_status}"
+                                self._add_to_history(transition)
+                                return transition
 
-                except Exception as status_check_error:
-                    logger.warning(f"⚠️ Could not verify current status: {status_check_error}")
-                    # Continue with transition attempt anyway
+                    except Exception as status_check_error:
+                        logger.warning("⚠️ Could not verify current status: %s", status_check_error)
+                        # Continue with transition attempt anyway
 
                 # Perform the status update
                 updated_page = self.notion_client.update_page_status(page_id, to_status)
@@ -146,16 +251,16 @@ class StatusTransitionManager:
                 updated_status = self._extract_current_status(updated_page)
                 if updated_status == to_status:
                     transition.result = TransitionResult.SUCCESS
-                    logger.info(f"✅ Status transition successful: {transition.from_status} → {to_status} for page {page_id[:8]}...")
+                    logger.info("✅ Status transition successful: %s → %s for page %s...", transition.from_status, to_status, page_id[:8])
                 else:
                     transition.result = TransitionResult.FAILED
                     transition.error = f"Status update failed: expected '{to_status}', got '{updated_status}'"
-                    logger.error(f"❌ Status transition failed: {transition.error}")
+                    logger.error("❌ Status transition failed: %s", transition.error)
 
             except Exception as e:
                 transition.result = TransitionResult.FAILED
                 transition.error = str(e)
-                logger.error(f"❌ Status transition failed with exception: {e}")
+                logger.error("❌ Status transition failed with exception: %s", e)
 
             # Add to history for tracking
             self._add_to_history(transition)
@@ -172,81 +277,175 @@ class StatusTransitionManager:
             Updated StatusTransition object with rollback results
         """
         if transition.rollback_attempted:
-            logger.warning(f"⚠️ Rollback already attempted for transition {transition.page_id[:8]}...")
+            logger.warning("⚠️ Rollback already attempted for transition %s...", transition.page_id[:8])
             return transition
 
-        with self._transition_lock:
+        with self._page_lock(transition.page_id):
             try:
-                logger.info(f"🔄 Attempting rollback: {transition.to_status} → {transition.from_status} for page {transition.page_id[:8]}...")
+                logger.info("🔄 Attempting rollback: %s → %s for page %s...", transition.to_status, transition.from_status, transition.page_id[:8])
 
                 transition.rollback_attempted = True
 
-                # Perform rollback status update
-                self.notion_client.update_page_status(transition.page_id, transition.from_status)
-
-                # Verify rollback was successful
-                current_page = self.notion_client.get_page(transition.page_id)
-                current_status = self._extract_current_status(current_page)
+                # Perform rollback status update and verify it from the returned page
+                updated_page = self.notion_client.update_page_status(transition.page_id, transition.from_status)
+                current_status = self._extract_current_status(updated_page)
 
                 if current_status == transition.from_status:
                     transition.rollback_result = TransitionResult.ROLLBACK_SUCCESS
-                    logger.info(f"✅ Rollback successful: {transition.to_status} → {transition.from_status} for page {transition.page_id[:8]}...")
+                    logger.info("✅ Rollback successful: %s → %s for page %s...", transition.to_status, transition.from_status, transition.page_id[:8])
                 else:
                     transition.rollback_result = TransitionResult.ROLLBACK_FAILED
-                    logger.error(f"❌ Rollback failed: expected '{transition.from_status}', got '{current_status}'")
+                    logger.error("❌ Rollback failed: expected '%s', got '%s'", transition.from_status, current_status)
 
             except Exception as e:
                 transition.rollback_result = TransitionResult.ROLLBACK_FAILED
-                logger.error(f"❌ Rollback failed with exception: {e}")
+                logger.error("❌ Rollback failed with exception: %s", e)
 
+            self._count_rollbacks((transition,))
             return transition
 
+    def rollback_transitions(self, transitions: List[StatusTransition]) -> List[StatusTransition]:
+        """
+        Roll back several recorded transitions concurrently.
+
+        Transitions whose rollback was already attempted are left unchanged.
+
+        Args:
+            transitions: The transitions to roll back
+
+        Returns:
+            The same StatusTransition objects, updated with rollback results
+        """
+        pending = [transition for transition in transitions if not transition.rollback_attempted]
+        if not pending:
+            return transitions
+
+        with self._page_locks_held([transition.page_id for transition in pending]):
+            rollback_pages = self.notion_client.batch_update_page_statuses([(transition.page_id, transition.from_status) for transition in pending])
+            for transition, rollback_page in zip(pending, rollback_pages):
+                transition.rollback_attempted = True
+                if rollback_page is not None and self._extract_current_status(rollback_page) == transition.from_status:
+                    transition.rollback_result = TransitionResult.ROLLBACK_SUCCESS
+                else:
+                    transition.rollback_result = TransitionResult.ROLLBACK_FAILED
+                logger.info("🔄 Rollback result for %s...: %s", transition.page_id[:8], transition.rollback_result)
+
+            self._count_rollbacks(pending)
+
+        return transitions
+
     def batch_transition_status(self, transitions: List[Tuple[str, str, str]]) -> List[StatusTransition]:
         """
         Perform multiple status transitions with automatic rollback on any failure.
 
+        Every page is checked before any is updated, then all updates are sent
+        together. If any update fails, the successful ones are reverted together.
+
         Args:
             transitions: List of (page_id, from_status, to_status) tuples
 
         Returns:
-            List of StatusTransition objects
+            List of StatusTransition objects, one per requested transition
         """
-        results = []
-        successful_transitions = []
-
-        with self._transition_lock:
-            logger.info(f"🔄 Starting batch status transition for {len(transitions)} tickets...")
-
-            # Attempt all transitions
-            for page_id, from_status, to_status in transitions:
-                result = self.transition_status(page_id, from_status, to_status)
-                results.append(result)
+        timestamp = datetime.now()
+        results = [
+            StatusTransition(page_id=page_id, from_status=from_status, to_status=to_status, timestamp=timestamp)
+            for page_id, from_status, to_status in transitions
+        ]
+
+        with self._page_locks_held([transition.page_id for transition in results]):
+            logger.info("🔄 Starting batch status transition for %s tickets...", len(transitions))
+
+            # Step 1: Fetch all pages in one round and validate every transition before updating any
+            current_pages = self.notion_client.batch_get_pages([transition.page_id for transition in results], max_age=0)
+            for transition, current_page in zip(results, current_pages):
+                if current_page is not None:
+                    current_status = self._extract_current_status(current_page)
+                    if current_status != transition.from_status:
+                        logger.warning(
+                            "⚠️ Status mismatch for page %s...: expected '%s', found '%s'", transition.page_id[:8], transition.from_status, current_status
+                        )
+                        transition.from_status = current_status
+                else:
+                    logger.warning("⚠️ Could not verify current status for page %s...", transition.page_id[:8])
 
-                if result.result == TransitionResult.SUCCESS:
-                    successful_transitions.append(result)
+                if not self.is_valid_transition(transition.from_status, transition.to_status):
+                    transition.result = TransitionResult.FAILED
+                    transition.error = f"Invalid transition: {transition.from_status} → {transition.to_status}"
+
+            invalid_count = sum(1 for transition in results if transition.result == TransitionResult.FAILED)
+            if invalid_count:
+                logger.error("❌ Batch transition aborted: %s invalid transitions, no pages were updated", invalid_count)
+                for transition in results:
+                    if transition.result is None:
+                        transition.result = TransitionResult.FAILED
+                        transition.error = "Batch aborted before update"
+                self._add_many_to_history(results)
+                return results
+
+            # Step 2: Send all updates together and verify each from its response
+            updated_pages = self.notion_client.batch_update_page_statuses([(transition.page_id, transition.to_status) for transition in results])
+            successful_transitions = []
+            for transition, updated_page in zip(results, updated_pages):
+                updated_status = self._extract_current_status(updated_page) if updated_page is not None else None
+                if updated_status == transition.to_status:
+                    transition.result = TransitionResult.SUCCESS
+                    successful_transitions.append(transition)
                 else:
-                    # Failure detected - rollback all successful transitions
-                    logger.error(f"❌ Batch transition failed at page {page_id[:8]}..., initiating rollback...")
+                    transition.result = TransitionResult.FAILED
+                    transition.error = f"Status update failed: expected '{transition.to_status}', got '{updated_status}'"
+                    logger.error("❌ Batch transition failed at page %s...: %s", transition.page_id[:8], transition.error)
 
-                    for successful_transition in successful_transitions:
-                        rollback_result = self.rollback_transition(successful_transition)
-                        logger.info(f"🔄 Rollback result for {successful_transition.page_id[:8]}...: {rollback_result.rollback_result}")
+            self._add_many_to_history(results)
 
-                    break
+            # Step 3: Roll back all successful transitions together if any failed
+            if len(successful_transitions) < len(results) and successful_transitions:
+                logger.error("❌ Batch transition failed, rolling back %s successful transitions...", len(successful_transitions))
+                self.rollback_transitions(successful_transitions)
 
             successful_count = len(successful_transitions)
             total_count = len(transitions)
 
-            logger.info(f"📊 Batch transition results: {successful_count}/{total_count} successful")
+            logger.info("📊 Batch transition results: %s/%s successful", successful_count, total_count)
 
             if successful_count == total_count:
                 logger.info("✅ All batch transitions completed successfully")
             else:
-                logger.warning(f"⚠️ Batch transition partially failed, {len(successful_transitions)} rollbacks attempted")
+                logger.warning("⚠️ Batch transition partially failed, %s rollbacks attempted", successful_count)
 
         return results
 
-    def _extract_current_status(self, page: Dict[str, Any]) -> str:
+    def transition_batch(self, updates: List[Tuple[str, str, str]], max_workers: int = BATCH_TRANSITION_CONCURRENCY) -> List[StatusTransition]:
+        """
+        Perform multiple independent status transitions concurrently.
+
+        Unlike batch_transition_status, a failure does not roll back the other
+        transitions; each result reports its own outcome.
+
+        Args:
+            updates: List of (page_id, from_status, to_status) tuples
+            max_workers: Maximum number of transitions in flight at once; ignored (one at a time)
+                when the manager is not thread-safe
+
+        Returns:
+            List of StatusTransition objects in the same order as updates
+        """
+        if not updates:
+            return []
+
+        workers = max(1, min(max_workers, len(updates))) if self._thread_safe else 1
+        logger.info("🔄 Starting concurrent status transition for %d tickets (%d workers)...", len(updates), workers)
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="status-transition") as executor:
+            results = list(executor.map(lambda update: self.transition_status(*update), updates))
+
+        successful_count = sum(1 for result in results if result.result == TransitionResult.SUCCESS)
+        logger.info("📊 Concurrent transition results: %d/%d successful", successful_count, len(updates))
+
+        return results
+
+    @staticmethod
+    def _extract_current_status(page: Dict[str, Any]) -> str:
         """
         Extract current status from a Notion page object.
 
@@ -257,29 +456,78 @@ class StatusTransitionManager:
             Current status string
         """
         try:
-            properties = page.get("properties", {})
-            status_prop = properties.get("Status", {})
-
-            # Handle different status property types
-            if "status" in status_prop and status_prop["status"]:
-                return status_prop["status"]["name"]
-            elif "select" in status_prop and status_prop["select"]:
-                return status_prop["select"]["name"]
-            else:
-                logger.warning("⚠️ Could not extract status from page properties")
-                return "Unknown"
-
-        except Exception as e:
-            logger.error(f"❌ Error extracting status from page: {e}")
+            # Handle both status and select property types
+            status_prop = page.get("properties", {}).get("Status") or {}
+            status = status_prop.get("status") or status_prop.get("select")
+            if status:
+                return status["name"]
+        except (AttributeError, KeyError, TypeError) as e:
+            logger.error("❌ Error extracting status from page: %s", e)
             return "Unknown"
 
+        logger.warning("⚠️ Could not extract status from page properties")
+        return "Unknown"
+
+    def _page_lock(self, page_id: str):
+        """Return the striped lock guarding Notion calls for a page."""
+        return self._page_locks[hash(page_id) % PAGE_LOCK_STRIPES]
+
+    @contextmanager
+    def _page_locks_held(self, page_ids: List[str]):
+        """Hold the locks for several pages, acquired in a fixed order to avoid deadlocks."""
+        stripes = sorted({hash(page_id) % PAGE_LOCK_STRIPES for page_id in page_ids})
+        with ExitStack() as stack:
+            for stripe in stripes:
+                stack.enter_context(self._page_locks[stripe])
+            yield
+
     def _add_to_history(self, transition: StatusTransition):
-        """Add transition to history with size management."""
-        self._transition_history.append(transition)
+        """Add transition to history; the bounded deque drops the oldest entry once full."""
+        self._add_many_to_history((transition,))
 
-        # Keep history size manageable
-        if len(self._transition_history) > self._max_history:
-            self._transition_history = self._transition_history[-self._max_history :]
+    def _add_many_to_history(self, transitions: Iterable[StatusTransition]):
+        """Add several transitions to history under a single write-lock acquisition."""
+        with self._transition_lock.write():
+            history = self._transition_history
+            history_by_page = self._history_by_page
+            for transition in transitions:
+                if len(history) == history.maxlen:
+                    evicted = history[0]
+                    self._count_transition(evicted, -1)
+
+                    # The evicted entry is also the oldest one recorded for its page
+                    page_history = history_by_page[evicted.page_id]
+                    page_history.popleft()
+                    if not page_history:
+                        del history_by_page[evicted.page_id]
+
+                history.append(transition)
+                history_by_page.setdefault(transition.page_id, deque()).append(transition)
+                self._count_transition(transition, 1)
+
+    def _count_rollbacks(self, transitions: Iterable[StatusTransition]):
+        """Add rollback outcomes to the running statistics for transitions still held in history."""
+        with self._transition_lock.write():
+            for transition in transitions:
+                # Evicted or never recorded transitions are not part of the statistics, so they must not move the counters
+                page_history = self._history_by_page.get(transition.page_id, ())
+                if not any(entry is transition for entry in page_history):
+                    continue
+
+                self._count_rollback_attempted += 1
+                if transition.rollback_result == TransitionResult.ROLLBACK_SUCCESS:
+                    self._count_rollback_success += 1
+
+    def _count_transition(self, transition: StatusTransition, delta: int):
+        """Add delta to the running statistics counters matching a transition's outcome."""
+        if transition.result == TransitionResult.SUCCESS:
+            self._count_success += delta
+        elif transition.result == TransitionResult.FAILED:
+            self._count_failed += delta
+        if transition.rollback_attempted:
+            self._count_rollback_attempted += delta
+        if transition.rollback_result == TransitionResult.ROLLBACK_SUCCESS:
+            self._count_rollback_success += delta
 
     def get_transition_history(self, page_id: Optional[str] = None, limit: int = 100) -> List[StatusTransition]:
         """
@@ -292,13 +540,19 @@ class StatusTransitionManager:
         Returns:
             List of StatusTransition objects
         """
-        with self._transition_lock:
+        with self._transition_lock.read():
             history = self._transition_history
 
             if page_id:
-                history = [t for t in history if t.page_id == page_id]
+                history = self._history_by_page.get(page_id, ())
+
+            if not limit:
+                return list(history)
 
-            return history[-limit:] if limit else history
+            # Walk back from the newest entry so only `limit` items are copied
+            recent = list(islice(reversed(history), limit))
+            recent.reverse()
+            return recent
 
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -307,12 +561,12 @@ class StatusTransitionManager:
         Returns:
             Dictionary with transition statistics
         """
-        with self._transition_lock:
+        with self._transition_lock.read():
             total_transitions = len(self._transition_history)
-            successful = len([t for t in self._transition_history if t.result == TransitionResult.SUCCESS])
-            failed = len([t for t in self._transition_history if t.result == TransitionResult.FAILED])
-            rollbacks_attempted = len([t for t in self._transition_history if t.rollback_attempted])
-            rollbacks_successful = len([t for t in self._transition_history if t.rollback_result == TransitionResult.ROLLBACK_SUCCESS])
+            successful = self._count_success
+            failed = self._count_failed
+            rollbacks_attempted = self._count_rollback_attempted
+            rollbacks_successful = self._count_rollback_success
 
             stats = {
                 "total_transitions": total_transitions,
@@ -324,5 +578,5 @@ class StatusTransitionManager:
                 "rollback_success_rate": ((rollbacks_successful / rollbacks_attempted * 100) if rollbacks_attempted > 0 else 0),
             }
 
-            logger.info(f"📊 Transition Statistics: {stats}")
+            logger.info("📊 Transition Statistics: %s", stats)
             return stats
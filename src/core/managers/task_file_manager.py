@@ -1,5 +1,6 @@
 import hashlib
 import json
+import mmap
 import os
 import shutil
 import tempfile
@@ -12,8 +13,24 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from src.utils.logging_config import get_logger
 
+# BLAKE3 is used for file checksums when installed, falling back to stdlib BLAKE2b
+# with the same 256-bit digest so checksums have one length either way
+try:
+    from blake3 import blake3 as _checksum_hasher
+except ImportError:
+
+    def _checksum_hasher():
+        return hashlib.blake2b(digest_size=32)
+
+
 logger = get_logger(__name__)
 
+# Read size used when streaming a file through the checksum hasher
+CHECKSUM_CHUNK_SIZE = 1 << 20
+
+# Files at least this large are hashed straight from a memory map instead of read in chunks
+CHECKSUM_MMAP_THRESHOLD = 64 * 1024
+
 
 class CopyResult(str, Enum):
     SUCCESS = "success"
@@ -345,12 +362,16 @@ class TaskFileManager:
         logger.info(f"🔄 Backup restored from: {operation.backup_path}")
 
     def _calculate_checksum(self, file_path: str) -> str:
-        """Calculate MD5 checksum of a file."""
-        hash_md5 = hashlib.md5()
+        """Calculate BLAKE3 (or BLAKE2b when blake3 is not installed) checksum of a file."""
+        hasher = _checksum_hasher()
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+            if os.fstat(f.fileno()).st_size >= CHECKSUM_MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    hasher.update(mapped)
+            else:
+                for chunk in iter(lambda: f.read(CHECKSUM_CHUNK_SIZE), b""):
+                    hasher.update(chunk)
+        return hasher.hexdigest()
 
     def _finalize_operation(self, operation: CopyOperation) -> CopyOperation:
         """Finalize the copy operation and add to history."""
@@ -1,6 +1,6 @@
 import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from src.clients.notion_wrapper import NotionClientWrapper
 from src.utils.logging_config import get_logger, log_key_value
@@ -325,6 +325,37 @@ class DatabaseOperations:
 
         return len(expired_keys)
 
+    def count_by_status(self, status: TaskStatus, page_size: int = 1) -> int:
+        """
+        Count tasks with the given status using a single bounded query.
+
+        Only the first page is fetched, so the result is capped at ``page_size``.
+        With the default of 1 this is a cheap existence check.
+
+        Args:
+            status: Task status to filter by
+            page_size: Maximum number of rows to request (max 100)
+
+        Returns:
+            Number of matching tasks on the first page
+        """
+        with self._measure_query_performance(f"count_by_status_{status.value}"):
+            try:
+                filter_dict = self.notion_client.create_status_filter(status.value)
+                response = self.notion_client.query_database(filter_dict=filter_dict, page_size=min(page_size, 100))
+
+                if not isinstance(response, dict):
+                    logger.warning("⚠️ Unexpected response format from database query")
+                    return 0
+
+                count = len(response.get("results", []))
+                logger.debug(f"📊 Count for status '{status.value}': {count} (has_more: {response.get('has_more', False)})")
+                return count
+
+            except Exception as e:
+                logger.error(f"❌ Failed to count tasks with status '{status.value}': {e}")
+                raise
+
     def get_queue_depth(self, use_cache: bool = True) -> int:
         """
         Get the current queue depth (number of tasks with QUEUED_TO_RUN status).
@@ -433,18 +464,46 @@ class DatabaseOperations:
             logger.error(f"❌ Failed to detect queued tasks: {e}")
             raise
 
+    def iter_queued_tasks(self, page_size: int = 25) -> Iterator[Dict[str, Any]]:
+        """
+        Stream tickets with 'Queued to run' status one page at a time.
+
+        Pages are fetched lazily, so only ``page_size`` tasks are held at once and
+        tasks near the end of a long queue are read when they are reached.
+
+        Args:
+            page_size: Number of tasks to request per page (max 100)
+
+        Yields:
+            Processed task dictionaries, as returned by get_queued_tasks
+        """
+        next_cursor = None
+        page_count = 0
+
+        while True:
+            page_count += 1
+            tasks_batch, next_cursor = self.get_tasks_by_status_batch(TaskStatus.QUEUED_TO_RUN, page_size=page_size, start_cursor=next_cursor, use_cache=False)
+            yield from tasks_batch
+
+            if not next_cursor:
+                break
+
+            # Safety limit to prevent infinite loops
+            if page_count > 100:
+                logger.warning("⚠️ Hit page limit (100) while streaming queued tasks, stopping pagination")
+                break
+
     def has_queued_tasks(self) -> bool:
         """
         Check if there are any tickets with 'Queued to run' status.
-        Uses optimized queue depth method for better performance.
+        Requests a single row instead of fetching the whole queue.
 
         Returns:
             True if there are queued tasks, False otherwise
         """
         try:
-            queue_depth = self.get_queue_depth(use_cache=True)
-            has_tasks = queue_depth > 0
-            logger.info(f"🔍 Queued task check result: {'Tasks found' if has_tasks else 'No tasks found'} (depth: {queue_depth})")
+            has_tasks = self.count_by_status(TaskStatus.QUEUED_TO_RUN, page_size=1) > 0
+            logger.info(f"🔍 Queued task check result: {'Tasks found' if has_tasks else 'No tasks found'}")
             return has_tasks
         except Exception as e:
             logger.error(f"❌ Failed to check for queued tasks: {e}")
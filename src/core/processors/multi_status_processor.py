@@ -102,7 +102,7 @@ class MultiStatusProcessor:
             logger.info(f"🔍 Checking current status for{desc} task: {task_id}")
 
             # Get the current actual status from Notion to handle race conditions
-            current_page = self.notion_client.get_page(task_id)
+            current_page = self.notion_client.get_page(task_id, max_age=0)
             current_status = self.notion_client._extract_status_from_page(current_page)
 
             logger.info(f"📋 Task {task_id} current status: '{current_status}', expected: '{expected_from_status}'")
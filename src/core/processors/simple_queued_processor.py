@@ -10,16 +10,19 @@ Simple queued task processor that implements the new logic:
 7. Update status to 'Done' or 'Failed' based on results
 """
 
-import hashlib
+import concurrent.futures
 import json
+import logging
 import os
 import shutil
+import stat
 import subprocess
 import sys
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.clients.notion_wrapper import NotionClientWrapper
 from src.core.managers.feedback_manager import FeedbackManager, ProcessingStage
@@ -28,23 +31,88 @@ from src.core.operations.database_operations import DatabaseOperations
 from src.utils.logging_config import get_logger
 from src.utils.task_status import TaskStatus
 
+try:
+    # orjson parses task files several times faster when it is installed
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    # pathspec enables gitignore-style .nomadignore patterns for source snapshots
+    import pathspec
+except ImportError:
+    pathspec = None
+
 logger = get_logger(__name__)
 
+# Number of tasks.json backups kept next to the TaskMaster file
+MAX_TASK_BACKUPS = 10
+
+# Directories never descended into when snapshotting source files (dot-directories are skipped too)
+SKIPPED_SCAN_DIRS = frozenset({"__pycache__", "venv", "node_modules", "build", "dist"})
+
+# Optional gitignore-style file in the project root listing paths to leave out of source snapshots
+SCAN_IGNORE_FILE = ".nomadignore"
+
+# Seconds a Notion 'In progress' count is trusted before querying again
+IN_PROGRESS_CACHE_TTL = 5.0
+
+# Maximum wall time for a single Claude Code run
+CLAUDE_TIMEOUT_SECONDS = 3600
+
+# Permission flags passed to Claude Code when the installed CLI supports them
+CLAUDE_PERMISSION_FLAGS = ("--dangerously-skip-permissions", "--auto-approve")
+
+# Worker threads used to stat files during a source snapshot
+CHECKSUM_SCAN_WORKERS = 8
+
+# (mtime_ns, size) of a file, used to detect changes without reading it
+FileSignature = Tuple[int, int]
+
 
 class SimpleQueuedProcessor:
     """Simple processor for handling queued tasks with the new logic."""
 
-    def __init__(self, project_root: str):
+    # Generic Claude Code prompt that works for any task type
+    _CLAUDE_PROMPT = """You are working on a software project that uses Task Master AI for task management.
+
+CRITICAL INSTRUCTIONS - FOLLOW EXACTLY:
+1. Use mcp__task_master_ai__get_tasks to see all current tasks
+2. Find any tasks with status "pending" or "in-progress"
+3. For EACH such task:
+   a) Read the task details and requirements carefully
+   b) Implement the required functionality by creating/modifying source files
+   c) Use Edit, Write, or MultiEdit tools to make actual code changes
+   d) Write real, working code - don't just plan or comment
+   e) Save all changes to disk
+   f) Only after implementing, use mcp__task_master_ai__set_task_status to mark as done
+4. Continue until all tasks are completed
+5. Exit when all tasks are done
+
+IMPORTANT: You have full permissions to modify any file. Implement actual working code for each task."""
+
+    def __init__(self, project_root: str, audit_changes: Optional[bool] = None):
         """
         Initialize the simple queued processor.
 
         Args:
             project_root: Root directory of the project
+            audit_changes: Snapshot src/ before and after Claude runs to report changed files.
+                Defaults to the NOMAD_AUDIT_CHANGES environment variable (off when unset).
         """
         self.project_root = Path(project_root)
         self.task_dir = self.project_root / "tasks" / "tasks"
         self.taskmaster_tasks_file = self.project_root / ".taskmaster" / "tasks" / "tasks.json"
 
+        # Plain string forms reused for subprocess and filesystem calls on every task
+        self._project_root_str = os.fspath(self.project_root)
+        self._task_dir_str = os.fspath(self.task_dir)
+        self._taskmaster_str = os.fspath(self.taskmaster_tasks_file)
+
+        if audit_changes is None:
+            audit_changes = os.getenv("NOMAD_AUDIT_CHANGES", "false").lower() in ("true", "1", "yes", "on")
+        self.audit_changes = audit_changes
+
         # Configure summary directory using TASKS_DIR env var or default to ./tasks
         tasks_dir = os.getenv("TASKS_DIR", "tasks")
         if os.path.isabs(tasks_dir):
@@ -58,14 +126,74 @@ class SimpleQueuedProcessor:
         self.status_manager = StatusTransitionManager(self.notion_client)
         self.feedback_manager = FeedbackManager(self.notion_client)
 
-        # Ensure critical directories exist
-        self.taskmaster_tasks_file.parent.mkdir(parents=True, exist_ok=True)
-        self.summary_dir.mkdir(parents=True, exist_ok=True)
+        # Feedback entries are written to Notion in the background, one at a time and in order
+        self._feedback_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="nomad-feedback")
+        self._pending_feedback: List[concurrent.futures.Future] = []
+
+        # Claude Code environment and settings are the same for every task
+        self._claude_env = self._build_claude_env()
+        self._write_claude_settings()
+        self._claude_capabilities_file = self.project_root / ".claude" / ".capabilities.json"
+        self._claude_capabilities: Optional[Dict[str, Any]] = None
+
+        # Task file stem -> path, refreshed once per processing batch
+        self._task_file_index: Optional[Dict[str, Path]] = None
 
-        logger.info(f"🎯 SimpleQueuedProcessor initialized")
-        logger.info(f"   📁 Task directory: {self.task_dir}")
-        logger.info(f"   📋 TaskMaster file: {self.taskmaster_tasks_file}")
-        logger.info(f"   📄 Summary directory: {self.summary_dir}")
+        # (monotonic timestamp, count) of the last known 'In progress' count
+        self._in_progress_cache: Optional[Tuple[float, int]] = None
+
+        # Ensure critical directories exist
+        for directory in (self.taskmaster_tasks_file.parent, self.summary_dir):
+            if not directory.is_dir():
+                directory.mkdir(parents=True, exist_ok=True)
+
+        logger.info("🎯 SimpleQueuedProcessor initialized")
+        logger.info("   📁 Task directory: %s", self.task_dir)
+        logger.info("   📋 TaskMaster file: %s", self.taskmaster_tasks_file)
+        logger.info("   📄 Summary directory: %s", self.summary_dir)
+
+    def _build_claude_env(self) -> Dict[str, str]:
+        """Build the environment used for Claude Code runs, with maximum permissions and auto-approval."""
+        env = os.environ.copy()
+        env.update(
+            {
+                "CLAUDE_AUTO_APPROVE": "true",
+                "CLAUDE_SKIP_PERMISSIONS": "true",
+                "CLAUDE_DANGEROUSLY_SKIP_PERMISSIONS": "true",
+                "CLAUDE_PROJECT_ROOT": self._project_root_str,
+                "PYTHONPATH": os.path.join(self._project_root_str, "src"),
+                "CLAUDE_WORKING_DIR": self._project_root_str,
+                "CLAUDE_ALLOW_ALL_TOOLS": "true",
+                "CLAUDE_NO_CONFIRM": "true",
+            }
+        )
+        return env
+
+    def _write_claude_settings(self):
+        """Write the project's .claude/settings.json with maximum permissions (always overwrite)."""
+        try:
+            claude_dir = self.project_root / ".claude"
+            claude_dir.mkdir(exist_ok=True)
+
+            settings_file = claude_dir / "settings.json"
+            settings_content = {
+                "allowedTools": ["*"],  # Allow ALL tools
+                "autoApprove": True,
+                "dangerouslySkipPermissions": True,
+                "skipPermissions": True,
+                "headless": False,  # Keep interactive for debugging
+                "maxTokens": 200000,
+                "workingDirectory": self._project_root_str,
+                "allowFileModification": True,
+                "allowCodeExecution": True,
+                "allowNetworkAccess": True,
+                "trustAllTools": True,
+            }
+            with open(settings_file, "w") as f:
+                json.dump(settings_content, f, indent=2)
+            logger.info("📋 Created unrestricted Claude settings at %s", settings_file)
+        except OSError as e:
+            logger.warning("⚠️ Could not write Claude settings: %s", e)
 
     def process_queued_tasks(self) -> bool:
         """
@@ -77,45 +205,87 @@ class SimpleQueuedProcessor:
         logger.info("🚀 Starting simple queued task processing...")
 
         try:
-            # Step 1: Check for queued tasks
-            queued_tasks = self._get_queued_tasks()
-            if not queued_tasks:
+            # Step 1: Check for queued tasks, skipping the full fetch on an idle queue
+            if not self.db_ops.has_queued_tasks():
                 logger.info("ℹ️  No tasks with 'Queued to run' status found")
                 return True
 
-            # Step 2: Process tasks one by one (ensuring max 1 in progress)
+            self._task_file_index = self._build_task_file_index()
+
+            # Step 2: Stream tasks page by page and process them one by one (ensuring max 1 in progress)
             success_count = 0
-            total_tasks = len(queued_tasks)
+            total_tasks = 0
+
+            for task in self.db_ops.iter_queued_tasks():
+                if not self._is_still_queued(task):
+                    continue
 
-            for i, task in enumerate(queued_tasks, 1):
-                logger.info(f"📋 Processing task {i}/{total_tasks}: {task.get('title', 'Unknown')}")
+                total_tasks += 1
+                logger.info("📋 Processing task %s: %s", total_tasks, task.get("title", "Unknown"))
 
                 if self._process_single_task(task):
                     success_count += 1
-                    logger.info(f"✅ Task {i}/{total_tasks} completed successfully")
+                    logger.info("✅ Task %s completed successfully", total_tasks)
                 else:
-                    logger.error(f"❌ Task {i}/{total_tasks} failed")
+                    logger.error("❌ Task %s failed", total_tasks)
 
-                # Add small delay between tasks to prevent overwhelming the system
-                if i < total_tasks:
-                    time.sleep(2)
-
-            logger.info(f"🏁 Queued task processing completed: {success_count}/{total_tasks} successful")
+            logger.info("🏁 Queued task processing completed: %s/%s successful", success_count, total_tasks)
             return success_count == total_tasks
 
         except Exception as e:
-            logger.error(f"❌ Queued task processing failed: {e}")
+            logger.error("❌ Queued task processing failed: %s", e)
             return False
 
-    def _get_queued_tasks(self) -> List[Dict[str, Any]]:
-        """Get all tasks with 'Queued to run' status."""
+        finally:
+            self._flush_feedback()
+
+    def _post_feedback(self, add_method, *args, **kwargs):
+        """
+        Queue a FeedbackManager call so its Notion round-trips overlap with task processing.
+
+        Args:
+            add_method: Bound FeedbackManager method to call
+            *args: Positional arguments for add_method
+            **kwargs: Keyword arguments for add_method
+        """
+        self._pending_feedback = [future for future in self._pending_feedback if not future.done()]
+        self._pending_feedback.append(self._feedback_executor.submit(add_method, *args, **kwargs))
+
+    def _flush_feedback(self):
+        """Wait for all queued feedback writes to reach Notion."""
+        pending, self._pending_feedback = self._pending_feedback, []
+        for future in pending:
+            try:
+                future.result()
+            except Exception as e:
+                logger.error("❌ Failed to add feedback: %s", e)
+
+    def _is_still_queued(self, task: Dict[str, Any]) -> bool:
+        """
+        Re-check a streamed task's status right before it is processed.
+
+        Earlier tasks in the batch can run for a long time, so a row may have been
+        cancelled or picked up elsewhere since its page was fetched.
+
+        Args:
+            task: Task dictionary from Notion
+
+        Returns:
+            True if the task is still 'Queued to run' (or could not be checked), False otherwise
+        """
         try:
-            queued_tasks = self.db_ops.get_queued_tasks()
-            logger.info(f"🔍 Found {len(queued_tasks)} queued tasks")
-            return queued_tasks
+            # Bypass the page cache: another runner may have claimed the task moments ago
+            current_page = self.notion_client.get_page(task["id"], max_age=0)
         except Exception as e:
-            logger.error(f"❌ Failed to get queued tasks: {e}")
-            return []
+            logger.warning("⚠️ Could not re-check status of task %s: %s", task.get("ticket_id"), e)
+            return True
+
+        current_status = self.notion_client._extract_status_from_page(current_page)
+        if current_status != TaskStatus.QUEUED_TO_RUN.value:
+            logger.info("⏭️ Skipping task %s - status changed to '%s' since it was queued", task.get("ticket_id"), current_status)
+            return False
+
+        return True
 
     def _validate_task(self, task: Dict[str, Any]) -> bool:
         """
@@ -134,7 +304,7 @@ class SimpleQueuedProcessor:
         required_fields = ["id", "ticket_id", "title"]
         for field in required_fields:
             if not task.get(field):
-                logger.error(f"❌ Task missing required field: {field}")
+                logger.error("❌ Task missing required field: %s", field)
                 return False
 
         return True
@@ -147,16 +317,21 @@ class SimpleQueuedProcessor:
             True if safe to proceed, False if another task is in progress
         """
         try:
-            in_progress_tasks = self.db_ops.get_task_by_status(TaskStatus.IN_PROGRESS)
+            now = time.monotonic()
+            if self._in_progress_cache is not None and now - self._in_progress_cache[0] < IN_PROGRESS_CACHE_TTL:
+                in_progress_count = self._in_progress_cache[1]
+            else:
+                in_progress_count = self.db_ops.count_by_status(TaskStatus.IN_PROGRESS, page_size=1)
+                self._in_progress_cache = (now, in_progress_count)
 
-            if len(in_progress_tasks) > 0:
-                logger.warning(f"⚠️ Found {len(in_progress_tasks)} tasks already in progress")
+            if in_progress_count > 0:
+                logger.warning("⚠️ Found tasks already in progress")
                 logger.info("⏳ Waiting for current tasks to complete before processing new ones")
                 return False
 
             return True
         except Exception as e:
-            logger.error(f"❌ Failed to check in-progress tasks: {e}")
+            logger.error("❌ Failed to check in-progress tasks: %s", e)
             return False
 
     def _process_single_task(self, task: Dict[str, Any]) -> bool:
@@ -182,11 +357,12 @@ class SimpleQueuedProcessor:
         ticket_id = task.get("ticket_id")
         title = task.get("title", "Unknown")
 
-        logger.info(f"🎯 Processing task: {title} (Ticket: {ticket_id})")
+        logger.info("🎯 Processing task: %s (Ticket: %s)", title, ticket_id)
 
         try:
             # Step 1: Update status to 'In progress'
-            self.feedback_manager.add_feedback(
+            self._post_feedback(
+                self.feedback_manager.add_feedback,
                 page_id,
                 ProcessingStage.PROCESSING,
                 f"Starting task processing for {ticket_id}",
@@ -197,12 +373,14 @@ class SimpleQueuedProcessor:
                 page_id=page_id,
                 from_status=TaskStatus.QUEUED_TO_RUN.value,
                 to_status=TaskStatus.IN_PROGRESS.value,
+                trust_from_status=True,  # Re-checked by _is_still_queued just before processing
             )
 
             if transition.result.value != "success":
                 error_msg = f"Failed to update status to 'In progress': {transition.error}"
-                logger.error(f"❌ {error_msg}")
-                self.feedback_manager.add_error_feedback(
+                logger.error("❌ %s", error_msg)
+                self._post_feedback(
+                    self.feedback_manager.add_error_feedback,
                     page_id,
                     ProcessingStage.STATUS_TRANSITION,
                     error_msg,
@@ -210,8 +388,10 @@ class SimpleQueuedProcessor:
                 )
                 return False
 
-            logger.info(f"✅ Status updated to 'In progress' for task {ticket_id}")
-            self.feedback_manager.add_feedback(
+            self._in_progress_cache = None
+            logger.info("✅ Status updated to 'In progress' for task %s", ticket_id)
+            self._post_feedback(
+                self.feedback_manager.add_feedback,
                 page_id,
                 ProcessingStage.STATUS_TRANSITION,
                 f"Status transition: {TaskStatus.QUEUED_TO_RUN.value} → {TaskStatus.IN_PROGRESS.value}",
@@ -219,7 +399,8 @@ class SimpleQueuedProcessor:
             )
 
             # Step 2: Look for task file
-            self.feedback_manager.add_feedback(
+            self._post_feedback(
+                self.feedback_manager.add_feedback,
                 page_id,
                 ProcessingStage.PREPARING,
                 f"Searching for task file: {ticket_id}",
@@ -231,7 +412,8 @@ class SimpleQueuedProcessor:
                 self._update_status_to_failed(page_id, f"Task file not found for {ticket_id}")
                 return False
 
-            self.feedback_manager.add_feedback(
+            self._post_feedback(
+                self.feedback_manager.add_feedback,
                 page_id,
                 ProcessingStage.PREPARING,
                 f"Task file found: {task_file.name}",
@@ -239,7 +421,8 @@ class SimpleQueuedProcessor:
             )
 
             # Step 3: Copy task file to taskmaster location
-            self.feedback_manager.add_feedback(
+            self._post_feedback(
+                self.feedback_manager.add_feedback,
                 page_id,
                 ProcessingStage.COPYING,
                 "Copying task file to TaskMaster location",
@@ -251,7 +434,8 @@ class SimpleQueuedProcessor:
                 return False
 
             # Step 4: Execute Claude Code command
-            self.feedback_manager.add_feedback(
+            self._post_feedback(
+                self.feedback_manager.add_feedback,
                 page_id,
                 ProcessingStage.PROCESSING,
                 "Executing Claude Code command",
@@ -262,7 +446,8 @@ class SimpleQueuedProcessor:
 
             # Step 5: Check for commit requirement and handle git operations
             if claude_success:
-                self.feedback_manager.add_feedback(
+                self._post_feedback(
+                    self.feedback_manager.add_feedback,
                     page_id,
                     ProcessingStage.PROCESSING,
                     "Claude Code execution completed successfully",
@@ -273,8 +458,9 @@ class SimpleQueuedProcessor:
                 commit_required = self._check_commit_checkbox(page_id)
 
                 if commit_required:
-                    logger.info(f"📝 Task {ticket_id} requires commit - preparing git commit...")
-                    self.feedback_manager.add_feedback(
+                    logger.info("📝 Task %s requires commit - preparing git commit...", ticket_id)
+                    self._post_feedback(
+                        self.feedback_manager.add_feedback,
                         page_id,
                         ProcessingStage.FINALIZING,
                         "Preparing git commit",
@@ -283,15 +469,17 @@ class SimpleQueuedProcessor:
 
                     commit_success = self._handle_git_commit(task, ticket_id)
                     if not commit_success:
-                        logger.warning(f"⚠️ Git commit failed for task {ticket_id}, but proceeding with status update")
-                        self.feedback_manager.add_feedback(
+                        logger.warning("⚠️ Git commit failed for task %s, but proceeding with status update", ticket_id)
+                        self._post_feedback(
+                            self.feedback_manager.add_feedback,
                             page_id,
                             ProcessingStage.FINALIZING,
                             "Git commit failed",
                             details="Proceeding with task completion despite commit failure",
                         )
                     else:
-                        self.feedback_manager.add_feedback(
+                        self._post_feedback(
+                            self.feedback_manager.add_feedback,
                             page_id,
                             ProcessingStage.FINALIZING,
                             "Git commit completed successfully",
@@ -299,7 +487,8 @@ class SimpleQueuedProcessor:
                         )
 
                 # Update final status to Done
-                self.feedback_manager.add_feedback(
+                self._post_feedback(
+                    self.feedback_manager.add_feedback,
                     page_id,
                     ProcessingStage.FINALIZING,
                     "Updating final status to Done",
@@ -310,11 +499,15 @@ class SimpleQueuedProcessor:
                     page_id=page_id,
                     from_status=TaskStatus.IN_PROGRESS.value,
                     to_status=TaskStatus.DONE.value,
+                    trust_from_status=True,  # This processor moved the task to 'In progress'
                 )
 
                 if final_transition.result.value == "success":
-                    logger.info(f"✅ Task {ticket_id} completed successfully")
-                    self.feedback_manager.add_feedback(
+                    # The task we just finished was the only one this processor had in progress
+                    self._in_progress_cache = (time.monotonic(), 0)
+                    logger.info("✅ Task %s completed successfully", ticket_id)
+                    self._post_feedback(
+                        self.feedback_manager.add_feedback,
                         page_id,
                         ProcessingStage.STATUS_TRANSITION,
                         f"Status transition: {TaskStatus.IN_PROGRESS.value} → {TaskStatus.DONE.value}",
@@ -323,8 +516,9 @@ class SimpleQueuedProcessor:
                     return True
                 else:
                     error_msg = f"Failed to update final status to 'Done': {final_transition.error}"
-                    logger.error(f"❌ {error_msg}")
-                    self.feedback_manager.add_error_feedback(
+                    logger.error("❌ %s", error_msg)
+                    self._post_feedback(
+                        self.feedback_manager.add_error_feedback,
                         page_id,
                         ProcessingStage.STATUS_TRANSITION,
                         error_msg,
@@ -336,13 +530,33 @@ class SimpleQueuedProcessor:
                 return False
 
         except Exception as e:
-            logger.error(f"❌ Error processing task {ticket_id}: {e}")
+            logger.error("❌ Error processing task %s: %s", ticket_id, e)
             try:
                 self._update_status_to_failed(page_id, f"Processing error: {str(e)}")
             except Exception as status_error:
-                logger.error(f"❌ Failed to update status to failed: {status_error}")
+                logger.error("❌ Failed to update status to failed: %s", status_error)
             return False
 
+    def _build_task_file_index(self) -> Dict[str, Path]:
+        """
+        List task files once so lookups for a whole batch avoid rescanning the directory.
+
+        Returns:
+            Dictionary mapping file stems to task file paths
+        """
+        index = {}
+        if not os.path.isdir(self._task_dir_str):
+            logger.error("❌ Task directory does not exist: %s", self.task_dir)
+            return index
+
+        with os.scandir(self._task_dir_str) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json"):
+                    index[entry.name[:-5]] = Path(entry.path)
+
+        logger.debug("📁 Indexed %s task files in %s", len(index), self.task_dir)
+        return index
+
     def _find_task_file(self, ticket_id: str) -> Optional[Path]:
         """
         Find the task file for the given ticket ID.
@@ -353,23 +567,48 @@ class SimpleQueuedProcessor:
         Returns:
             Path to the task file if found, None otherwise
         """
+        if self._task_file_index is None:
+            self._task_file_index = self._build_task_file_index()
+
+        task_file = self._lookup_task_file(ticket_id)
+        if task_file is not None:
+            return task_file
+
+        # The file may have been written after the index was built, so rescan once before giving up
+        logger.debug("🔄 Task file for %s not indexed, rescanning %s", ticket_id, self.task_dir)
+        self._task_file_index = self._build_task_file_index()
+        task_file = self._lookup_task_file(ticket_id)
+        if task_file is not None:
+            return task_file
+
+        logger.error("❌ Task file not found for ticket ID: %s", ticket_id)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔍 Available files in %s: %s", self.task_dir, sorted(self._task_file_index))
+
+        return None
+
+    def _lookup_task_file(self, ticket_id: str) -> Optional[Path]:
+        """
+        Look up the task file for the given ticket ID in the task file index.
+
+        Args:
+            ticket_id: Ticket ID to look for
+
+        Returns:
+            Path to the task file if indexed, None otherwise
+        """
         # Try exact match first
-        exact_file = self.task_dir / f"{ticket_id}.json"
-        if exact_file.exists():
-            logger.info(f"📄 Found exact task file: {exact_file}")
+        exact_file = self._task_file_index.get(ticket_id)
+        if exact_file is not None:
+            logger.info("📄 Found exact task file: %s", exact_file)
             return exact_file
 
         # Try with different formats (NOMAD-XX, etc.)
-        for task_file in self.task_dir.glob("*.json"):
-            if ticket_id in task_file.stem:
-                logger.info(f"📄 Found matching task file: {task_file}")
+        for stem, task_file in self._task_file_index.items():
+            if ticket_id in stem:
+                logger.info("📄 Found matching task file: %s", task_file)
                 return task_file
 
-        logger.error(f"❌ Task file not found for ticket ID: {ticket_id}")
-        logger.info(f"🔍 Available files in {self.task_dir}:")
-        for task_file in self.task_dir.glob("*.json"):
-            logger.info(f"   📄 {task_file.name}")
-
         return None
 
     def _copy_task_file(self, source_file: Path) -> bool:
@@ -383,61 +622,132 @@ class SimpleQueuedProcessor:
             True if successful, False otherwise
         """
         try:
-            # Create backup if target exists
-            if self.taskmaster_tasks_file.exists():
-                backup_file = self.taskmaster_tasks_file.with_suffix(f".backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
-                shutil.copy2(self.taskmaster_tasks_file, backup_file)
-                logger.info(f"📋 Created backup: {backup_file}")
-
-            # Copy source file to target location
-            shutil.copy2(source_file, self.taskmaster_tasks_file)
-            logger.info(f"✅ Copied {source_file} to {self.taskmaster_tasks_file}")
-
-            # Verify the copy was successful
-            if not self.taskmaster_tasks_file.exists():
-                logger.error("❌ Task file copy verification failed")
-                return False
-
-            # Verify it's valid JSON
+            # Validate the source once; the same bytes are written to the target below
+            task_data = source_file.read_bytes()
             try:
-                with open(self.taskmaster_tasks_file, "r") as f:
-                    json.load(f)
-                logger.info("✅ Task file copy verified as valid JSON")
-                return True
-            except json.JSONDecodeError as e:
-                logger.error(f"❌ Copied task file is not valid JSON: {e}")
+                _json_loads(task_data)
+            except ValueError as e:
+                logger.error("❌ Task file is not valid JSON: %s", e)
                 return False
 
+            # Create backup if target exists. A hard link is enough because the
+            # target is swapped with os.replace below rather than rewritten in place.
+            if self.taskmaster_tasks_file.exists():
+                backup_file = self.taskmaster_tasks_file.with_suffix(f".backup_{time.time_ns()}.json")
+                try:
+                    os.link(self._taskmaster_str, backup_file)
+                except OSError:
+                    shutil.copy2(self._taskmaster_str, backup_file)
+                logger.info("📋 Created backup: %s", backup_file)
+                self._prune_task_backups()
+
+            # Write next to the target and rename so readers never see a partial file
+            temp_file = self._taskmaster_str + ".tmp"
+            with open(temp_file, "wb") as f:
+                f.write(task_data)
+            os.replace(temp_file, self._taskmaster_str)
+            logger.info("✅ Copied %s to %s", source_file, self.taskmaster_tasks_file)
+            return True
+
         except Exception as e:
-            logger.error(f"❌ Failed to copy task file: {e}")
+            logger.error("❌ Failed to copy task file: %s", e)
             return False
 
-    def _get_file_checksums(self, directory: Path) -> Dict[str, str]:
+    def _prune_task_backups(self, keep: int = MAX_TASK_BACKUPS):
+        """
+        Remove all but the newest task file backups.
+
+        Args:
+            keep: Number of most recent backups to retain
+        """
+        try:
+            pattern = f"{self.taskmaster_tasks_file.stem}.backup_*.json"
+            backups = sorted(
+                self.taskmaster_tasks_file.parent.glob(pattern),
+                key=lambda path: path.stat().st_mtime,
+                reverse=True,
+            )
+            for stale_backup in backups[keep:]:
+                os.unlink(stale_backup)
+                logger.debug("🧹 Removed old backup: %s", stale_backup)
+        except OSError as e:
+            logger.warning("⚠️ Could not prune task file backups: %s", e)
+
+    def _get_file_checksums(self, directory: Path) -> Dict[str, FileSignature]:
         """
-        Get checksums of all Python files in a directory for change detection.
+        Snapshot all Python files in a directory for change detection.
+
+        Files are compared by modification time and size, so nothing is read
+        from disk beyond a single stat per file. Stats are issued from a small
+        thread pool to overlap syscall latency on cold caches.
 
         Args:
             directory: Directory to scan
 
         Returns:
-            Dictionary mapping file paths to their MD5 checksums
+            Dictionary mapping file paths to their (mtime_ns, size) signature
         """
-        checksums = {}
         try:
-            for file_path in directory.rglob("*.py"):
-                if file_path.is_file():
-                    try:
-                        with open(file_path, "rb") as f:
-                            content = f.read()
-                            checksums[str(file_path.relative_to(self.project_root))] = hashlib.md5(content).hexdigest()
-                    except Exception as e:
-                        logger.warning(f"⚠️ Could not read {file_path}: {e}")
+            ignore_spec = self._load_scan_ignore_spec()
+            file_paths = []
+            relative_paths = []
+            join = os.path.join
+            for dirpath, dirnames, filenames in os.walk(directory):
+                relative_dir = os.path.relpath(dirpath, self._project_root_str)
+                dirnames[:] = [name for name in dirnames if name not in SKIPPED_SCAN_DIRS and not name.startswith(".")]
+                if ignore_spec is not None:
+                    dirnames[:] = [name for name in dirnames if not ignore_spec.match_file(join(relative_dir, name) + "/")]
+                for filename in filenames:
+                    if filename.endswith(".py"):
+                        relative_path = join(relative_dir, filename)
+                        if ignore_spec is not None and ignore_spec.match_file(relative_path):
+                            continue
+                        file_paths.append(join(dirpath, filename))
+                        relative_paths.append(relative_path)
+
+            checksums = {}
+            with concurrent.futures.ThreadPoolExecutor(max_workers=CHECKSUM_SCAN_WORKERS) as executor:
+                for relative_path, signature in zip(relative_paths, executor.map(self._stat_signature, file_paths)):
+                    if signature is not None:
+                        checksums[relative_path] = signature
             return checksums
         except Exception as e:
-            logger.error(f"❌ Error scanning directory {directory}: {e}")
+            logger.error("❌ Error scanning directory %s: %s", directory, e)
             return {}
 
-    def _detect_file_changes(self, before_checksums: Dict[str, str], after_checksums: Dict[str, str]) -> List[str]:
+    def _load_scan_ignore_spec(self):
+        """
+        Load .nomadignore patterns from the project root.
+
+        Returns:
+            A pathspec matcher, or None if there is no ignore file or pathspec is not installed
+        """
+        ignore_file = os.path.join(self._project_root_str, SCAN_IGNORE_FILE)
+        try:
+            with open(ignore_file, "r", encoding="utf-8") as f:
+                patterns = f.read().splitlines()
+        except OSError:
+            return None
+
+        if pathspec is None:
+            logger.warning("⚠️ %s found but pathspec is not installed, ignoring it", SCAN_IGNORE_FILE)
+            return None
+
+        return pathspec.GitIgnoreSpec.from_lines(patterns)
+
+    @staticmethod
+    def _stat_signature(file_path: str) -> Optional[FileSignature]:
+        """Return the (mtime_ns, size) signature of a regular file, or None if unavailable."""
+        try:
+            stat_result = os.stat(file_path)
+        except OSError as e:
+            logger.warning("⚠️ Could not stat %s: %s", file_path, e)
+            return None
+        if not stat.S_ISREG(stat_result.st_mode):
+            return None
+        return (stat_result.st_mtime_ns, stat_result.st_size)
+
+    def _detect_file_changes(self, before_checksums: Dict[str, FileSignature], after_checksums: Dict[str, FileSignature]) -> List[str]:
         """
         Detect which files were changed.
 
@@ -475,176 +785,212 @@ class SimpleQueuedProcessor:
         try:
             logger.info("🤖 Executing Claude Code command...")
 
+            claude_path = shutil.which("claude")
+            if claude_path is None:
+                logger.error("❌ Claude command not found on PATH")
+                return False
+
             # Get file checksums before execution to detect changes
-            logger.info("📊 Scanning files before Claude Code execution...")
-            before_checksums = self._get_file_checksums(self.project_root / "src")
-            logger.info(f"📁 Found {len(before_checksums)} Python files to monitor")
+            before_checksums = {}
+            if self.audit_changes:
+                logger.info("📊 Scanning files before Claude Code execution...")
+                before_checksums = self._get_file_checksums(self.project_root / "src")
+                logger.info("📁 Found %s Python files to monitor", len(before_checksums))
 
-            # Change to project root directory for Claude Code execution
-            original_cwd = os.getcwd()
-            os.chdir(self.project_root)
+            # Use the most permissive command format the installed CLI supports
+            cmd = self._resolve_claude_cmd(claude_path) + [self._CLAUDE_PROMPT]
 
-            try:
-                # Execute Claude Code with generic prompt that works for any task type
-                prompt = """You are working on a software project that uses Task Master AI for task management.
+            success = False
+            last_error = None
 
-CRITICAL INSTRUCTIONS - FOLLOW EXACTLY:
-1. Use mcp__task_master_ai__get_tasks to see all current tasks
-2. Find any tasks with status "pending" or "in-progress"
-3. For EACH such task:
-   a) Read the task details and requirements carefully
-   b) Implement the required functionality by creating/modifying source files
-   c) Use Edit, Write, or MultiEdit tools to make actual code changes
-   d) Write real, working code - don't just plan or comment
-   e) Save all changes to disk
-   f) Only after implementing, use mcp__task_master_ai__set_task_status to mark as done
-4. Continue until all tasks are completed
-5. Exit when all tasks are done
+            try:
+                logger.info("🚀 Running command: %s", " ".join(cmd))
 
-IMPORTANT: You have full permissions to modify any file. Implement actual working code for each task."""
+                # Execute with extended timeout and proper environment
+                returncode = self._run_claude_process(cmd, self._claude_env)
 
-                # Use the most permissive command format with auto-approval and skip permissions
-                cmd_variants = [
-                    ["claude", "--dangerously-skip-permissions", "--auto-approve", "-p", prompt],
-                    ["claude", "--dangerously-skip-permissions", "-p", prompt],
-                    ["claude", "--auto-approve", "-p", prompt],
-                    ["claude", "-p", prompt],
-                ]
-
-                success = False
-                last_error = None
-
-                for cmd in cmd_variants:
-                    try:
-                        logger.info(f"🚀 Trying command: {' '.join(cmd)}")
-
-                        # Set environment variables for maximum permissions and auto-approval
-                        env = os.environ.copy()
-                        env.update(
-                            {
-                                "CLAUDE_AUTO_APPROVE": "true",
-                                "CLAUDE_SKIP_PERMISSIONS": "true",
-                                "CLAUDE_DANGEROUSLY_SKIP_PERMISSIONS": "true",
-                                "CLAUDE_PROJECT_ROOT": str(self.project_root),
-                                "PYTHONPATH": str(self.project_root / "src"),
-                                "CLAUDE_WORKING_DIR": str(self.project_root),
-                                "CLAUDE_ALLOW_ALL_TOOLS": "true",
-                                "CLAUDE_NO_CONFIRM": "true",
-                            }
-                        )
+                logger.info("📊 Claude Code exit code: %s", returncode)
 
-                        # Ensure Claude settings directory exists with proper permissions
-                        claude_dir = self.project_root / ".claude"
-                        claude_dir.mkdir(exist_ok=True)
-
-                        # Create settings file with maximum permissions (always overwrite)
-                        settings_file = claude_dir / "settings.json"
-                        settings_content = {
-                            "allowedTools": ["*"],  # Allow ALL tools
-                            "autoApprove": True,
-                            "dangerouslySkipPermissions": True,
-                            "skipPermissions": True,
-                            "headless": False,  # Keep interactive for debugging
-                            "maxTokens": 200000,
-                            "workingDirectory": str(self.project_root),
-                            "allowFileModification": True,
-                            "allowCodeExecution": True,
-                            "allowNetworkAccess": True,
-                            "trustAllTools": True,
-                        }
-                        with open(settings_file, "w") as f:
-                            json.dump(settings_content, f, indent=2)
-                        logger.info(f"📋 Created unrestricted Claude settings at {settings_file}")
-
-                        # Execute with extended timeout and proper environment
-                        result = subprocess.run(
-                            cmd,
-                            capture_output=True,
-                            text=True,
-                            timeout=3600,  # 1 hour timeout
-                            cwd=self.project_root,
-                            env=env,
-                        )
-
-                        logger.info(f"📊 Claude Code exit code: {result.returncode}")
-
-                        # Log stdout (more lines for better debugging)
-                        if result.stdout:
-                            logger.info("📋 Claude Code stdout:")
-                            stdout_lines = result.stdout.split("\n")
-                            for i, line in enumerate(stdout_lines[:20]):  # Log first 20 lines
-                                if line.strip():
-                                    logger.info(f"   {i+1:2d}: {line}")
-                            if len(stdout_lines) > 20:
-                                logger.info(f"   ... ({len(stdout_lines) - 20} more lines)")
-
-                        # Log stderr
-                        if result.stderr:
-                            logger.warning("⚠️ Claude Code stderr:")
-                            stderr_lines = result.stderr.split("\n")
-                            for i, line in enumerate(stderr_lines[:10]):  # Log first 10 lines
-                                if line.strip():
-                                    logger.warning(f"   {i+1:2d}: {line}")
-                            if len(stderr_lines) > 10:
-                                logger.warning(f"   ... ({len(stderr_lines) - 10} more lines)")
-
-                        # Consider exit code 0 as success
-                        if result.returncode == 0:
-                            success = True
-                            logger.info("✅ Claude Code execution completed successfully")
-                            break
-                        else:
-                            last_error = f"Exit code {result.returncode}"
-                            logger.warning(f"⚠️ Command failed with exit code {result.returncode}, trying next variant...")
-
-                    except subprocess.TimeoutExpired:
-                        last_error = "Timeout after 1 hour"
-                        logger.warning("⚠️ Command timed out, trying next variant...")
-                        continue
-                    except FileNotFoundError:
-                        last_error = "Claude command not found"
-                        logger.warning("⚠️ Claude command not found, trying next variant...")
-                        continue
-                    except Exception as e:
-                        last_error = str(e)
-                        logger.warning(f"⚠️ Command failed with error: {e}, trying next variant...")
-                        continue
-
-                if not success:
-                    logger.error(f"❌ All Claude Code command variants failed. Last error: {last_error}")
+                # Consider exit code 0 as success
+                if returncode == 0:
+                    success = True
+                    logger.info("✅ Claude Code execution completed successfully")
                 else:
-                    # Check for file changes after successful execution
-                    logger.info("📊 Scanning files after Claude Code execution...")
-                    after_checksums = self._get_file_checksums(self.project_root / "src")
-                    changed_files = self._detect_file_changes(before_checksums, after_checksums)
-
-                    if changed_files:
-                        logger.info(f"✅ Claude Code made changes to {len(changed_files)} files:")
-                        for change in changed_files[:10]:  # Show first 10 changes
-                            logger.info(f"   📝 {change}")
-                        if len(changed_files) > 10:
-                            logger.info(f"   ... and {len(changed_files) - 10} more files")
-                    else:
-                        logger.warning("⚠️ No file changes detected - Claude Code may not have modified source files")
-                        logger.info("💡 This could mean:")
-                        logger.info("   - Tasks were already implemented")
-                        logger.info("   - Claude Code encountered permission issues")
-                        logger.info("   - Tasks only involved reading/analysis without code changes")
+                    last_error = f"Exit code {returncode}"
 
-                # Generate summary after successful execution
-                if success:
-                    self._generate_task_summary(task)
+            except subprocess.TimeoutExpired:
+                last_error = "Timeout after 1 hour"
+            except FileNotFoundError:
+                last_error = "Claude command not found"
+            except Exception as e:
+                last_error = str(e)
+
+            if not success:
+                logger.error("❌ Claude Code command failed: %s", last_error)
+            elif self.audit_changes:
+                # Check for file changes after successful execution
+                logger.info("📊 Scanning files after Claude Code execution...")
+                after_checksums = self._get_file_checksums(self.project_root / "src")
+                changed_files = self._detect_file_changes(before_checksums, after_checksums)
+
+                if changed_files:
+                    logger.info("✅ Claude Code made changes to %s files:", len(changed_files))
+                    for change in changed_files[:10]:  # Show first 10 changes
+                        logger.info("   📝 %s", change)
+                    if len(changed_files) > 10:
+                        logger.info("   ... and %s more files", len(changed_files) - 10)
+                else:
+                    logger.warning("⚠️ No file changes detected - Claude Code may not have modified source files")
+                    logger.info("💡 This could mean:")
+                    logger.info("   - Tasks were already implemented")
+                    logger.info("   - Claude Code encountered permission issues")
+                    logger.info("   - Tasks only involved reading/analysis without code changes")
 
-                return success
+            # Generate summary after successful execution
+            if success:
+                self._generate_task_summary(task)
 
-            finally:
-                # Always restore original working directory
-                os.chdir(original_cwd)
+            return success
 
         except Exception as e:
-            logger.error(f"❌ Claude Code execution failed: {e}")
+            logger.error("❌ Claude Code execution failed: %s", e)
             return False
 
+    def _resolve_claude_cmd(self, claude_path: str) -> List[str]:
+        """
+        Determine the Claude Code command prefix supported by the installed CLI.
+
+        The supported permission flags are detected once from ``claude --help``
+        and cached in .claude/.capabilities.json, keyed by the binary's path and
+        modification time so upgrades trigger a fresh probe. A failed probe is
+        not cached, so the next run tries again.
+
+        Args:
+            claude_path: Resolved path of the claude executable
+
+        Returns:
+            Command line up to (but excluding) the prompt
+        """
+        try:
+            binary_mtime_ns = os.stat(claude_path).st_mtime_ns
+        except OSError:
+            binary_mtime_ns = None
+
+        cache_key = {"claude_path": claude_path, "claude_mtime_ns": binary_mtime_ns}
+        if self._claude_capabilities is None:
+            try:
+                with open(self._claude_capabilities_file, "r", encoding="utf-8") as f:
+                    self._claude_capabilities = json.load(f)
+            except (OSError, ValueError):
+                self._claude_capabilities = {}
+
+        cached = self._claude_capabilities
+        if cached.get("claude_path") == claude_path and cached.get("claude_mtime_ns") == binary_mtime_ns and "flags" in cached:
+            supported_flags = cached["flags"]
+        else:
+            supported_flags = self._detect_claude_flags(claude_path)
+            if supported_flags is None:
+                # Probe failures may be transient, so run without flags this time and probe again next time
+                supported_flags = []
+            else:
+                self._claude_capabilities = dict(cache_key, flags=supported_flags)
+                try:
+                    with open(self._claude_capabilities_file, "w", encoding="utf-8") as f:
+                        json.dump(self._claude_capabilities, f, indent=2)
+                except OSError as e:
+                    logger.warning("⚠️ Could not cache Claude capabilities: %s", e)
+
+        return [claude_path] + supported_flags + ["-p"]
+
+    def _detect_claude_flags(self, claude_path: str) -> Optional[List[str]]:
+        """Return which of CLAUDE_PERMISSION_FLAGS appear in ``claude --help``, or None if the probe failed."""
+        try:
+            result = subprocess.run([claude_path, "--help"], capture_output=True, text=True, timeout=10, cwd=self._project_root_str)
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.warning("⚠️ Could not detect Claude capabilities: %s", e)
+            return None
+
+        if result.returncode != 0:
+            logger.warning("⚠️ Could not detect Claude capabilities: 'claude --help' exited with code %s", result.returncode)
+            return None
+
+        help_text = result.stdout + result.stderr
+        supported_flags = [flag for flag in CLAUDE_PERMISSION_FLAGS if flag in help_text]
+        logger.info("🔍 Detected Claude flags: %s", ", ".join(supported_flags) or "none")
+        return supported_flags
+
+    def _run_claude_process(self, cmd: List[str], env: Dict[str, str]) -> int:
+        """
+        Run a Claude Code command, streaming its output instead of buffering it.
+
+        Only the first lines of each stream are logged; the rest is read and
+        discarded so memory stays constant regardless of how long Claude runs.
+
+        Args:
+            cmd: Command line to execute
+            env: Environment for the child process
+
+        Returns:
+            Process exit code
+
+        Raises:
+            subprocess.TimeoutExpired: If the process runs longer than CLAUDE_TIMEOUT_SECONDS
+        """
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors="replace",
+            bufsize=1,
+            cwd=self._project_root_str,
+            env=env,
+        )
+        readers = [
+            threading.Thread(target=self._drain_stream, args=(process.stdout, logging.INFO, "📋 Claude Code stdout:", 20), daemon=True),
+            threading.Thread(target=self._drain_stream, args=(process.stderr, logging.WARNING, "⚠️ Claude Code stderr:", 10), daemon=True),
+        ]
+        for reader in readers:
+            reader.start()
+
+        try:
+            process.wait(timeout=CLAUDE_TIMEOUT_SECONDS)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+            raise
+        finally:
+            for reader in readers:
+                reader.join()
+
+        return process.returncode
+
+    @staticmethod
+    def _drain_stream(stream, level: int, header: str, limit: int):
+        """
+        Read a process stream to EOF, logging its first ``limit`` lines.
+
+        Args:
+            stream: Text stream to read
+            level: Logging level for the output lines
+            header: Message logged before the first line
+            limit: Number of leading lines to log
+        """
+        line_count = 0
+        with stream:
+            for line in stream:
+                line_count += 1
+                if line_count > limit:
+                    continue
+                if line_count == 1:
+                    logger.log(level, header)
+                line = line.rstrip("\n")
+                if line.strip():
+                    logger.log(level, "   %2d: %s", line_count, line)
+
+        if line_count > limit:
+            logger.log(level, "   ... (%s more lines)", line_count - limit)
+
     def _generate_task_summary(self, task: Dict[str, Any]):
         """
         Generate a summary markdown file for the completed task.
@@ -663,18 +1009,18 @@ IMPORTANT: You have full permissions to modify any file. Implement actual workin
             # Use the configured summary directory
             try:
                 self.summary_dir.mkdir(parents=True, exist_ok=True)
-                logger.debug(f"📁 Using summary directory: {self.summary_dir}")
+                logger.debug("📁 Using summary directory: %s", self.summary_dir)
             except PermissionError as e:
-                logger.error(f"❌ Permission denied creating summary directory: {e}")
+                logger.error("❌ Permission denied creating summary directory: %s", e)
                 return
             except Exception as e:
-                logger.error(f"❌ Failed to create summary directory: {e}")
+                logger.error("❌ Failed to create summary directory: %s", e)
                 return
 
             # Generate summary file path
             summary_file = self.summary_dir / f"{ticket_id}.md"
 
-            logger.info(f"📝 Generating task summary: {summary_file}")
+            logger.info("📝 Generating task summary: %s", summary_file)
 
             # Get completed tasks information (with improved error handling)
             completed_tasks = self._get_completed_tasks_info()
@@ -683,7 +1029,7 @@ IMPORTANT: You have full permissions to modify any file. Implement actual workin
             try:
                 summary_content = self._create_summary_content(task, completed_tasks)
             except Exception as e:
-                logger.error(f"❌ Failed to create summary content: {e}")
+                logger.error("❌ Failed to create summary content: %s", e)
                 # Create a minimal summary as fallback
                 summary_content = f"""# Task Summary - {ticket_id}
 
@@ -703,23 +1049,23 @@ The task was processed successfully despite this summary generation issue.
             try:
                 with open(summary_file, "w", encoding="utf-8") as f:
                     f.write(summary_content)
-                logger.info(f"✅ Task summary generated: {summary_file} ({len(summary_content)} characters)")
+                logger.info("✅ Task summary generated: %s (%s characters)", summary_file, len(summary_content))
             except PermissionError as e:
-                logger.error(f"❌ Permission denied writing summary file: {e}")
+                logger.error("❌ Permission denied writing summary file: %s", e)
             except Exception as e:
-                logger.error(f"❌ Failed to write summary file: {e}")
+                logger.error("❌ Failed to write summary file: %s", e)
 
         except Exception as e:
-            logger.error(f"❌ Failed to generate task summary: {e}")
+            logger.error("❌ Failed to generate task summary: %s", e)
             import traceback
 
-            logger.debug(f"Summary generation traceback: {traceback.format_exc()}")
+            logger.debug("Summary generation traceback: %s", traceback.format_exc())
 
     def _get_completed_tasks_info(self) -> List[Dict[str, Any]]:
         """Get information about all completed tasks from Task Master."""
         try:
             if not self.taskmaster_tasks_file.exists():
-                logger.warning(f"⚠️ TaskMaster tasks file not found: {self.taskmaster_tasks_file}")
+                logger.warning("⚠️ TaskMaster tasks file not found: %s", self.taskmaster_tasks_file)
                 logger.info("📝 This is normal for first run or test environments")
                 return []
 
@@ -742,14 +1088,14 @@ The task was processed successfully despite this summary generation issue.
                 if task.get("status") == "done":
                     completed_tasks.append(task)
 
-            logger.info(f"📊 Found {len(completed_tasks)} completed tasks out of {len(tasks_list)} total tasks")
+            logger.info("📊 Found %s completed tasks out of %s total tasks", len(completed_tasks), len(tasks_list))
             return completed_tasks
 
         except json.JSONDecodeError as e:
-            logger.error(f"❌ Invalid JSON in TaskMaster tasks file: {e}")
+            logger.error("❌ Invalid JSON in TaskMaster tasks file: %s", e)
             return []
         except Exception as e:
-            logger.error(f"❌ Failed to get completed tasks info: {e}")
+            logger.error("❌ Failed to get completed tasks info: %s", e)
             return []
 
     def _create_summary_content(self, main_task: Dict[str, Any], completed_tasks: List[Dict[str, Any]]) -> str:
@@ -905,7 +1251,7 @@ Monitor the following aspects of the implementation:
                 ["git", "status", "--porcelain"],
                 capture_output=True,
                 text=True,
-                cwd=self.project_root,
+                cwd=self._project_root_str,
             )
 
             if result.returncode == 0 and result.stdout.strip():
@@ -933,7 +1279,7 @@ Monitor the following aspects of the implementation:
             return []
 
         except Exception as e:
-            logger.warning(f"⚠️ Could not get file changes: {e}")
+            logger.warning("⚠️ Could not get file changes: %s", e)
             return []
 
     def _check_commit_checkbox(self, page_id: str) -> bool:
@@ -951,7 +1297,7 @@ Monitor the following aspects of the implementation:
             page_data = self.notion_client.get_page(page_id)
 
             if not page_data:
-                logger.warning(f"⚠️ Could not retrieve page data for {page_id}")
+                logger.warning("⚠️ Could not retrieve page data for %s", page_id)
                 return False
 
             # Check for Commit property
@@ -961,14 +1307,14 @@ Monitor the following aspects of the implementation:
             # Handle checkbox property type
             if "checkbox" in commit_prop:
                 is_checked = commit_prop["checkbox"]
-                logger.info(f"📋 Commit checkbox for {page_id}: {'✅ Checked' if is_checked else '❌ Unchecked'}")
+                logger.info("📋 Commit checkbox for %s: %s", page_id, "✅ Checked" if is_checked else "❌ Unchecked")
                 return bool(is_checked)
             else:
-                logger.info(f"📋 No 'Commit' checkbox property found for {page_id}")
+                logger.info("📋 No 'Commit' checkbox property found for %s", page_id)
                 return False
 
         except Exception as e:
-            logger.error(f"❌ Error checking commit checkbox for {page_id}: {e}")
+            logger.error("❌ Error checking commit checkbox for %s: %s", page_id, e)
             return False
 
     def _handle_git_commit(self, task: Dict[str, Any], ticket_id: str) -> bool:
@@ -990,29 +1336,29 @@ Monitor the following aspects of the implementation:
                 ["git", "status", "--porcelain"],
                 capture_output=True,
                 text=True,
-                cwd=self.project_root,
+                cwd=self._project_root_str,
             )
 
             if git_status_result.returncode != 0:
-                logger.error(f"❌ Failed to get git status: {git_status_result.stderr}")
+                logger.error("❌ Failed to get git status: %s", git_status_result.stderr)
                 return False
 
             # Check if there are any changes to commit
             changes = git_status_result.stdout.strip()
             if not changes:
-                logger.info(f"📋 No changes to commit for task {ticket_id}")
+                logger.info("📋 No changes to commit for task %s", ticket_id)
                 return True  # Not an error, just no changes
 
-            logger.info(f"📝 Found changes to commit for task {ticket_id}:")
+            logger.info("📝 Found changes to commit for task %s:", ticket_id)
             for line in changes.split("\n"):
                 if line.strip():
-                    logger.info(f"   {line}")
+                    logger.info("   %s", line)
 
             # Add all changes to staging
-            git_add_result = subprocess.run(["git", "add", "."], capture_output=True, text=True, cwd=self.project_root)
+            git_add_result = subprocess.run(["git", "add", "."], capture_output=True, text=True, cwd=self._project_root_str)
 
             if git_add_result.returncode != 0:
-                logger.error(f"❌ Failed to stage changes: {git_add_result.stderr}")
+                logger.error("❌ Failed to stage changes: %s", git_add_result.stderr)
                 return False
 
             # Generate commit message
@@ -1023,20 +1369,20 @@ Monitor the following aspects of the implementation:
                 ["git", "commit", "-m", commit_message],
                 capture_output=True,
                 text=True,
-                cwd=self.project_root,
+                cwd=self._project_root_str,
             )
 
             if git_commit_result.returncode != 0:
-                logger.error(f"❌ Failed to commit changes: {git_commit_result.stderr}")
+                logger.error("❌ Failed to commit changes: %s", git_commit_result.stderr)
                 return False
 
-            logger.info(f"✅ Successfully committed changes for task {ticket_id}")
-            logger.info(f"📝 Commit message: {commit_message}")
+            logger.info("✅ Successfully committed changes for task %s", ticket_id)
+            logger.info("📝 Commit message: %s", commit_message)
 
             return True
 
         except Exception as e:
-            logger.error(f"❌ Error handling git commit for task {ticket_id}: {e}")
+            logger.error("❌ Error handling git commit for task %s: %s", ticket_id, e)
             return False
 
     def _generate_commit_message(self, task: Dict[str, Any], ticket_id: str, changes: str) -> str:
@@ -1081,7 +1427,7 @@ Monitor the following aspects of the implementation:
             return commit_message
 
         except Exception as e:
-            logger.error(f"❌ Error generating commit message: {e}")
+            logger.error("❌ Error generating commit message: %s", e)
             # Fallback to simple message
             return f"feat: {ticket_id} - {task.get('title', 'Task completed')}\n\n🤖 Auto-committed by Simple Queued Processor"
 
@@ -1095,7 +1441,8 @@ Monitor the following aspects of the implementation:
         """
         try:
             # Add error feedback first
-            self.feedback_manager.add_error_feedback(
+            self._post_feedback(
+                self.feedback_manager.add_error_feedback,
                 page_id=page_id,
                 stage=ProcessingStage.ERROR_HANDLING,
                 error_message=error_message,
@@ -1108,13 +1455,16 @@ Monitor the following aspects of the implementation:
                 from_status=TaskStatus.IN_PROGRESS.value,
                 to_status=TaskStatus.FAILED.value,
                 validate_transition=False,  # Allow from any status in error scenarios
+                trust_from_status=True,  # Only reached for tasks this processor moved to 'In progress'
             )
 
             if transition.result.value == "success":
-                logger.info(f"✅ Status updated to 'Failed' with message: {error_message}")
+                self._in_progress_cache = (time.monotonic(), 0)
+                logger.info("✅ Status updated to 'Failed' with message: %s", error_message)
 
                 # Add status transition feedback
-                self.feedback_manager.add_status_transition_feedback(
+                self._post_feedback(
+                    self.feedback_manager.add_status_transition_feedback,
                     page_id=page_id,
                     from_status=TaskStatus.IN_PROGRESS.value,
                     to_status=TaskStatus.FAILED.value,
@@ -1123,10 +1473,11 @@ Monitor the following aspects of the implementation:
                 )
             else:
                 error_detail = f"Failed to update status to 'Failed': {transition.error}"
-                logger.error(f"❌ {error_detail}")
+                logger.error("❌ %s", error_detail)
 
                 # Add additional error feedback about status transition failure
-                self.feedback_manager.add_error_feedback(
+                self._post_feedback(
+                    self.feedback_manager.add_error_feedback,
                     page_id=page_id,
                     stage=ProcessingStage.STATUS_TRANSITION,
                     error_message="Status transition to Failed status failed",
@@ -1134,18 +1485,19 @@ Monitor the following aspects of the implementation:
                 )
 
         except Exception as e:
-            logger.error(f"❌ Exception updating status to failed: {e}")
+            logger.error("❌ Exception updating status to failed: %s", e)
 
             # Try to add feedback about the exception if possible
             try:
-                self.feedback_manager.add_error_feedback(
+                self._post_feedback(
+                    self.feedback_manager.add_error_feedback,
                     page_id=page_id,
                     stage=ProcessingStage.ERROR_HANDLING,
                     error_message="Critical error in status update process",
                     details=f"Exception during _update_status_to_failed: {str(e)}",
                 )
             except Exception as feedback_error:
-                logger.error(f"❌ Could not add feedback about critical error: {feedback_error}")
+                logger.error("❌ Could not add feedback about critical error: %s", feedback_error)
 
 
 def main():
@@ -1155,20 +1507,35 @@ def main():
     parser = argparse.ArgumentParser(description="Simple queued task processor")
     parser.add_argument(
         "--project-root",
-        default="/Users/damian/Web/ddcode/nomad",
-        help="Project root directory (default: current directory's parent)",
+        default=os.getenv("PROJECT_ROOT", os.getcwd()),
+        help="Project root directory (default: PROJECT_ROOT env var or current directory)",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        help="Keep running and poll for queued tasks every INTERVAL seconds instead of exiting after one pass",
     )
 
     args = parser.parse_args()
+    if args.interval is not None and not args.interval >= 0:
+        parser.error("--interval must be a non-negative number of seconds")
 
     # Initialize processor
     processor = SimpleQueuedProcessor(args.project_root)
 
-    # Process queued tasks
-    success = processor.process_queued_tasks()
-
-    # Exit with appropriate code
-    sys.exit(0 if success else 1)
+    # Single pass: exit with appropriate code
+    if args.interval is None:
+        success = processor.process_queued_tasks()
+        sys.exit(0 if success else 1)
+
+    # Polling mode: reuse one process (and processor) for every pass
+    logger.info("🔁 Polling for queued tasks every %ss (Ctrl+C to stop)", args.interval)
+    try:
+        while True:
+            processor.process_queued_tasks()
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        logger.info("🛑 Queued task polling stopped")
 
 
 if __name__ == "__main__":
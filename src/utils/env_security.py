@@ -3,19 +3,76 @@ Environment variable security utilities for Nomad.
 Handles secure loading, validation, and masking of sensitive environment variables.
 """
 
+import functools
 import logging
 import os
 import re
+from glob import glob
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Obvious placeholder texts (lower-cased) that should never be used as real keys
+PLACEHOLDER_TEXTS = frozenset(
+    [
+        "your_key_here",
+        "api_key",
+        "secret",
+        "token",
+        "replace_me",
+        "example",
+        "demo",
+        "test",
+        "placeholder",
+        "changeme",
+    ]
+)
+
+# One-pass, case-insensitive search for any placeholder text
+_PLACEHOLDER_RE = re.compile("|".join(map(re.escape, sorted(PLACEHOLDER_TEXTS))), re.IGNORECASE)
+
+# Shortest string accepted as a Notion token
+NOTION_TOKEN_MIN_LENGTH = 32
+
+# Notion database IDs are 32 hex digits once hyphens are dropped
+_HEX32_RE = re.compile(r"[0-9a-fA-F]{32}")
+_HYPHEN_TABLE = str.maketrans("", "", "-")
+
+# Number of variable names whose sensitivity is remembered
+SENSITIVE_NAME_CACHE_SIZE = 1024
+
+# Common places where environment variables might leak
+POTENTIAL_LEAK_FILES = (
+    ".bash_history",
+    ".zsh_history",
+    ".history",
+    "docker-compose.yml",
+    "Dockerfile",
+    ".github/workflows/*.yml",
+    ".gitlab-ci.yml",
+)
+
+# Files at least this large are skipped by the leak scan
+LEAK_SCAN_MAX_BYTES = 1024 * 1024
+
+# Characters that have no place in an API key
+_SUSPICIOUS_RE = re.compile(r'[<>"\']')
+
+# Control characters other than tab
+_CONTROL_CHAR_RE = re.compile(r"[\x00-\x08\x0a-\x1f]")
+
+
+def _without_redundant_substrings(strings: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Drop every string that contains another, shorter string of the tuple."""
+    return tuple(string for string in strings if not any(other != string and other in string for other in strings))
+
 
 class EnvironmentSecurityManager:
     """Manages secure handling of environment variables."""
 
-    # Patterns for sensitive variable names
+    # Patterns for sensitive variable names (kept for callers that read them;
+    # matching uses the equivalent SENSITIVE_KEYWORDS substrings)
     SENSITIVE_PATTERNS = [
         r".*KEY.*",
         r".*TOKEN.*",
@@ -25,6 +82,9 @@ class EnvironmentSecurityManager:
         r".*CREDENTIAL.*",
     ]
 
+    # Upper-cased keywords that mark a variable name as sensitive
+    SENSITIVE_KEYWORDS = ("KEY", "TOKEN", "SECRET", "PASSWORD", "AUTH", "CREDENTIAL")
+
     # Known API key prefixes for validation
     API_KEY_PREFIXES = {
         "openai": ["sk-"],
@@ -36,17 +96,25 @@ class EnvironmentSecurityManager:
         "xai": ["xai-"],
     }
 
+    # API_KEY_PREFIXES as tuples, ready for str.startswith
+    _API_KEY_PREFIX_TUPLES = {provider: tuple(prefixes) for provider, prefixes in API_KEY_PREFIXES.items()}
+
+    # Every known API key prefix, flattened for str.startswith
+    _all_prefixes = tuple(prefix for prefixes in API_KEY_PREFIXES.values() for prefix in prefixes)
+
+    # Prefixes worth scanning file content for: one containing a shorter
+    # prefix (sk-ant- contains sk-) can never be the only match
+    _leak_scan_prefixes = _without_redundant_substrings(_all_prefixes)
+
     def __init__(self):
         self.sensitive_vars = set()
-        self._compile_sensitive_patterns()
 
-    def _compile_sensitive_patterns(self):
-        """Compile regex patterns for sensitive variable detection."""
-        self.sensitive_regex = [re.compile(pattern, re.IGNORECASE) for pattern in self.SENSITIVE_PATTERNS]
-
-    def is_sensitive_variable(self, var_name: str) -> bool:
+    @staticmethod
+    @functools.lru_cache(maxsize=SENSITIVE_NAME_CACHE_SIZE)
+    def is_sensitive_variable(var_name: str) -> bool:
         """Check if a variable name indicates it contains sensitive data."""
-        return any(pattern.match(var_name) for pattern in self.sensitive_regex)
+        name_upper = var_name.upper()
+        return any(keyword in name_upper for keyword in EnvironmentSecurityManager.SENSITIVE_KEYWORDS)
 
     def mask_sensitive_value(self, value: str, show_chars: int = 4) -> str:
         """Mask a sensitive value for safe logging/display."""
@@ -78,39 +146,25 @@ class EnvironmentSecurityManager:
             issues.append("API key too short (minimum 10 characters)")
 
         # Check for obvious placeholder text
-        placeholder_texts = [
-            "your_key_here",
-            "api_key",
-            "secret",
-            "token",
-            "replace_me",
-            "example",
-            "demo",
-            "test",
-            "placeholder",
-            "changeme",
-        ]
-
-        if any(placeholder.lower() in api_key.lower() for placeholder in placeholder_texts):
+        if _PLACEHOLDER_RE.search(api_key):
             issues.append("API key appears to be a placeholder")
 
         # Provider-specific validation
         provider_lower = provider.lower()
-        if provider_lower in self.API_KEY_PREFIXES:
-            expected_prefixes = self.API_KEY_PREFIXES[provider_lower]
-            if not any(api_key.startswith(prefix) for prefix in expected_prefixes):
-                issues.append(f"API key should start with one of: {', '.join(expected_prefixes)}")
+        expected_prefixes = self._API_KEY_PREFIX_TUPLES.get(provider_lower)
+        if expected_prefixes is not None and not api_key.startswith(expected_prefixes):
+            issues.append(f"API key should start with one of: {', '.join(expected_prefixes)}")
 
         # Additional security checks
         if api_key.count(" ") > 2:
             issues.append("API key contains too many spaces")
 
         # Check for suspicious patterns
-        if re.search(r'[<>"\']', api_key):
+        if _SUSPICIOUS_RE.search(api_key):
             issues.append("API key contains suspicious characters")
 
         # Check for newlines or control characters
-        if any(ord(c) < 32 for c in api_key if c not in ["\t"]):
+        if _CONTROL_CHAR_RE.search(api_key):
             issues.append("API key contains control characters")
 
         return len(issues) == 0, issues
@@ -120,57 +174,66 @@ class EnvironmentSecurityManager:
         if not isinstance(token, str):
             return False
 
-        token = token.strip()
-        if not token:
-            return False
-
-        # Notion tokens typically start with 'secret_' and are quite long
-        if token.startswith("secret_") and len(token) > 40:
-            return True
-
-        # Also accept other formats but with minimum length
-        return len(token) >= 32
+        # Notion tokens typically start with 'secret_' and are quite long, but
+        # other formats are accepted too, so the minimum length is the only rule
+        return len(token.strip()) >= NOTION_TOKEN_MIN_LENGTH
 
     def validate_notion_database_id(self, db_id: str) -> bool:
         """Validate Notion database ID format."""
         if not isinstance(db_id, str):
             return False
 
-        db_id = db_id.strip()
-        if not db_id:
-            return False
+        # Remove hyphens, then it should be 32 hexadecimal characters
+        clean_id = db_id.strip().translate(_HYPHEN_TABLE)
+        return _HEX32_RE.fullmatch(clean_id) is not None
 
-        # Remove hyphens for validation
-        clean_id = db_id.replace("-", "")
+    def sanitize_for_logging(self, data: Any) -> Any:
+        """Sanitize data structure for safe logging by masking sensitive values."""
+        if not isinstance(data, (dict, list)):
+            return self._sanitize_scalar(data)
+
+        # Walk nested containers with an explicit stack instead of recursion.
+        # Each entry is (sanitized parent, key or index, original container);
+        # containers seen before reuse their sanitized copy so shared or
+        # cyclic references cannot loop forever.
+        root = [data]
+        sanitized_by_id = {}
+        stack = [(root, 0, data)]
+        while stack:
+            parent, slot, container = stack.pop()
+            container_id = id(container)
+            if container_id in sanitized_by_id:
+                parent[slot] = sanitized_by_id[container_id]
+                continue
 
-        # Should be 32 characters hexadecimal
-        if len(clean_id) != 32:
-            return False
+            if isinstance(container, dict):
+                sanitized = {}
+                for key, value in container.items():
+                    if self.is_sensitive_variable(key):
+                        sanitized[key] = self.mask_sensitive_value(str(value)) if value else None
+                    elif isinstance(value, (dict, list)):
+                        sanitized[key] = None
+                        stack.append((sanitized, key, value))
+                    else:
+                        sanitized[key] = self._sanitize_scalar(value)
+            else:
+                sanitized = [None] * len(container)
+                for index, item in enumerate(container):
+                    if isinstance(item, (dict, list)):
+                        stack.append((sanitized, index, item))
+                    else:
+                        sanitized[index] = self._sanitize_scalar(item)
 
-        try:
-            int(clean_id, 16)  # Validate it's hexadecimal
-            return True
-        except ValueError:
-            return False
+            sanitized_by_id[container_id] = sanitized
+            parent[slot] = sanitized
 
-    def sanitize_for_logging(self, data: Any) -> Any:
-        """Sanitize data structure for safe logging by masking sensitive values."""
-        if isinstance(data, dict):
-            sanitized = {}
-            for key, value in data.items():
-                if self.is_sensitive_variable(key):
-                    sanitized[key] = self.mask_sensitive_value(str(value)) if value else None
-                else:
-                    sanitized[key] = self.sanitize_for_logging(value)
-            return sanitized
-        elif isinstance(data, list):
-            return [self.sanitize_for_logging(item) for item in data]
-        elif isinstance(data, str) and len(data) > 20:
-            # Check if this looks like an API key
-            if any(data.startswith(prefix) for prefixes in self.API_KEY_PREFIXES.values() for prefix in prefixes):
-                return self.mask_sensitive_value(data)
+        return root[0]
 
-        return data
+    def _sanitize_scalar(self, value: Any) -> Any:
+        """Mask a single non-container value if it looks like an API key."""
+        if isinstance(value, str) and len(value) > 20 and value.startswith(self._all_prefixes):
+            return self.mask_sensitive_value(value)
+        return value
 
     def validate_environment_security(self, config: Dict[str, str]) -> Dict[str, Any]:
         """Validate security aspects of environment configuration."""
@@ -184,18 +247,19 @@ class EnvironmentSecurityManager:
                 results["recommendations"].append("Run: chmod 600 .env")
 
         # Check for potential security issues
+        environ = os.environ
         for var_name, value in config.items():
             if not value:
                 continue
 
             if self.is_sensitive_variable(var_name):
                 # Check if sensitive variable is set via environment vs file
-                if os.getenv(var_name) == value:
+                if environ.get(var_name) == value:
                     # It's set in environment - check if it's in shell history risk
                     results["recommendations"].append(f"Consider using config file instead of shell environment for {var_name}")
 
                 # Validate the sensitive value
-                if var_name.endswith("_API_KEY") or var_name.endswith("_TOKEN"):
+                if var_name.endswith(("_API_KEY", "_TOKEN")):
                     provider = var_name.replace("_API_KEY", "").replace("_TOKEN", "").lower()
                     is_valid, issues = self.validate_api_key_format(provider, value)
 
@@ -228,42 +292,30 @@ class EnvironmentSecurityManager:
         """Check for potential environment variable leaks."""
         warnings = []
 
-        # Check common places where environment variables might leak
-        potential_leak_files = [
-            ".bash_history",
-            ".zsh_history",
-            ".history",
-            "docker-compose.yml",
-            "Dockerfile",
-            ".github/workflows/*.yml",
-            ".gitlab-ci.yml",
-        ]
-
-        for file_pattern in potential_leak_files:
+        # Expand the glob patterns once; plain names are checked by the stat below
+        files = []
+        for file_pattern in POTENTIAL_LEAK_FILES:
             if "*" in file_pattern:
-                # Handle glob patterns
-                from glob import glob
-
-                files = glob(file_pattern)
+                files.extend(glob(file_pattern))
             else:
-                files = [file_pattern] if os.path.exists(file_pattern) else []
-
-            for file_path in files:
-                try:
-                    if os.path.exists(file_path) and os.path.getsize(file_path) < 1024 * 1024:  # Only check files < 1MB
-                        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                            content = f.read()
-
-                        # Look for potential API keys in content
-                        for prefix_list in self.API_KEY_PREFIXES.values():
-                            for prefix in prefix_list:
-                                if prefix in content:
-                                    warnings.append(f"Potential API key found in {file_path}")
-                                    break
-                except (OSError, UnicodeDecodeError, PermissionError):
-                    # Skip files we can't read
+                files.append(file_pattern)
+
+        for file_path in files:
+            try:
+                # A single stat covers both existence and size; only check files < 1MB
+                if os.stat(file_path).st_size >= LEAK_SCAN_MAX_BYTES:
                     continue
 
+                with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
+                    content = f.read()
+
+                # Look for potential API keys in content
+                if any(prefix in content for prefix in self._leak_scan_prefixes):
+                    warnings.append(f"Potential API key found in {file_path}")
+            except (OSError, UnicodeDecodeError, PermissionError):
+                # Skip files that are missing or that we can't read
+                continue
+
         return warnings
 
 
@@ -6,14 +6,19 @@ Provides comprehensive parsing and validation for provider/model format strings.
 Supports format: provider/model (e.g., 'openai/gpt-4', 'anthropic/claude-3-sonnet')
 """
 
+import functools
 import logging
 import re
+import sys
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__ of parse results
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class ValidationError(Exception):
     """Custom exception for model validation errors"""
@@ -34,7 +39,7 @@ class ProviderType(str, Enum):
     XAI = "xai"
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class ParsedModel:
     """Container for parsed model information"""
 
@@ -42,11 +47,7 @@ class ParsedModel:
     model: str
     original_string: str
     is_valid: bool = True
-    validation_errors: list = None
-
-    def __post_init__(self):
-        if self.validation_errors is None:
-            self.validation_errors = []
+    validation_errors: Tuple[str, ...] = ()
 
 
 class ModelParser:
@@ -55,6 +56,9 @@ class ModelParser:
     # Default fallback model
     DEFAULT_MODEL = "openai/gpt-4o-mini"
 
+    # Number of distinct (model string, strictness) parse results to keep
+    PARSE_CACHE_SIZE = 256
+
     # Validation patterns
     PROVIDER_PATTERN = re.compile(r"^[a-zA-Z][a-zA-Z0-9_-]*$")
     MODEL_PATTERN = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9._-]*$")
@@ -108,11 +112,22 @@ class ModelParser:
         },
     }
 
+    # Provider names with extra validation against PROVIDER_CONFIG
+    _PROVIDER_VALUES = frozenset(provider.value for provider in ProviderType)
+
+    # PROVIDER_CONFIG keyed by plain provider name, so lookups need no enum conversion
+    _PROVIDER_CONFIG_BY_NAME = {provider.value: config for provider, config in PROVIDER_CONFIG.items()}
+
     @classmethod
+    @functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
     def parse_model_string(cls, model_string: Optional[str], strict_validation: bool = True) -> ParsedModel:
         """
         Parse and validate a model string in provider/model format.
 
+        Results are cached per (model_string, strict_validation), so the same
+        frozen ParsedModel is returned for repeated inputs. Validation
+        failures raised in strict mode are not cached.
+
         Args:
             model_string: String in format 'provider/model' or None for default
             strict_validation: If True, applies strict validation rules
@@ -125,7 +140,7 @@ class ModelParser:
         """
         if not model_string or not model_string.strip():
             logger.info(f"Empty model string provided, using default: {cls.DEFAULT_MODEL}")
-            return cls.parse_model_string(cls.DEFAULT_MODEL, strict_validation=False)
+            return _DEFAULT_PARSED
 
         model_string = model_string.strip()
         original_string = model_string
@@ -147,7 +162,7 @@ class ModelParser:
                 errors.append(error_msg)
                 if strict_validation:
                     raise ValidationError(error_msg)
-                return ParsedModel("", "", original_string, False, errors)
+                return ParsedModel("", "", original_string, False, tuple(errors))
 
             provider, model = parts
 
@@ -178,46 +193,36 @@ class ModelParser:
                 raise ValidationError(error_msg)
 
         # Additional validation for known providers
-        if provider in [p.value for p in ProviderType]:
+        if provider in cls._PROVIDER_VALUES:
             cls._validate_known_provider(provider, model, errors, strict_validation)
 
         is_valid = len(errors) == 0
-        return ParsedModel(provider, model, original_string, is_valid, errors)
+        return ParsedModel(provider, model, original_string, is_valid, tuple(errors))
 
     @classmethod
     def _validate_known_provider(cls, provider: str, model: str, errors: list, strict_validation: bool) -> None:
         """Validate model against known provider configurations"""
-        try:
-            provider_enum = ProviderType(provider)
-            config = cls.PROVIDER_CONFIG.get(provider_enum)
-
-            if config and "common_models" in config:
-                common_models = config["common_models"]
-                # For openrouter and some providers, skip model validation as they support many models
-                # Also be flexible about case sensitivity and minor variations
-                if provider_enum not in [ProviderType.OPENROUTER]:
-                    model_lower = model.lower()
-                    common_models_lower = [m.lower() for m in common_models]
-                    if model_lower not in common_models_lower:
-                        warning_msg = f"Model '{model}' not in common models for provider '{provider}'. Common models: {common_models}"
-                        logger.warning(warning_msg)
-                        # Only add as error for very strict validation, and only for critical issues
-                        # Allow flexibility for model variations
-                        if strict_validation and not any(model_lower.startswith(cm.split("-")[0]) for cm in common_models_lower):
-                            errors.append(warning_msg)
-
-        except ValueError:
-            # Provider not in enum, which is fine for extensibility
-            pass
+        # Providers outside PROVIDER_CONFIG are fine for extensibility
+        config = cls._PROVIDER_CONFIG_BY_NAME.get(provider)
+
+        if config and "common_models" in config:
+            common_models = config["common_models"]
+            # For openrouter and some providers, skip model validation as they support many models
+            # Also be flexible about case sensitivity and minor variations
+            if provider != ProviderType.OPENROUTER.value:
+                model_lower = model.lower()
+                if model_lower not in config["common_models_lower"]:
+                    warning_msg = f"Model '{model}' not in common models for provider '{provider}'. Common models: {common_models}"
+                    logger.warning(warning_msg)
+                    # Only add as error for very strict validation, and only for critical issues
+                    # Allow flexibility for model variations
+                    if strict_validation and not model_lower.startswith(config["common_prefixes"]):
+                        errors.append(warning_msg)
 
     @classmethod
     def get_provider_config(cls, provider: str) -> Optional[Dict[str, Any]]:
         """Get configuration for a specific provider"""
-        try:
-            provider_enum = ProviderType(provider.lower())
-            return cls.PROVIDER_CONFIG.get(provider_enum)
-        except ValueError:
-            return None
+        return cls._PROVIDER_CONFIG_BY_NAME.get(provider.lower())
 
     @classmethod
     def is_openai_provider(cls, provider: str) -> bool:
@@ -249,8 +254,7 @@ class ModelParser:
     @classmethod
     def get_default_model(cls) -> Tuple[str, str]:
         """Get default provider and model"""
-        parsed = cls.parse_model_string(cls.DEFAULT_MODEL, strict_validation=False)
-        return parsed.provider, parsed.model
+        return _DEFAULT_PARSED.provider, _DEFAULT_PARSED.model
 
     @classmethod
     def format_model_string(cls, provider: str, model: str) -> str:
@@ -263,6 +267,17 @@ class ModelParser:
         return [provider.value for provider in ProviderType]
 
 
+# Lower-cased common model names for case-insensitive membership checks, and
+# their family prefixes (the part before the first '-') for str.startswith
+for _provider_config in ModelParser.PROVIDER_CONFIG.values():
+    _provider_config["common_models_lower"] = frozenset(model.lower() for model in _provider_config["common_models"])
+    _provider_config["common_prefixes"] = tuple(model.split("-", 1)[0] for model in _provider_config["common_models_lower"])
+del _provider_config
+
+# The default model never changes, so empty input returns this parse result directly
+_DEFAULT_PARSED = ModelParser.parse_model_string(ModelParser.DEFAULT_MODEL, strict_validation=False)
+
+
 # Convenience functions for backward compatibility and ease of use
 def parse_model(model_string: Optional[str]) -> Tuple[str, str]:
     """Simple parsing function that returns (provider, model) tuple"""
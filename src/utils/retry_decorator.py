@@ -4,6 +4,8 @@ Retry decorator with exponential backoff for API calls and operations.
 
 import asyncio
 import logging
+import random
+import re
 import time
 from functools import wraps
 from typing import Any, Callable, Optional, Tuple, Type, Union
@@ -38,6 +40,12 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Bound once so each jittered delay skips the module attribute lookup
+_rand = random.random
+
+# Error message fragments that mark network/timeout failures as retryable
+_RETRYABLE_RE = re.compile(r"rate limit|timeout|connection|network|temporary|service unavailable|429|502|503|504", re.IGNORECASE)
+
 
 def retry_with_backoff(
     max_retries: int = 3,
@@ -61,7 +69,28 @@ def retry_with_backoff(
         non_retryable_exceptions: Tuple of exception types that should never be retried
     """
 
+    # The backoff schedule and retry predicate only depend on the decorator arguments, so build them once
+    delays = tuple(min(base_delay * (exponential_base**attempt), max_delay) for attempt in range(max_retries + 1))
+    should_retry = _make_should_retry(max_retries, retryable_exceptions, non_retryable_exceptions)
+
     def decorator(func: Callable) -> Callable:
+        # Only build the wrapper that matches the function
+        if asyncio.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                return await _execute_with_retry_async(
+                    func,
+                    args,
+                    kwargs,
+                    max_retries,
+                    delays,
+                    jitter,
+                    should_retry,
+                )
+
+            return async_wrapper
+
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
             return _execute_with_retry(
@@ -69,97 +98,62 @@ def retry_with_backoff(
                 args,
                 kwargs,
                 max_retries,
-                base_delay,
-                max_delay,
-                exponential_base,
+                delays,
                 jitter,
-                retryable_exceptions,
-                non_retryable_exceptions,
+                should_retry,
             )
 
-        @wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            return await _execute_with_retry_async(
-                func,
-                args,
-                kwargs,
-                max_retries,
-                base_delay,
-                max_delay,
-                exponential_base,
-                jitter,
-                retryable_exceptions,
-                non_retryable_exceptions,
-            )
-
-        # Return appropriate wrapper based on whether function is async
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
-        else:
-            return sync_wrapper
+        return sync_wrapper
 
     return decorator
 
 
-def _calculate_delay(attempt: int, base_delay: float, max_delay: float, exponential_base: float, jitter: bool) -> float:
-    """Calculate delay for given attempt with exponential backoff and optional jitter."""
-    delay = min(base_delay * (exponential_base**attempt), max_delay)
+def _calculate_delay(attempt: int, delays: Tuple[float, ...], jitter: bool) -> float:
+    """Look up the backoff delay for given attempt and add optional jitter."""
+    delay = delays[attempt]
 
     if jitter:
         # Add random jitter up to 25% of the delay
-        import random
-
-        jitter_amount = delay * 0.25 * random.random()
+        jitter_amount = delay * 0.25 * _rand()
         delay += jitter_amount
 
     return delay
 
 
-def _should_retry(
-    exception: Exception,
-    attempt: int,
+def _make_should_retry(
     max_retries: int,
     retryable_exceptions: Tuple[Type[Exception], ...],
     non_retryable_exceptions: Tuple[Type[Exception], ...],
-) -> bool:
-    """Determine if an exception should trigger a retry."""
-
-    # Check if we've exhausted retries
-    if attempt >= max_retries:
-        return False
-
-    # Check for non-retryable exceptions first
-    if isinstance(exception, non_retryable_exceptions):
-        return False
-
-    # Check for specific retryable patterns
-    if isinstance(exception, RetryableError):
-        return exception.can_retry
-
-    # Check for rate limiting
-    if isinstance(exception, NotionRateLimitError):
-        return True
-
-    # Check for network/timeout errors
-    error_str = str(exception).lower()
-    retryable_patterns = [
-        "rate limit",
-        "timeout",
-        "connection",
-        "network",
-        "temporary",
-        "service unavailable",
-        "429",
-        "502",
-        "503",
-        "504",
-    ]
-
-    if any(pattern in error_str for pattern in retryable_patterns):
-        return True
-
-    # Check if exception type is in retryable list
-    return isinstance(exception, retryable_exceptions)
+) -> Callable[[Exception, int], bool]:
+    """Build the retry predicate for one decorator, closing over its settings."""
+
+    def should_retry(exception: Exception, attempt: int) -> bool:
+        """Determine if an exception should trigger a retry."""
+
+        # Check if we've exhausted retries
+        if attempt >= max_retries:
+            return False
+
+        # Check for non-retryable exceptions first
+        if isinstance(exception, non_retryable_exceptions):
+            return False
+
+        # Check for specific retryable patterns
+        if isinstance(exception, RetryableError):
+            return exception.can_retry
+
+        # Check for rate limiting
+        if isinstance(exception, NotionRateLimitError):
+            return True
+
+        # Check for network/timeout errors
+        if _RETRYABLE_RE.search(str(exception)):
+            return True
+
+        # Check if exception type is in retryable list
+        return isinstance(exception, retryable_exceptions)
+
+    return should_retry
 
 
 def _execute_with_retry(
@@ -167,12 +161,9 @@ def _execute_with_retry(
     args: tuple,
     kwargs: dict,
     max_retries: int,
-    base_delay: float,
-    max_delay: float,
-    exponential_base: float,
+    delays: Tuple[float, ...],
     jitter: bool,
-    retryable_exceptions: Tuple[Type[Exception], ...],
-    non_retryable_exceptions: Tuple[Type[Exception], ...],
+    should_retry: Callable[[Exception, int], bool],
 ) -> Any:
     """Execute function with retry logic (synchronous)."""
 
@@ -192,13 +183,13 @@ def _execute_with_retry(
             last_exception = e
 
             # Check if we should retry
-            if not _should_retry(e, attempt, max_retries, retryable_exceptions, non_retryable_exceptions):
+            if not should_retry(e, attempt):
                 logger.error(f"❌ Function {func.__name__} failed on attempt {attempt + 1}, not retrying: {e}")
                 raise
 
             # Calculate delay for next attempt
             if attempt < max_retries:
-                delay = _calculate_delay(attempt, base_delay, max_delay, exponential_base, jitter)
+                delay = _calculate_delay(attempt, delays, jitter)
                 logger.warning(f"⚠️ Function {func.__name__} failed on attempt {attempt + 1}/{max_retries + 1}: {e}")
                 logger.info(f"⏳ Retrying in {delay:.2f} seconds...")
                 time.sleep(delay)
@@ -213,12 +204,9 @@ async def _execute_with_retry_async(
     args: tuple,
     kwargs: dict,
     max_retries: int,
-    base_delay: float,
-    max_delay: float,
-    exponential_base: float,
+    delays: Tuple[float, ...],
     jitter: bool,
-    retryable_exceptions: Tuple[Type[Exception], ...],
-    non_retryable_exceptions: Tuple[Type[Exception], ...],
+    should_retry: Callable[[Exception, int], bool],
 ) -> Any:
     """Execute async function with retry logic."""
 
@@ -238,13 +226,13 @@ async def _execute_with_retry_async(
             last_exception = e
 
             # Check if we should retry
-            if not _should_retry(e, attempt, max_retries, retryable_exceptions, non_retryable_exceptions):
+            if not should_retry(e, attempt):
                 logger.error(f"❌ Async function {func.__name__} failed on attempt {attempt + 1}, not retrying: {e}")
                 raise
 
             # Calculate delay for next attempt
             if attempt < max_retries:
-                delay = _calculate_delay(attempt, base_delay, max_delay, exponential_base, jitter)
+                delay = _calculate_delay(attempt, delays, jitter)
                 logger.warning(f"⚠️ Async function {func.__name__} failed on attempt {attempt + 1}/{max_retries + 1}: {e}")
                 logger.info(f"⏳ Retrying in {delay:.2f} seconds...")
                 await asyncio.sleep(delay)
@@ -43,7 +43,11 @@ class SingletonConfigManager:
 
 def get_config() -> GlobalConfigManager:
     """Get singleton configuration instance."""
-    return SingletonConfigManager()
+    # Warm path: read the instance directly instead of dispatching through __new__
+    instance = SingletonConfigManager._instance
+    if instance is None:
+        instance = SingletonConfigManager()
+    return instance
 
 
 def initialize_config(working_dir: Optional[str] = None, strict_validation: bool = True) -> GlobalConfigManager:
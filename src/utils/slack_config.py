@@ -7,6 +7,7 @@ and notification preferences with proper security controls.
 """
 
 import os
+import sys
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, List, Optional
@@ -15,6 +16,9 @@ from src.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__ of config objects
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class MessagePriority(str, Enum):
     """Message priority levels for Slack notifications."""
@@ -25,7 +29,7 @@ class MessagePriority(str, Enum):
     URGENT = "urgent"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class SlackChannelConfig:
     """Configuration for a specific Slack channel."""
 
@@ -39,7 +43,7 @@ class SlackChannelConfig:
             self.priorities = list(MessagePriority)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class SlackConfig:
     """
     Configuration for Slack integration.
@@ -238,6 +242,8 @@ class SlackConfigManager:
     def __init__(self):
         self._config: Optional[SlackConfig] = None
         self._config_loaded = False
+        # is_enabled() of the loaded config, so is_configured() is a flag read
+        self._is_configured = False
 
     def get_config(self, force_reload: bool = False) -> SlackConfig:
         """
@@ -256,6 +262,7 @@ class SlackConfigManager:
             try:
                 self._config = SlackConfig.from_environment()
                 self._config_loaded = True
+                self._is_configured = self._config.is_enabled()
 
                 # Validate configuration
                 validation = self._config.validate_configuration()
@@ -277,6 +284,7 @@ class SlackConfigManager:
             except Exception as e:
                 logger.error(f"❌ Failed to load Slack configuration: {e}")
                 # Create disabled config as fallback
+                self._is_configured = False
                 self._config = SlackConfig(bot_token="", enabled=False)
                 self._config_loaded = True
 
@@ -284,11 +292,12 @@ class SlackConfigManager:
 
     def is_configured(self) -> bool:
         """Check if Slack is properly configured."""
-        try:
-            config = self.get_config()
-            return config.is_enabled()
-        except Exception:
-            return False
+        if not self._config_loaded:
+            try:
+                self.get_config()
+            except Exception:
+                return False
+        return self._is_configured
 
     def reload_config(self) -> SlackConfig:
         """Force reload configuration from environment."""
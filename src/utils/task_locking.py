@@ -5,20 +5,47 @@ Implements atomic task claiming and safe concurrency control mechanisms
 to prevent duplicate task processing in multi-poller environments.
 """
 
-import hashlib
+import functools
+import heapq
+import itertools
+import os
+import random
+import sys
 import threading
 import time
 import uuid
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
+from time import monotonic_ns
 from typing import Any, Dict, List, Optional, Tuple
 
 from src.utils.logging_config import get_logger
+from src.utils.task_status import TaskStatus
 
 logger = get_logger(__name__)
 
+# Number of independently locked shards in InMemoryTaskLockManager (power of two)
+LOCK_SHARDS = 16
+
+# Lock timestamps are time.monotonic_ns() values; one minute in that unit
+NANOS_PER_MINUTE = 60_000_000_000
+
+# Backoff for database lock retries that lost a race: the first retry only yields,
+# later ones wait LOCK_RETRY_BASE_DELAY seconds doubling per attempt up to LOCK_RETRY_MAX_DELAY
+LOCK_RETRY_BASE_DELAY = 0.05
+LOCK_RETRY_MAX_DELAY = 1.0
+
+# Status values used as the database lock's compare-and-swap states, interned so that
+# comparisons against other interned copies short-circuit on identity
+_QUEUED_STATUS = sys.intern(TaskStatus.QUEUED_TO_RUN.value)
+_IN_PROGRESS_STATUS = sys.intern(TaskStatus.IN_PROGRESS.value)
+
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__ of locks and results
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class LockResult(str, Enum):
     """Results of lock operations."""
@@ -40,32 +67,58 @@ class LockState(str, Enum):
     EXPIRED = "expired"
 
 
-@dataclass
+@functools.lru_cache(maxsize=8)
+def _timeout_delta(minutes: int) -> timedelta:
+    """Shared timedelta for a lock timeout; nearly every caller uses the same few values."""
+    return timedelta(minutes=minutes)
+
+
+def _monotonic_ns_from_datetime(moment: datetime) -> int:
+    """Translate a wall-clock datetime onto this process's time.monotonic_ns() clock."""
+    return monotonic_ns() + int((moment - datetime.now()).total_seconds() * 1e9)
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class TaskLock:
-    """Represents a task lock with metadata."""
+    """
+    Represents a task lock with metadata.
+
+    locked_at and expires_at are time.monotonic_ns() readings, so expiry checks
+    are integer comparisons and unaffected by wall-clock changes. Use
+    locked_at_datetime/expires_at_datetime for display.
+    """
 
     task_id: str
     owner_id: str
-    locked_at: datetime
-    expires_at: datetime
+    locked_at: int
+    expires_at: int
     lock_version: int = 1
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-    def is_expired(self) -> bool:
-        """Check if the lock has expired."""
-        return datetime.now() > self.expires_at
+    def is_expired(self, now: Optional[int] = None) -> bool:
+        """Check if the lock has expired, optionally at a monotonic_ns() reading the caller already took."""
+        return (monotonic_ns() if now is None else now) > self.expires_at
 
-    def is_stale(self, stale_timeout_minutes: int = 30) -> bool:
+    def is_stale(self, stale_timeout_minutes: int = 30, now: Optional[int] = None) -> bool:
         """Check if the lock is stale (older than stale timeout)."""
-        stale_threshold = datetime.now() - timedelta(minutes=stale_timeout_minutes)
-        return self.locked_at < stale_threshold
+        return (monotonic_ns() if now is None else now) - self.locked_at > stale_timeout_minutes * NANOS_PER_MINUTE
 
     def time_remaining(self) -> timedelta:
         """Get remaining time before lock expires."""
-        return max(timedelta(0), self.expires_at - datetime.now())
+        return timedelta(microseconds=max(0, self.expires_at - monotonic_ns()) // 1000)
+
+    @property
+    def locked_at_datetime(self) -> datetime:
+        """Wall-clock time the lock was taken."""
+        return datetime.now() - timedelta(microseconds=(monotonic_ns() - self.locked_at) // 1000)
 
+    @property
+    def expires_at_datetime(self) -> datetime:
+        """Wall-clock time the lock expires."""
+        return datetime.now() + timedelta(microseconds=(self.expires_at - monotonic_ns()) // 1000)
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class LockAttemptResult:
     """Result of a lock attempt operation."""
 
@@ -76,7 +129,7 @@ class LockAttemptResult:
     retry_after_seconds: Optional[int] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class LockMetrics:
     """Metrics for lock operations."""
 
@@ -119,6 +172,22 @@ class TaskLockManager(ABC):
         """
         pass
 
+    def try_lock_many(self, task_ids: List[str], owner_id: str, timeout_minutes: int = 30) -> List[LockAttemptResult]:
+        """
+        Attempt to acquire locks on several tasks.
+
+        Managers that can lock in bulk override this; the default tries each task in turn.
+
+        Args:
+            task_ids: Task identifiers to lock
+            owner_id: Unique identifier for the lock owner
+            timeout_minutes: Lock timeout in minutes
+
+        Returns:
+            One LockAttemptResult per task, in the order of task_ids
+        """
+        return [self.try_lock_task(task_id, owner_id, timeout_minutes) for task_id in task_ids]
+
     @abstractmethod
     def release_lock(self, task_id: str, owner_id: str) -> bool:
         """
@@ -172,156 +241,256 @@ class InMemoryTaskLockManager(TaskLockManager):
     """
 
     def __init__(self):
-        self._locks: Dict[str, TaskLock] = {}
-        self._lock_mutex = threading.RLock()
+        # Locks are sharded by task_id so operations on unrelated tasks do not contend
+        self._shards: List[Dict[str, TaskLock]] = [{} for _ in range(LOCK_SHARDS)]
+        self._shard_mutexes = [threading.RLock() for _ in range(LOCK_SHARDS)]
+
+        # Per-shard min-heaps of (expires_at | locked_at, sequence, task_id, lock) so cleanup only
+        # visits locks that are due. Entries for released or renewed locks are skipped when popped.
+        # Lock-free claims cannot push onto a heap, so they append to the shard's pending list and
+        # the next holder of the shard mutex indexes them.
+        self._expiry_heaps: List[List[Tuple[int, int, str, TaskLock]]] = [[] for _ in range(LOCK_SHARDS)]
+        self._age_heaps: List[List[Tuple[int, int, str, TaskLock]]] = [[] for _ in range(LOCK_SHARDS)]
+        self._pending_locks: List[List[TaskLock]] = [[] for _ in range(LOCK_SHARDS)]
+        self._heap_sequence = itertools.count()
+
+        self._metrics_lock = threading.Lock()  # Guards _metrics and the lock duration totals only
         self._metrics = LockMetrics()
-        self._lock_durations: List[float] = []
+        self._lock_duration_total = 0.0
+        self._lock_duration_count = 0
 
         logger.info("🔒 InMemoryTaskLockManager initialized")
 
-    def try_lock_task(self, task_id: str, owner_id: str, timeout_minutes: int = 30) -> LockAttemptResult:
-        """Attempt to acquire a lock on a task."""
-        start_time = time.time()
-
-        with self._lock_mutex:
-            self._metrics.total_attempts += 1
+    @staticmethod
+    def _shard(task_id: str) -> int:
+        """Return the index of the shard holding a task's lock."""
+        return hash(task_id) & (LOCK_SHARDS - 1)
 
-            try:
-                # Check if task is already locked
-                existing_lock = self._locks.get(task_id)
-
-                if existing_lock:
-                    # Check if lock is expired or stale
-                    if existing_lock.is_expired():
-                        logger.info(f"🕐 Removing expired lock for task {task_id}")
-                        del self._locks[task_id]
-                        existing_lock = None
-                    elif existing_lock.is_stale():
-                        logger.warning(f"🚨 Removing stale lock for task {task_id} (owned by {existing_lock.owner_id})")
-                        del self._locks[task_id]
-                        self._metrics.stale_locks_cleaned += 1
-                        existing_lock = None
-                    elif existing_lock.owner_id == owner_id:
-                        # Same owner trying to re-lock - update expiration
-                        existing_lock.expires_at = datetime.now() + timedelta(minutes=timeout_minutes)
-                        existing_lock.lock_version += 1
-
-                        logger.info(f"🔄 Renewed lock for task {task_id} by owner {owner_id}")
-                        return LockAttemptResult(result=LockResult.SUCCESS, task_lock=existing_lock)
-                    else:
-                        # Task is locked by someone else
-                        self._metrics.failed_locks += 1
-                        retry_after = int(existing_lock.time_remaining().total_seconds())
-
-                        logger.debug(f"🚫 Task {task_id} already locked by {existing_lock.owner_id}")
-                        return LockAttemptResult(
-                            result=LockResult.ALREADY_LOCKED,
-                            existing_owner=existing_lock.owner_id,
-                            retry_after_seconds=max(60, retry_after),  # At least 1 minute
-                        )
-
-                # Create new lock
-                now = datetime.now()
-                new_lock = TaskLock(
-                    task_id=task_id,
-                    owner_id=owner_id,
-                    locked_at=now,
-                    expires_at=now + timedelta(minutes=timeout_minutes),
-                    lock_version=1,
-                    metadata={
-                        "lock_attempt_duration": time.time() - start_time,
-                        "created_by": "InMemoryTaskLockManager",
-                    },
-                )
+    def try_lock_task(self, task_id: str, owner_id: str, timeout_minutes: int = 30) -> LockAttemptResult:
+        """
+        Attempt to acquire a lock on a task.
 
-                self._locks[task_id] = new_lock
-                self._metrics.successful_locks += 1
+        Claiming an unlocked task is a single dict.setdefault, which only inserts
+        when the key is absent and so acts as a compare-and-swap without taking the
+        shard mutex. Renewals, contention and expired/stale locks go through the
+        shard mutex; every removal happens under it, so a lock seen there cannot be
+        replaced until it is removed.
+        """
+        result, successful, failed = self._claim(self._shard(task_id), task_id, owner_id, timeout_minutes)
+        self._count_attempts(1, successful, failed)
+        return result
+
+    def try_lock_many(self, task_ids: List[str], owner_id: str, timeout_minutes: int = 30) -> List[LockAttemptResult]:
+        """Lock several tasks, taking each shard's mutex once and updating metrics once for the batch."""
+        positions_by_shard: Dict[int, List[int]] = {}
+        for position, task_id in enumerate(task_ids):
+            positions_by_shard.setdefault(self._shard(task_id), []).append(position)
+
+        results: List[Optional[LockAttemptResult]] = [None] * len(task_ids)
+        successful = failed = 0
+        for shard_index, positions in positions_by_shard.items():
+            with self._shard_mutexes[shard_index]:
+                for position in positions:
+                    result, claimed, refused = self._claim(shard_index, task_ids[position], owner_id, timeout_minutes)
+                    results[position] = result
+                    successful += claimed
+                    failed += refused
+
+        self._count_attempts(len(task_ids), successful, failed)
+        return results
+
+    def _claim(self, shard_index: int, task_id: str, owner_id: str, timeout_minutes: int) -> Tuple[LockAttemptResult, int, int]:
+        """Try to lock one task; returns the result plus its successful/failed metric increments."""
+        start_time = time.time()
+        locks = self._shards[shard_index]
 
-                logger.info(f"✅ Successfully locked task {task_id} for owner {owner_id} (expires in {timeout_minutes} minutes)")
+        try:
+            now = monotonic_ns()
+            new_lock = TaskLock(
+                task_id=task_id,
+                owner_id=owner_id,
+                locked_at=now,
+                expires_at=now + timeout_minutes * NANOS_PER_MINUTE,
+                lock_version=1,
+                metadata={
+                    "lock_attempt_duration": time.time() - start_time,
+                    "created_by": "InMemoryTaskLockManager",
+                },
+            )
 
-                return LockAttemptResult(result=LockResult.SUCCESS, task_lock=new_lock)
+            existing_lock = locks.setdefault(task_id, new_lock)
+            if existing_lock is not new_lock:
+                with self._shard_mutexes[shard_index]:
+                    # One clock reading serves every check below; waiting for the mutex may have taken a while
+                    now = monotonic_ns()
+                    while existing_lock is not new_lock:
+                        # Check if lock is expired or stale
+                        if existing_lock.is_expired(now):
+                            logger.info("🕐 Removing expired lock for task %s", task_id)
+                            del locks[task_id]
+                        elif existing_lock.is_stale(now=now):
+                            logger.warning("🚨 Removing stale lock for task %s (owned by %s)", task_id, existing_lock.owner_id)
+                            del locks[task_id]
+                            with self._metrics_lock:
+                                self._metrics.stale_locks_cleaned += 1
+                        elif existing_lock.owner_id == owner_id:
+                            # Same owner trying to re-lock - update expiration
+                            existing_lock.expires_at = now + timeout_minutes * NANOS_PER_MINUTE
+                            existing_lock.lock_version += 1
+                            self._push_expiry(shard_index, existing_lock)
+
+                            logger.info("🔄 Renewed lock for task %s by owner %s", task_id, owner_id)
+                            return LockAttemptResult(result=LockResult.SUCCESS, task_lock=existing_lock), 0, 0
+                        else:
+                            # Task is locked by someone else
+                            retry_after = (existing_lock.expires_at - now) // 1_000_000_000
+
+                            logger.debug("🚫 Task %s already locked by %s", task_id, existing_lock.owner_id)
+                            attempt = LockAttemptResult(
+                                result=LockResult.ALREADY_LOCKED,
+                                existing_owner=existing_lock.owner_id,
+                                retry_after_seconds=max(60, retry_after),  # At least 1 minute
+                            )
+                            return attempt, 0, 1
+
+                        # The old lock is gone; a lock-free claim may have won the slot meanwhile
+                        existing_lock = locks.setdefault(task_id, new_lock)
+
+            self._pending_locks[shard_index].append(new_lock)
+
+            logger.info("✅ Successfully locked task %s for owner %s (expires in %s minutes)", task_id, owner_id, timeout_minutes)
+
+            return LockAttemptResult(result=LockResult.SUCCESS, task_lock=new_lock), 1, 0
 
-            except Exception as e:
-                self._metrics.failed_locks += 1
-                logger.error(f"❌ Error attempting to lock task {task_id}: {e}")
+        except Exception as e:
+            logger.error("❌ Error attempting to lock task %s: %s", task_id, e)
 
-                return LockAttemptResult(result=LockResult.ERROR, error_message=str(e))
+            return LockAttemptResult(result=LockResult.ERROR, error_message=str(e)), 0, 1
 
     def release_lock(self, task_id: str, owner_id: str) -> bool:
         """Release a lock on a task."""
-        with self._lock_mutex:
+        shard_index = self._shard(task_id)
+        locks = self._shards[shard_index]
+
+        with self._shard_mutexes[shard_index]:
             try:
-                existing_lock = self._locks.get(task_id)
+                existing_lock = locks.get(task_id)
 
                 if not existing_lock:
-                    logger.warning(f"⚠️ Attempted to release non-existent lock for task {task_id}")
+                    logger.warning("⚠️ Attempted to release non-existent lock for task %s", task_id)
                     return False
 
                 if existing_lock.owner_id != owner_id:
-                    logger.error(f"🚫 Cannot release lock for task {task_id}: owned by {existing_lock.owner_id}, not {owner_id}")
+                    logger.error("🚫 Cannot release lock for task %s: owned by %s, not %s", task_id, existing_lock.owner_id, owner_id)
                     return False
 
-                # Calculate lock duration for metrics
-                lock_duration = (datetime.now() - existing_lock.locked_at).total_seconds()
-                self._lock_durations.append(lock_duration)
-
-                # Keep only recent durations for average calculation
-                if len(self._lock_durations) > 1000:
-                    self._lock_durations = self._lock_durations[-500:]
-
-                # Update average lock duration
-                if self._lock_durations:
-                    self._metrics.average_lock_duration = sum(self._lock_durations) / len(self._lock_durations)
-
-                del self._locks[task_id]
-
-                logger.info(f"🔓 Released lock for task {task_id} by owner {owner_id} (held for {lock_duration:.1f}s)")
-                return True
+                del locks[task_id]
+                self._index_pending_locks(shard_index)
 
             except Exception as e:
-                logger.error(f"❌ Error releasing lock for task {task_id}: {e}")
+                logger.error("❌ Error releasing lock for task %s: %s", task_id, e)
                 return False
 
-    def get_task_lock(self, task_id: str) -> Optional[TaskLock]:
-        """Get current lock information for a task."""
-        with self._lock_mutex:
-            lock = self._locks.get(task_id)
+        # Calculate lock duration for metrics
+        lock_duration = (monotonic_ns() - existing_lock.locked_at) / 1e9
+        with self._metrics_lock:
+            self._lock_duration_total += lock_duration
+            self._lock_duration_count += 1
+            self._metrics.average_lock_duration = self._lock_duration_total / self._lock_duration_count
 
-            if lock and lock.is_expired():
-                logger.info(f"🕐 Removing expired lock for task {task_id}")
-                del self._locks[task_id]
-                return None
+        logger.info("🔓 Released lock for task %s by owner %s (held for %.1fs)", task_id, owner_id, lock_duration)
+        return True
 
-            return lock
-
-    def cleanup_stale_locks(self, stale_timeout_minutes: int = 30) -> int:
-        """Clean up stale/expired locks."""
-        with self._lock_mutex:
-            stale_tasks = []
-            now = datetime.now()
+    def get_task_lock(self, task_id: str) -> Optional[TaskLock]:
+        """Get current lock information for a task; only evicting an expired lock takes the shard mutex."""
+        shard_index = self._shard(task_id)
+        locks = self._shards[shard_index]
 
-            for task_id, lock in self._locks.items():
-                if lock.is_expired() or lock.is_stale(stale_timeout_minutes):
-                    stale_tasks.append(task_id)
+        lock = locks.get(task_id)
+        if lock is None or not lock.is_expired():
+            return lock
 
-            for task_id in stale_tasks:
-                lock = self._locks[task_id]
-                del self._locks[task_id]
+        with self._shard_mutexes[shard_index]:
+            # Evict only the lock we saw; it may have been renewed or replaced meanwhile
+            if locks.get(task_id) is lock and lock.is_expired():
+                logger.info("🕐 Removing expired lock for task %s", task_id)
+                del locks[task_id]
+        return None
 
-                if lock.is_expired():
-                    logger.info(f"🧹 Cleaned up expired lock for task {task_id} (expired {(now - lock.expires_at).total_seconds():.0f}s ago)")
-                else:
-                    logger.warning(f"🧹 Cleaned up stale lock for task {task_id} (locked {(now - lock.locked_at).total_seconds():.0f}s ago)")
+    def cleanup_stale_locks(self, stale_timeout_minutes: int = 30) -> int:
+        """
+        Clean up stale/expired locks, one shard at a time so the others stay available.
 
-            if stale_tasks:
-                self._metrics.stale_locks_cleaned += len(stale_tasks)
-                logger.info(f"🧹 Cleaned up {len(stale_tasks)} stale/expired locks")
+        Only locks that are due are visited: each shard's expiry and age heaps are
+        popped until their head is still in the future.
+        """
+        cleaned = 0
+
+        for shard_index, (locks, mutex) in enumerate(zip(self._shards, self._shard_mutexes)):
+            with mutex:
+                self._index_pending_locks(shard_index)
+                now = monotonic_ns()
+
+                expiry_heap = self._expiry_heaps[shard_index]
+                while expiry_heap and expiry_heap[0][0] < now:
+                    expires_at, _, task_id, lock = heapq.heappop(expiry_heap)
+                    if locks.get(task_id) is lock and lock.expires_at == expires_at:
+                        del locks[task_id]
+                        cleaned += 1
+                        logger.info("🧹 Cleaned up expired lock for task %s (expired %.0fs ago)", task_id, (now - lock.expires_at) / 1e9)
+
+                age_heap = self._age_heaps[shard_index]
+                stale_before = now - stale_timeout_minutes * NANOS_PER_MINUTE
+                while age_heap and age_heap[0][0] < stale_before:
+                    _, _, task_id, lock = heapq.heappop(age_heap)
+                    if locks.get(task_id) is lock:
+                        del locks[task_id]
+                        cleaned += 1
+                        logger.warning("🧹 Cleaned up stale lock for task %s (locked %.0fs ago)", task_id, (now - lock.locked_at) / 1e9)
+
+        if cleaned:
+            with self._metrics_lock:
+                self._metrics.stale_locks_cleaned += cleaned
+            logger.info("🧹 Cleaned up %s stale/expired locks", cleaned)
+
+        return cleaned
+
+    def _push_expiry(self, shard_index: int, lock: TaskLock):
+        """Index a lock's current expiry; the caller holds the shard mutex."""
+        heapq.heappush(self._expiry_heaps[shard_index], (lock.expires_at, next(self._heap_sequence), lock.task_id, lock))
+
+    def _index_pending_locks(self, shard_index: int):
+        """
+        Move locks claimed without the mutex into the shard's heaps; the caller holds the shard mutex.
 
-            return len(stale_tasks)
+        Also drops dead heap entries once they outnumber live locks, so the heaps stay
+        bounded even if cleanup_stale_locks is never called.
+        """
+        pending = self._pending_locks[shard_index]
+        if pending:
+            claimed = pending[:]
+            del pending[: len(claimed)]
+            age_heap = self._age_heaps[shard_index]
+            for lock in claimed:
+                self._push_expiry(shard_index, lock)
+                heapq.heappush(age_heap, (lock.locked_at, next(self._heap_sequence), lock.task_id, lock))
+
+        locks = self._shards[shard_index]
+        for heap in (self._expiry_heaps[shard_index], self._age_heaps[shard_index]):
+            if len(heap) > 2 * len(locks) + 64:
+                heap[:] = [entry for entry in heap if locks.get(entry[2]) is entry[3]]
+                heapq.heapify(heap)
+
+    def _count_attempts(self, attempts: int, successful: int, failed: int):
+        """Record lock attempts and their outcomes with a single metrics-lock acquisition."""
+        with self._metrics_lock:
+            self._metrics.total_attempts += attempts
+            self._metrics.successful_locks += successful
+            self._metrics.failed_locks += failed
 
     def get_metrics(self) -> LockMetrics:
         """Get lock operation metrics."""
-        with self._lock_mutex:
+        with self._metrics_lock:
             # Update contention rate
             if self._metrics.total_attempts > 0:
                 contention_failures = self._metrics.failed_locks - self._metrics.stale_locks_cleaned
@@ -338,17 +507,28 @@ class InMemoryTaskLockManager(TaskLockManager):
             )
 
     def get_active_locks(self) -> Dict[str, TaskLock]:
-        """Get all currently active locks."""
-        with self._lock_mutex:
-            return self._locks.copy()
+        """
+        Get all currently active locks.
+
+        Takes no shard mutex: copying a dict is a single C-level operation under the
+        GIL, so each shard is read as a consistent point-in-time snapshot.
+        """
+        active_locks: Dict[str, TaskLock] = {}
+        for locks in self._shards:
+            active_locks.update(locks)
+        return active_locks
 
     def force_release_all_locks(self) -> int:
         """Force release all locks (for testing/emergency use)."""
-        with self._lock_mutex:
-            count = len(self._locks)
-            self._locks.clear()
-            logger.warning(f"🚨 Force released all {count} locks")
-            return count
+        count = 0
+        for shard_index, (locks, mutex) in enumerate(zip(self._shards, self._shard_mutexes)):
+            with mutex:
+                count += len(locks)
+                locks.clear()
+                self._expiry_heaps[shard_index].clear()
+                self._age_heaps[shard_index].clear()
+        logger.warning("🚨 Force released all %s locks", count)
+        return count
 
 
 class DatabaseTaskLockManager(TaskLockManager):
@@ -368,16 +548,15 @@ class DatabaseTaskLockManager(TaskLockManager):
         self._metrics = LockMetrics()
         self._instance_id = self._generate_instance_id()
 
-        logger.info(f"🔒 DatabaseTaskLockManager initialized (instance: {self._instance_id})")
+        logger.info("🔒 DatabaseTaskLockManager initialized (instance: %s)", self._instance_id)
 
-    def _generate_instance_id(self) -> str:
+    @staticmethod
+    def _generate_instance_id() -> str:
         """Generate unique instance identifier."""
-        # Use combination of timestamp and random UUID
-        timestamp = str(int(time.time() * 1000))
-        unique_id = str(uuid.uuid4())[:8]
-        return f"poller-{timestamp}-{unique_id}"
+        # Process id, start time and 32 random bits keep ids unique across hosts and restarts
+        return f"poller-{os.getpid()}-{time.time_ns() // 1_000_000}-{uuid.uuid4().int & 0xFFFFFFFF:08x}"
 
-    def try_lock_task(self, task_id: str, owner_id: str, timeout_minutes: int = 30) -> LockAttemptResult:
+    def try_lock_task(self, task_id: str, owner_id: str, timeout_minutes: int = 30, max_retries: int = 3) -> LockAttemptResult:
         """
         Attempt to acquire a lock on a task using database-level atomic operations.
 
@@ -385,94 +564,105 @@ class DatabaseTaskLockManager(TaskLockManager):
         - Only tasks with 'Queued' status can be locked
         - Locking changes status to 'In progress' atomically
         - Owner information is stored in metadata
+
+        A failed update on a task that still reads 'Queued to run' lost a race with
+        a concurrent writer rather than a real conflict, so it is retried up to
+        max_retries times with jittered exponential backoff.
         """
-        start_time = time.time()
         self._metrics.total_attempts += 1
 
         try:
-            # Create lock metadata
-            now = datetime.now()
-            lock_metadata = {
-                "locked_by": owner_id,
-                "locked_at": now.isoformat(),
-                "expires_at": (now + timedelta(minutes=timeout_minutes)).isoformat(),
-                "instance_id": self._instance_id,
-                "lock_version": 1,
-            }
-
-            # Attempt atomic status update from 'Queued' to 'In progress'
-            # This serves as the locking mechanism
-            success = self._atomic_status_update(
+            # Timestamps stay monotonic ints on the lock; ISO strings are only built when persisted
+            now = monotonic_ns()
+            task_lock = TaskLock(
                 task_id=task_id,
-                from_status="Queued to run",
-                to_status="In progress",
-                lock_metadata=lock_metadata,
+                owner_id=owner_id,
+                locked_at=now,
+                expires_at=now + timeout_minutes * NANOS_PER_MINUTE,
+                lock_version=1,
+                metadata={"locked_by": owner_id, "instance_id": self._instance_id, "lock_version": 1},
             )
 
-            if success:
-                task_lock = TaskLock(
+            # Attempt atomic status update from 'Queued' to 'In progress'
+            # This serves as the locking mechanism
+            for attempt in range(max_retries + 1):
+                success = self._atomic_status_update(
                     task_id=task_id,
-                    owner_id=owner_id,
-                    locked_at=now,
-                    expires_at=now + timedelta(minutes=timeout_minutes),
-                    lock_version=1,
-                    metadata=lock_metadata,
+                    from_status=_QUEUED_STATUS,
+                    to_status=_IN_PROGRESS_STATUS,
+                    task_lock=task_lock,
                 )
+                if success:
+                    break
+
+                # Check if task is in different state (might be already locked)
+                task_status = self._get_task_status(task_id)
+                if task_status != _QUEUED_STATUS or attempt == max_retries:
+                    break
 
+                logger.debug("🔁 Lost race locking task %s, retry %s/%s", task_id, attempt + 1, max_retries)
+                time.sleep(self._retry_delay(attempt))
+
+            if success:
                 self._metrics.successful_locks += 1
 
-                logger.info(f"✅ Successfully locked task {task_id} for owner {owner_id} via database")
+                logger.info("✅ Successfully locked task %s for owner %s via database", task_id, owner_id)
 
                 return LockAttemptResult(result=LockResult.SUCCESS, task_lock=task_lock)
-            else:
-                # Check if task is in different state (might be already locked)
-                task_status = self._get_task_status(task_id)
-
-                if task_status == "In progress":
-                    # Task is already being processed
-                    existing_owner = self._get_task_lock_owner(task_id)
-                    self._metrics.failed_locks += 1
+            elif task_status == _IN_PROGRESS_STATUS:
+                # Task is already being processed
+                existing_owner = self._get_task_lock_owner(task_id)
+                self._metrics.failed_locks += 1
 
-                    logger.debug(f"🚫 Task {task_id} already locked (in progress) by {existing_owner}")
+                logger.debug("🚫 Task %s already locked (in progress) by %s", task_id, existing_owner)
 
-                    return LockAttemptResult(
-                        result=LockResult.ALREADY_LOCKED,
-                        existing_owner=existing_owner,
-                        retry_after_seconds=300,  # 5 minutes
-                    )
-                else:
-                    # Task might not exist or be in invalid state
-                    self._metrics.failed_locks += 1
+                return LockAttemptResult(
+                    result=LockResult.ALREADY_LOCKED,
+                    existing_owner=existing_owner,
+                    retry_after_seconds=300,  # 5 minutes
+                )
+            else:
+                # Task might not exist or be in invalid state
+                self._metrics.failed_locks += 1
 
-                    logger.warning(f"⚠️ Cannot lock task {task_id}: current status is {task_status}")
+                logger.warning("⚠️ Cannot lock task %s: current status is %s", task_id, task_status)
 
-                    return LockAttemptResult(
-                        result=LockResult.INVALID_TASK,
-                        error_message=f"Task status is {task_status}, expected 'Queued to run'",
-                    )
+                return LockAttemptResult(
+                    result=LockResult.INVALID_TASK,
+                    error_message=f"Task status is {task_status}, expected '{_QUEUED_STATUS}'",
+                )
 
         except Exception as e:
             self._metrics.failed_locks += 1
-            logger.error(f"❌ Error attempting to lock task {task_id}: {e}")
+            logger.error("❌ Error attempting to lock task %s: %s", task_id, e)
 
             return LockAttemptResult(result=LockResult.ERROR, error_message=str(e))
 
+    @staticmethod
+    def _retry_delay(attempt: int) -> float:
+        """Delay before retry number attempt + 1 of a lock update that lost a race."""
+        if attempt == 0:
+            return 0.0  # Just yield to the competing writer
+        delay = min(LOCK_RETRY_BASE_DELAY * 2 ** (attempt - 1), LOCK_RETRY_MAX_DELAY)
+        # Add random jitter up to 25% of the delay so competing pollers spread out
+        return delay + delay * 0.25 * random.random()
+
     def release_lock(self, task_id: str, owner_id: str) -> bool:
         """Release a lock by updating task status."""
         try:
             # Verify ownership before releasing
             current_owner = self._get_task_lock_owner(task_id)
             if current_owner != owner_id:
-                logger.error(f"🚫 Cannot release lock for task {task_id}: owned by {current_owner}, not {owner_id}")
+                logger.error("🚫 Cannot release lock for task %s: owned by %s, not %s", task_id, current_owner, owner_id)
                 return False
 
             # Update status back to queued or to done/failed based on context
             # For now, we'll assume the calling code manages the final status
-            logger.info(f"🔓 Lock released for task {task_id} by owner {owner_id} (status transition managed externally)")
+            logger.info("🔓 Lock released for task %s by owner %s (status transition managed externally)", task_id, owner_id)
             return True
 
         except Exception as e:
-            logger.error(f"❌ Error releasing lock for task {task_id}: {e}")
+            logger.error("❌ Error releasing lock for task %s: %s", task_id, e)
             return False
 
     def get_task_lock(self, task_id: str) -> Optional[TaskLock]:
@@ -480,7 +670,7 @@ class DatabaseTaskLockManager(TaskLockManager):
         try:
             status = self._get_task_status(task_id)
 
-            if status == "In progress":
+            if status == _IN_PROGRESS_STATUS:
                 # Task is locked, get lock metadata
                 owner = self._get_task_lock_owner(task_id)
                 lock_metadata = self._get_task_lock_metadata(task_id)
@@ -492,8 +682,8 @@ class DatabaseTaskLockManager(TaskLockManager):
                     return TaskLock(
                         task_id=task_id,
                         owner_id=owner,
-                        locked_at=locked_at,
-                        expires_at=expires_at,
+                        locked_at=_monotonic_ns_from_datetime(locked_at),
+                        expires_at=_monotonic_ns_from_datetime(expires_at),
                         lock_version=lock_metadata.get("lock_version", 1),
                         metadata=lock_metadata,
                     )
@@ -501,7 +691,7 @@ class DatabaseTaskLockManager(TaskLockManager):
             return None
 
         except Exception as e:
-            logger.error(f"❌ Error getting lock for task {task_id}: {e}")
+            logger.error("❌ Error getting lock for task %s: %s", task_id, e)
             return None
 
     def cleanup_stale_locks(self, stale_timeout_minutes: int = 30) -> int:
@@ -515,25 +705,35 @@ class DatabaseTaskLockManager(TaskLockManager):
             return 0
 
         except Exception as e:
-            logger.error(f"❌ Error cleaning up stale locks: {e}")
+            logger.error("❌ Error cleaning up stale locks: %s", e)
             return 0
 
     def get_metrics(self) -> LockMetrics:
         """Get lock operation metrics."""
         return self._metrics
 
-    def _atomic_status_update(self, task_id: str, from_status: str, to_status: str, lock_metadata: Dict[str, Any]) -> bool:
+    @staticmethod
+    def _lock_metadata_record(task_lock: TaskLock) -> Dict[str, Any]:
+        """Lock metadata in the shape persisted with the task; the ISO timestamps are only formatted here."""
+        return {
+            **task_lock.metadata,
+            "locked_at": task_lock.locked_at_datetime.isoformat(),
+            "expires_at": task_lock.expires_at_datetime.isoformat(),
+        }
+
+    def _atomic_status_update(self, task_id: str, from_status: str, to_status: str, task_lock: TaskLock) -> bool:
         """
         Perform atomic status update (compare-and-swap operation).
 
         This is a placeholder for the actual database implementation.
-        The real implementation would use database-specific atomic operations.
+        The real implementation would use database-specific atomic operations
+        and store _lock_metadata_record(task_lock) alongside the new status.
         """
         # This would be implemented using database-specific atomic operations
         # For example, in SQL: UPDATE tasks SET status = ? WHERE id = ? AND status = ?
         # Returns True only if exactly one row was updated
 
-        logger.debug(f"🔄 Atomic status update for task {task_id}: {from_status} -> {to_status}")
+        logger.debug("🔄 Atomic status update for task %s: %s -> %s", task_id, from_status, to_status)
 
         # Placeholder implementation - would be replaced with actual database call
         return True  # Simulated success
@@ -541,7 +741,7 @@ class DatabaseTaskLockManager(TaskLockManager):
     def _get_task_status(self, task_id: str) -> Optional[str]:
         """Get current status of a task."""
         # Placeholder - would query database for task status
-        return "Queued to run"  # Simulated status
+        return _QUEUED_STATUS  # Simulated status
 
     def _get_task_lock_owner(self, task_id: str) -> Optional[str]:
         """Get the owner of a task lock."""
@@ -554,7 +754,7 @@ class DatabaseTaskLockManager(TaskLockManager):
         return {
             "locked_by": self._instance_id,
             "locked_at": datetime.now().isoformat(),
-            "expires_at": (datetime.now() + timedelta(minutes=30)).isoformat(),
+            "expires_at": (datetime.now() + _timeout_delta(30)).isoformat(),
             "instance_id": self._instance_id,
             "lock_version": 1,
         }
@@ -589,30 +789,19 @@ class TaskLockManagerFactory:
 # Utility functions for common locking patterns
 
 
+@contextmanager
 def with_task_lock(lock_manager: TaskLockManager, task_id: str, owner_id: str, timeout_minutes: int = 30):
     """Context manager for task locking."""
+    lock_result = lock_manager.try_lock_task(task_id, owner_id, timeout_minutes)
+    if lock_result.result != LockResult.SUCCESS:
+        raise RuntimeError(f"Failed to acquire lock for task {task_id}: {lock_result.result}")
 
-    class TaskLockContext:
-        def __init__(self):
-            self.lock_result = None
-            self.acquired = False
-
-        def __enter__(self):
-            self.lock_result = lock_manager.try_lock_task(task_id, owner_id, timeout_minutes)
-            self.acquired = self.lock_result.result == LockResult.SUCCESS
-
-            if not self.acquired:
-                raise RuntimeError(f"Failed to acquire lock for task {task_id}: {self.lock_result.result}")
-
-            return self.lock_result.task_lock
-
-        def __exit__(self, exc_type, exc_val, exc_tb):
-            if self.acquired:
-                success = lock_manager.release_lock(task_id, owner_id)
-                if not success:
-                    logger.warning(f"⚠️ Failed to release lock for task {task_id}")
-
-    return TaskLockContext()
+    try:
+        yield lock_result.task_lock
+    finally:
+        success = lock_manager.release_lock(task_id, owner_id)
+        if not success:
+            logger.warning("⚠️ Failed to release lock for task %s", task_id)
 
 
 def safe_task_claim(
@@ -637,13 +826,13 @@ def safe_task_claim(
     """
     try:
         with with_task_lock(lock_manager, task_id, owner_id, timeout_minutes) as task_lock:
-            logger.info(f"🔒 Processing task {task_id} with lock {task_lock.lock_version}")
+            logger.info("🔒 Processing task %s with lock %s", task_id, task_lock.lock_version)
             result = processor_func(task_id)
             return True, result
 
     except RuntimeError as e:
-        logger.warning(f"⚠️ Could not acquire lock for task {task_id}: {e}")
+        logger.warning("⚠️ Could not acquire lock for task %s: %s", task_id, e)
         return False, None
     except Exception as e:
-        logger.error(f"❌ Error processing task {task_id}: {e}")
+        logger.error("❌ Error processing task %s: %s", task_id, e)
         return False, str(e)
@@ -333,6 +333,50 @@ def test_queue_depth_and_status_distribution():
     print("✅ Queue depth and status distribution tests passed")
 
 
+def test_count_by_status():
+    """Test bounded count query used for existence checks."""
+    print("🧪 Testing count by status...")
+
+    mock_client = MockNotionClient()
+    db_ops = DatabaseOperations(mock_client)
+
+    # Empty database
+    assert db_ops.count_by_status(TaskStatus.IN_PROGRESS) == 0
+    assert mock_client.query_count == 1
+
+    # Only the first page is requested
+    mock_tasks = [create_mock_task(f"task-{i:03d}", f"Task {i}", "In progress") for i in range(5)]
+    mock_client.set_mock_tasks(mock_tasks)
+
+    assert db_ops.count_by_status(TaskStatus.IN_PROGRESS) == 1
+    assert db_ops.count_by_status(TaskStatus.IN_PROGRESS, page_size=3) == 3
+    assert mock_client.query_count == 3
+
+    print("✅ Count by status tests passed")
+
+
+def test_iter_queued_tasks():
+    """Test that queued tasks are streamed lazily, one page at a time."""
+    print("🧪 Testing queued task streaming...")
+
+    mock_client = MockNotionClient()
+    db_ops = DatabaseOperations(mock_client)
+
+    mock_tasks = [create_mock_task(f"task-{i:03d}", f"Task {i}", "Queued to run") for i in range(60)]
+    mock_client.set_mock_tasks(mock_tasks)
+
+    stream = db_ops.iter_queued_tasks(page_size=25)
+    first_task = next(stream)
+    assert first_task["id"] == "task-000"
+    assert mock_client.query_count == 1, "Only the first page should be fetched up front"
+
+    remaining = list(stream)
+    assert len(remaining) == 59
+    assert mock_client.query_count == 3, "60 tasks should be fetched in 3 pages of 25"
+
+    print("✅ Queued task streaming tests passed")
+
+
 def test_backward_compatibility():
     """Test that legacy methods still work."""
     print("🧪 Testing backward compatibility...")
@@ -439,6 +483,8 @@ def main():
         test_cache_expiration()
         test_query_metrics()
         test_queue_depth_and_status_distribution()
+        test_count_by_status()
+        test_iter_queued_tasks()
         test_backward_compatibility()
         test_error_handling()
         performance_benchmark()
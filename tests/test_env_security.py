@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Unit tests for environment variable security utilities
+"""
+
+import os
+import sys
+import tempfile
+from unittest.mock import patch
+
+from src.utils.env_security import EnvironmentSecurityManager
+
+
+def test_is_sensitive_variable():
+    """Test that sensitive variable names are detected regardless of case"""
+    manager = EnvironmentSecurityManager()
+
+    for var_name in ["OPENAI_API_KEY", "notion_token", "Client_Secret", "DB_PASSWORD", "AUTH_HEADER", "gcp_credentials"]:
+        assert manager.is_sensitive_variable(var_name), f"{var_name} should be sensitive"
+
+    for var_name in ["NOMAD_HOME", "LOG_LEVEL", "NOTION_BOARD_DB", ""]:
+        assert not manager.is_sensitive_variable(var_name), f"{var_name} should not be sensitive"
+
+    print("✅ Sensitive variable detection test passed")
+
+
+def test_validate_api_key_format():
+    """Test that API key validation reports placeholders, bad prefixes and bad characters"""
+    manager = EnvironmentSecurityManager()
+
+    assert manager.validate_api_key_format("openai", "sk-9f8e7d6c5b4a3f2e1d0c") == (True, [])
+
+    is_valid, issues = manager.validate_api_key_format("openai", "sk-Your_Key_Here-123")
+    assert not is_valid
+    assert issues == ["API key appears to be a placeholder"]
+
+    is_valid, issues = manager.validate_api_key_format("anthropic", "sk-9f8e7d6c5b4a3f2e1d0c")
+    assert issues == ["API key should start with one of: sk-ant-"]
+
+    is_valid, issues = manager.validate_api_key_format("other", "9f8e7d6c<5b4a3f2e1d0c")
+    assert issues == ["API key contains suspicious characters"]
+
+    is_valid, issues = manager.validate_api_key_format("other", "9f8e7d6c\x005b4a3f2e1d0c")
+    assert issues == ["API key contains control characters"]
+    assert manager.validate_api_key_format("other", "9f8e7d6c\t5b4a3f2e1d0c") == (True, [])
+
+    print("✅ API key format validation test passed")
+
+
+def test_validate_notion_token():
+    """Test that Notion tokens need a minimum length whatever their prefix"""
+    manager = EnvironmentSecurityManager()
+
+    assert manager.validate_notion_token("secret_" + "a" * 43)
+    assert manager.validate_notion_token("ntn_" + "a" * 28)
+    assert manager.validate_notion_token("  " + "a" * 32 + "  ")
+
+    for token in ["", "   ", "secret_short", "a" * 31, None]:
+        assert not manager.validate_notion_token(token), f"{token!r} should be rejected"
+
+    print("✅ Notion token validation test passed")
+
+
+def test_validate_notion_database_id():
+    """Test that database IDs are accepted with or without hyphens and rejected otherwise"""
+    manager = EnvironmentSecurityManager()
+
+    assert manager.validate_notion_database_id("0123456789abcdef0123456789ABCDEF")
+    assert manager.validate_notion_database_id(" 01234567-89ab-cdef-0123-456789abcdef\n")
+
+    for db_id in ["", "   ", "0123456789abcdef", "0123456789abcdef0123456789abcdeg", "0x23456789abcdef0123456789abcdef", None]:
+        assert not manager.validate_notion_database_id(db_id), f"{db_id!r} should be rejected"
+
+    print("✅ Notion database ID validation test passed")
+
+
+def test_sanitize_for_logging():
+    """Test that nested sensitive keys and API-key-looking strings are masked"""
+    manager = EnvironmentSecurityManager()
+    data = {
+        "NOTION_TOKEN": "secret_abcdefghijklmnop",
+        "providers": [{"name": "openai", "api_key": None}, "sk-ant-REDACTED"],
+        "comment": "a plain string that is long enough",
+    }
+
+    sanitized = manager.sanitize_for_logging(data)
+
+    assert sanitized["NOTION_TOKEN"] == "secr***************mnop"
+    assert sanitized["providers"][0] == {"name": "openai", "api_key": None}
+    assert sanitized["providers"][1] == manager.mask_sensitive_value("sk-ant-REDACTED")
+    assert sanitized["comment"] == data["comment"]
+    assert data["NOTION_TOKEN"] == "secret_abcdefghijklmnop", "Input must not be modified"
+
+    # Nesting deeper than the recursion limit is handled too
+    deep = current = {}
+    for _ in range(sys.getrecursionlimit() + 100):
+        current["child"] = current = {}
+    current["SECRET"] = "hunter2"
+    sanitized = manager.sanitize_for_logging(deep)
+    for _ in range(sys.getrecursionlimit() + 100):
+        sanitized = sanitized["child"]
+    assert sanitized == {"SECRET": "***"}
+
+    print("✅ Log sanitization test passed")
+
+
+def test_validate_environment_security():
+    """Test that invalid keys are errors and keys exported in the shell get a recommendation"""
+    manager = EnvironmentSecurityManager()
+    config = {
+        "OPENAI_API_KEY": "sk-9f8e7d6c5b4a3f2e1d0c",
+        "ANTHROPIC_API_KEY": "changeme",
+        "NOTION_BOARD_DB": "0123456789abcdef0123456789abcdef",
+        "OPENROUTER_API_KEY": "",
+    }
+
+    with patch.dict("os.environ", {"OPENAI_API_KEY": "sk-9f8e7d6c5b4a3f2e1d0c"}, clear=True):
+        results = manager.validate_environment_security(config)
+
+    assert not results["secure"]
+    assert all(error.startswith("ANTHROPIC_API_KEY: ") for error in results["errors"])
+    assert "ANTHROPIC_API_KEY: API key appears to be a placeholder" in results["errors"]
+    assert results["recommendations"][0] == "Consider using config file instead of shell environment for OPENAI_API_KEY"
+
+    print("✅ Environment security validation test passed")
+
+
+def test_check_environment_leaks():
+    """Test that leak checks flag files containing API key prefixes and skip missing ones"""
+    manager = EnvironmentSecurityManager()
+    original_cwd = os.getcwd()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.chdir(temp_dir)
+        try:
+            os.makedirs(".github/workflows")
+            with open(".github/workflows/ci.yml", "w") as f:
+                f.write("env:\n  OPENAI_API_KEY: sk-ant-abcdefghijklmnop\n")
+            with open("Dockerfile", "w") as f:
+                f.write("FROM python:3.11\n")
+
+            warnings = manager.check_environment_leaks()
+        finally:
+            os.chdir(original_cwd)
+
+    assert warnings == [f"Potential API key found in {os.path.join('.github/workflows', 'ci.yml')}"]
+
+    print("✅ Environment leak check test passed")
+
+
+def test_secure_config_summary_masks_sensitive_values():
+    """Test that the config summary masks sensitive values and keeps the rest"""
+    manager = EnvironmentSecurityManager()
+
+    summary = manager.secure_config_summary({"OPENAI_API_KEY": "sk-abcdefghijklmnop", "ANTHROPIC_API_KEY": "", "LOG_LEVEL": "INFO"})
+
+    assert summary["OPENAI_API_KEY"] == {"set": True, "length": 19, "masked_value": "sk-a***********mnop"}
+    assert summary["ANTHROPIC_API_KEY"] == {"set": False}
+    assert summary["LOG_LEVEL"] == "INFO"
+
+    print("✅ Secure config summary test passed")
+
+
+if __name__ == "__main__":
+    print("🧪 Running environment security unit tests...")
+
+    try:
+        test_is_sensitive_variable()
+        test_validate_api_key_format()
+        test_validate_notion_token()
+        test_validate_notion_database_id()
+        test_sanitize_for_logging()
+        test_validate_environment_security()
+        test_check_environment_leaks()
+        test_secure_config_summary_masks_sensitive_values()
+
+        print("🎉 All unit tests passed successfully!")
+        sys.exit(0)
+
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+
+        traceback.print_exc()
+        sys.exit(1)
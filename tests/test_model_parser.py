@@ -148,6 +148,23 @@ class TestModelParser:
         assert "google" in providers
         assert len(providers) >= 8  # We defined 8 providers
 
+    def test_parse_results_are_cached(self):
+        """Test that repeated parses share one immutable result and strict failures still raise"""
+        first = ModelParser.parse_model_string("anthropic/claude-3-haiku")
+        assert ModelParser.parse_model_string("anthropic/claude-3-haiku") is first
+
+        with pytest.raises(AttributeError):
+            first.provider = "openai"
+
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                ModelParser.parse_model_string("no-separator", strict_validation=True)
+
+        # Empty input in any form shares the default parse result
+        default = ModelParser.parse_model_string(None)
+        assert ModelParser.parse_model_string("  ", strict_validation=False) is default
+        assert default.original_string == ModelParser.DEFAULT_MODEL
+
 
 class TestConvenienceFunctions:
     """Test convenience functions for backward compatibility"""
@@ -191,11 +208,11 @@ class TestParsedModel:
         assert parsed.model == "gpt-4"
         assert parsed.original_string == "openai/gpt-4"
         assert parsed.is_valid is True
-        assert parsed.validation_errors == []
+        assert parsed.validation_errors == ()
 
     def test_parsed_model_with_errors(self):
         """Test ParsedModel with validation errors"""
-        errors = ["Error 1", "Error 2"]
+        errors = ("Error 1", "Error 2")
         parsed = ParsedModel("", "", "invalid", False, errors)
         assert parsed.is_valid is False
         assert len(parsed.validation_errors) == 2
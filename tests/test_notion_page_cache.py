@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Notion client page cache
+"""
+
+import sys
+from unittest.mock import patch
+
+from src.clients.notion_wrapper import PAGE_CACHE_TTL, NotionClientWrapper
+from src.core.managers.status_transition_manager import StatusTransitionManager, TransitionResult
+from src.utils.task_status import TaskStatus
+
+
+def _page(page_id, status, last_edited_time="2024-01-01T10:00:00.000Z"):
+    return {"id": page_id, "last_edited_time": last_edited_time, "properties": {"Status": {"status": {"name": status}}}}
+
+
+def _make_wrapper():
+    with patch("src.clients.notion_wrapper.Client"):
+        wrapper = NotionClientWrapper(token="secret_" + "a" * 43, database_id="a" * 32)
+    wrapper.client.pages.retrieve.side_effect = lambda page_id: _page(page_id, "Queued to run")
+    return wrapper
+
+
+def test_cached_page_expires_after_ttl():
+    """Test that a page is served from memory within the TTL and fetched again after it"""
+    wrapper = _make_wrapper()
+    retrieve = wrapper.client.pages.retrieve
+
+    with patch("src.clients.notion_wrapper.time.monotonic", return_value=100.0) as monotonic:
+        wrapper.get_page("page-1")
+        wrapper.get_page("page-1")
+        assert retrieve.call_count == 1
+
+        monotonic.return_value = 100.0 + PAGE_CACHE_TTL + 0.1
+        wrapper.get_page("page-1")
+        assert retrieve.call_count == 2
+
+    print("✅ Page cache TTL test passed")
+
+
+def test_max_age_zero_bypasses_cache():
+    """Test that max_age=0 always fetches the live page"""
+    wrapper = _make_wrapper()
+
+    wrapper.get_page("page-1")
+    wrapper.get_page("page-1", max_age=0)
+    wrapper.get_page("page-1", max_age=0)
+
+    assert wrapper.client.pages.retrieve.call_count == 3
+    print("✅ Page cache bypass test passed")
+
+
+def test_least_recently_used_page_is_evicted():
+    """Test that the cache keeps at most PAGE_CACHE_SIZE pages and evicts the least recently used"""
+    wrapper = _make_wrapper()
+    retrieve = wrapper.client.pages.retrieve
+
+    with patch("src.clients.notion_wrapper.PAGE_CACHE_SIZE", 3):
+        for page_id in ["page-1", "page-2", "page-3"]:
+            wrapper.get_page(page_id)
+        wrapper.get_page("page-1")  # page-2 is now the least recently used
+        wrapper.get_page("page-4")
+
+        assert list(wrapper._page_cache) == ["page-3", "page-1", "page-4"]
+        assert retrieve.call_count == 4
+
+        wrapper.get_page("page-2")
+        assert retrieve.call_count == 5
+
+    print("✅ Page cache eviction test passed")
+
+
+def test_update_page_refreshes_cached_page():
+    """Test that an update response replaces the cached page unless it is older"""
+    wrapper = _make_wrapper()
+    wrapper.get_page("page-1")
+
+    wrapper.client.pages.update.return_value = _page("page-1", "In progress", "2024-01-01T10:01:00.000Z")
+    wrapper.update_page("page-1", {"Status": {"status": {"name": "In progress"}}})
+    assert wrapper.get_page("page-1")["properties"]["Status"]["status"]["name"] == "In progress"
+
+    # A response that was overtaken by a newer edit must not replace the newer version
+    wrapper.client.pages.update.return_value = _page("page-1", "Queued to run", "2024-01-01T10:00:30.000Z")
+    wrapper.update_page("page-1", {"Status": {"status": {"name": "Queued to run"}}})
+    assert wrapper.get_page("page-1")["properties"]["Status"]["status"]["name"] == "In progress"
+
+    assert wrapper.client.pages.retrieve.call_count == 1
+    print("✅ Page cache update test passed")
+
+
+def test_cached_pages_are_copies():
+    """Test that modifying a returned page does not change the cached version"""
+    wrapper = _make_wrapper()
+
+    page = wrapper.get_page("page-1")
+    page["properties"]["Status"]["status"]["name"] = "Done"
+
+    assert wrapper.get_page("page-1")["properties"]["Status"]["status"]["name"] == "Queued to run"
+    print("✅ Page cache copy test passed")
+
+
+def test_batch_transition_reads_live_pages():
+    """Test that the batch transition guard checks the live page instead of a cached one"""
+    wrapper = _make_wrapper()
+    wrapper.client.pages.retrieve.side_effect = lambda page_id: _page(page_id, TaskStatus.IN_PROGRESS.value)
+    wrapper.get_page("page-1")  # Cache a status that has changed in Notion since
+
+    wrapper.client.pages.retrieve.side_effect = lambda page_id: _page(page_id, TaskStatus.QUEUED_TO_RUN.value, "2024-01-01T10:01:00.000Z")
+    wrapper.client.pages.update.side_effect = lambda page_id, properties: {
+        "id": page_id,
+        "last_edited_time": "2024-01-01T10:02:00.000Z",
+        "properties": {"Status": {"status": {"name": TaskStatus.IN_PROGRESS.value}}},
+    }
+    status_manager = StatusTransitionManager(wrapper)
+
+    results = status_manager.batch_transition_status([("page-1", TaskStatus.QUEUED_TO_RUN.value, TaskStatus.IN_PROGRESS.value)])
+
+    assert results[0].result == TransitionResult.SUCCESS, f"Batch should see the live status: {results[0].error}"
+    assert results[0].from_status == TaskStatus.QUEUED_TO_RUN.value
+    assert wrapper.client.pages.retrieve.call_count == 2
+    print("✅ Batch transition live read test passed")
+
+
+if __name__ == "__main__":
+    print("🧪 Running Notion page cache unit tests...")
+
+    try:
+        test_cached_page_expires_after_ttl()
+        test_max_age_zero_bypasses_cache()
+        test_least_recently_used_page_is_evicted()
+        test_update_page_refreshes_cached_page()
+        test_cached_pages_are_copies()
+        test_batch_transition_reads_live_pages()
+
+        print("🎉 All unit tests passed successfully!")
+        sys.exit(0)
+
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the retry decorator
+"""
+
+import asyncio
+import sys
+from unittest.mock import patch
+
+from src.utils.retry_decorator import retry_with_backoff
+
+
+def _flaky(errors):
+    """Build a function that raises the given errors in turn and then returns the call count."""
+    calls = []
+
+    def func():
+        calls.append(None)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return len(calls)
+
+    return func, calls
+
+
+def test_retries_on_retryable_messages():
+    """Test that network-looking error messages are retried even for non-retryable types"""
+    func, calls = _flaky([ValueError("HTTP 503 Service Unavailable"), KeyError("Connection RESET by peer")])
+    decorated = retry_with_backoff(max_retries=3, retryable_exceptions=(ConnectionError,))(func)
+
+    with patch("src.utils.retry_decorator.time.sleep") as sleep:
+        assert decorated() == 3
+
+    assert sleep.call_count == 2
+    print("✅ Retryable message test passed")
+
+
+def test_does_not_retry_other_errors():
+    """Test that unmatched and non-retryable errors are raised on the first attempt"""
+    func, calls = _flaky([ValueError("bad input")])
+    decorated = retry_with_backoff(max_retries=3, retryable_exceptions=(ConnectionError,))(func)
+
+    with patch("src.utils.retry_decorator.time.sleep") as sleep:
+        try:
+            decorated()
+            assert False, "ValueError should have been raised"
+        except ValueError:
+            pass
+
+    assert len(calls) == 1
+    sleep.assert_not_called()
+
+    func, calls = _flaky([FileNotFoundError("connection.cfg")])
+    decorated = retry_with_backoff(max_retries=3, non_retryable_exceptions=(FileNotFoundError,))(func)
+    try:
+        decorated()
+        assert False, "FileNotFoundError should have been raised"
+    except FileNotFoundError:
+        pass
+    assert len(calls) == 1
+
+    print("✅ Non-retryable error test passed")
+
+
+def test_gives_up_after_max_retries():
+    """Test that the last error is raised once every attempt has failed"""
+    func, calls = _flaky([ConnectionError("down")] * 5)
+    decorated = retry_with_backoff(max_retries=2, jitter=False)(func)
+
+    with patch("src.utils.retry_decorator.time.sleep") as sleep:
+        try:
+            decorated()
+            assert False, "ConnectionError should have been raised"
+        except ConnectionError:
+            pass
+
+    assert len(calls) == 3
+    assert [call.args[0] for call in sleep.call_args_list] == [1.0, 2.0]
+    print("✅ Max retries test passed")
+
+
+def test_async_retry():
+    """Test that coroutine functions are retried with asyncio.sleep"""
+    calls = []
+
+    @retry_with_backoff(max_retries=2)
+    async def flaky():
+        calls.append(None)
+        if len(calls) < 2:
+            raise TimeoutError("request timeout")
+        return "done"
+
+    async def no_sleep(delay):
+        return None
+
+    with patch("src.utils.retry_decorator.asyncio.sleep", side_effect=no_sleep) as sleep:
+        assert asyncio.run(flaky()) == "done"
+
+    assert len(calls) == 2
+    assert sleep.call_count == 1
+    assert asyncio.iscoroutinefunction(flaky)
+    print("✅ Async retry test passed")
+
+
+if __name__ == "__main__":
+    print("🧪 Running retry decorator unit tests...")
+
+    try:
+        test_retries_on_retryable_messages()
+        test_does_not_retry_other_errors()
+        test_gives_up_after_max_retries()
+        test_async_retry()
+
+        print("🎉 All unit tests passed successfully!")
+        sys.exit(0)
+
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+
+        traceback.print_exc()
+        sys.exit(1)
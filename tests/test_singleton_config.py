@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the singleton configuration manager
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+from src.utils.singleton_config import SingletonConfigManager, get_config, initialize_config
+
+
+def test_get_config_returns_one_instance():
+    """Test that get_config creates the instance once and then keeps returning it"""
+    SingletonConfigManager.reset()
+    try:
+        config = get_config()
+        assert get_config() is config
+        assert SingletonConfigManager() is config
+        assert SingletonConfigManager.get_instance() is config
+    finally:
+        SingletonConfigManager.reset()
+
+    print("✅ Singleton instance test passed")
+
+
+def test_initialize_and_reset_replace_instance():
+    """Test that initialize_config replaces the instance seen by get_config and reset clears it"""
+    SingletonConfigManager.reset()
+    try:
+        first = get_config()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            initialized = initialize_config(working_dir=temp_dir, strict_validation=False)
+            assert initialized is not first
+            assert get_config() is initialized
+            assert initialized.working_dir == Path(temp_dir)
+
+        SingletonConfigManager.reset()
+        assert SingletonConfigManager.get_instance() is None
+        assert get_config() is not initialized
+    finally:
+        SingletonConfigManager.reset()
+
+    print("✅ Singleton initialize and reset test passed")
+
+
+if __name__ == "__main__":
+    print("🧪 Running singleton config unit tests...")
+
+    try:
+        test_get_config_returns_one_instance()
+        test_initialize_and_reset_replace_instance()
+
+        print("🎉 All unit tests passed successfully!")
+        sys.exit(0)
+
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+
+        traceback.print_exc()
+        sys.exit(1)
@@ -2,8 +2,10 @@
 """
 Unit tests for Status Transition Management system
 """
+
 import os
 import sys
+import threading
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
 
@@ -11,7 +13,7 @@ from datetime import datetime
 from unittest.mock import MagicMock, Mock
 
 from notion_wrapper import NotionClientWrapper
-from status_transition_manager import StatusTransitionManager, TransitionResult
+from status_transition_manager import ReadWriteLock, StatusTransition, StatusTransitionManager, TransitionResult
 from task_status import TaskStatus
 
 
@@ -99,6 +101,64 @@ def test_statistics():
     print("✅ Statistics test passed")
 
 
+def test_history_is_bounded():
+    """Test that history keeps only the newest entries and returns them oldest first"""
+    mock_notion_client = Mock(spec=NotionClientWrapper)
+    status_manager = StatusTransitionManager(mock_notion_client)
+
+    for i in range(status_manager._max_history + 5):
+        status_manager._add_to_history(
+            StatusTransition(page_id=f"page-{i}", from_status="A", to_status="B", timestamp=datetime.now(), result=TransitionResult.SUCCESS)
+        )
+
+    assert len(status_manager.get_transition_history(limit=0)) == status_manager._max_history
+    recent = status_manager.get_transition_history(limit=3)
+    expected_ids = [f"page-{status_manager._max_history + i}" for i in (2, 3, 4)]
+    assert [t.page_id for t in recent] == expected_ids, f"Expected {expected_ids}, got {[t.page_id for t in recent]}"
+
+    # Per-page lookups only see entries still in history
+    assert status_manager.get_transition_history(page_id="page-0") == [], "Evicted entries should not be returned"
+    assert [t.page_id for t in status_manager.get_transition_history(page_id=expected_ids[0])] == [expected_ids[0]]
+
+    print("✅ History bounding test passed")
+
+
+def test_rollback_statistics_follow_history():
+    """Test that rollback counters only cover transitions still held in history"""
+    mock_notion_client = Mock(spec=NotionClientWrapper)
+    mock_notion_client.update_page_status.side_effect = lambda page_id, status: {"properties": {"Status": {"status": {"name": status}}}}
+    mock_notion_client.batch_update_page_statuses.side_effect = lambda updates: [
+        {"properties": {"Status": {"status": {"name": status}}}} for _, status in updates
+    ]
+    status_manager = StatusTransitionManager(mock_notion_client)
+
+    def make_transition(page_id):
+        return StatusTransition(
+            page_id=page_id,
+            from_status=TaskStatus.QUEUED_TO_RUN.value,
+            to_status=TaskStatus.IN_PROGRESS.value,
+            timestamp=datetime.now(),
+            result=TransitionResult.SUCCESS,
+        )
+
+    evicted = make_transition("page-evicted")
+    status_manager._add_to_history(evicted)
+    for i in range(status_manager._max_history):
+        status_manager._add_to_history(make_transition(f"page-{i}"))
+    recorded = status_manager.get_transition_history(limit=1)[0]
+
+    status_manager.rollback_transition(recorded)
+    status_manager.rollback_transition(evicted)
+    status_manager.rollback_transitions([make_transition("page-unrecorded")])
+
+    history = status_manager.get_transition_history(limit=0)
+    stats = status_manager.get_statistics()
+    assert stats["rollbacks_attempted"] == sum(1 for t in history if t.rollback_attempted) == 1, f"Unexpected rollback statistics: {stats}"
+    assert stats["rollbacks_successful"] == sum(1 for t in history if t.rollback_result == TransitionResult.ROLLBACK_SUCCESS) == 1
+
+    print("✅ Rollback statistics test passed")
+
+
 def test_thread_safety():
     """Test that the transition manager is thread-safe"""
     mock_notion_client = Mock(spec=NotionClientWrapper)
@@ -111,6 +171,140 @@ def test_thread_safety():
     print("✅ Thread safety test passed")
 
 
+def test_single_threaded_manager():
+    """Test that a manager built with thread_safe=False still transitions and records history"""
+    mock_notion_client = Mock(spec=NotionClientWrapper)
+    mock_notion_client.update_page_status.return_value = {"properties": {"Status": {"status": {"name": TaskStatus.DONE.value}}}}
+    status_manager = StatusTransitionManager(mock_notion_client, thread_safe=False)
+
+    assert not isinstance(status_manager._transition_lock, ReadWriteLock), "Should not lock when not thread-safe"
+
+    transition = status_manager.transition_status("page-a", TaskStatus.IN_PROGRESS.value, TaskStatus.DONE.value, trust_from_status=True)
+
+    assert transition.result == TransitionResult.SUCCESS
+    assert status_manager.get_transition_history("page-a") == [transition]
+    assert status_manager.get_statistics()["successful_transitions"] == 1
+
+    print("✅ Single-threaded manager test passed")
+
+
+def test_read_write_lock():
+    """Test that readers share the lock while the write side stays exclusive and reentrant"""
+    lock = ReadWriteLock()
+
+    # Writers may re-enter and read while holding the write side
+    with lock.write():
+        with lock.write():
+            with lock.read():
+                pass
+
+    # Two readers can hold the lock at the same time
+    both_inside = threading.Barrier(2, timeout=2)
+
+    def reader():
+        with lock.read():
+            both_inside.wait()
+
+    readers = [threading.Thread(target=reader) for _ in range(2)]
+    for thread in readers:
+        thread.start()
+    for thread in readers:
+        thread.join()
+    assert not both_inside.broken, "Readers should not block each other"
+
+    print("✅ Read/write lock test passed")
+
+
+def test_trusted_from_status_skips_page_fetch():
+    """Test that a caller-vouched from_status saves the pre-update page read"""
+    mock_notion_client = Mock(spec=NotionClientWrapper)
+    mock_notion_client.update_page_status.return_value = {"properties": {"Status": {"status": {"name": TaskStatus.DONE.value}}}}
+    status_manager = StatusTransitionManager(mock_notion_client)
+
+    transition = status_manager.transition_status("page-a", TaskStatus.IN_PROGRESS.value, TaskStatus.DONE.value, trust_from_status=True)
+
+    assert transition.result == TransitionResult.SUCCESS
+    mock_notion_client.get_page.assert_not_called()
+
+    print("✅ Trusted from_status test passed")
+
+
+def test_batch_transition_rollback():
+    """Test that a failed update in an atomic batch rolls back the others together"""
+    mock_notion_client = Mock(spec=NotionClientWrapper)
+    queued_page = {"properties": {"Status": {"status": {"name": TaskStatus.QUEUED_TO_RUN.value}}}}
+    in_progress_page = {"properties": {"Status": {"status": {"name": TaskStatus.IN_PROGRESS.value}}}}
+    mock_notion_client.batch_get_pages.return_value = [queued_page, queued_page]
+    mock_notion_client.batch_update_page_statuses.side_effect = [[in_progress_page, None], [queued_page]]
+    status_manager = StatusTransitionManager(mock_notion_client)
+
+    results = status_manager.batch_transition_status(
+        [
+            ("page-a", TaskStatus.QUEUED_TO_RUN.value, TaskStatus.IN_PROGRESS.value),
+            ("page-b", TaskStatus.QUEUED_TO_RUN.value, TaskStatus.IN_PROGRESS.value),
+        ]
+    )
+
+    assert [r.result for r in results] == [TransitionResult.SUCCESS, TransitionResult.FAILED]
+    assert results[0].rollback_result == TransitionResult.ROLLBACK_SUCCESS, "Successful transition should be rolled back"
+    stats = status_manager.get_statistics()
+    assert (stats["rollbacks_attempted"], stats["rollbacks_successful"]) == (1, 1), f"Unexpected rollback statistics: {stats}"
+    mock_notion_client.batch_update_page_statuses.assert_called_with([("page-a", TaskStatus.QUEUED_TO_RUN.value)])
+    assert mock_notion_client.batch_get_pages.call_count == 1, "Pages should be fetched in a single batch"
+
+    print("✅ Batch transition rollback test passed")
+
+
+def test_transitions_on_different_pages_overlap():
+    """Test that Notion calls for different pages are not serialized behind one lock"""
+    mock_notion_client = Mock(spec=NotionClientWrapper)
+    both_updating = threading.Barrier(2, timeout=2)
+
+    def update_page_status(page_id, status):
+        both_updating.wait()
+        return {"properties": {"Status": {"status": {"name": status}}}}
+
+    mock_notion_client.get_page.return_value = {"properties": {"Status": {"status": {"name": TaskStatus.IN_PROGRESS.value}}}}
+    mock_notion_client.update_page_status.side_effect = update_page_status
+    status_manager = StatusTransitionManager(mock_notion_client)
+
+    results = status_manager.transition_batch(
+        [
+            ("page-a", TaskStatus.IN_PROGRESS.value, TaskStatus.DONE.value),
+            ("page-b", TaskStatus.IN_PROGRESS.value, TaskStatus.DONE.value),
+        ],
+        max_workers=2,
+    )
+
+    assert not both_updating.broken, "Updates for different pages should run concurrently"
+    assert all(r.result == TransitionResult.SUCCESS for r in results)
+
+    print("✅ Concurrent page transition test passed")
+
+
+def test_transition_batch():
+    """Test concurrent batch transitions keep input order and report per-page results"""
+    mock_notion_client = Mock(spec=NotionClientWrapper)
+    mock_notion_client.get_page.return_value = {"properties": {"Status": {"status": {"name": TaskStatus.IN_PROGRESS.value}}}}
+    mock_notion_client.update_page_status.side_effect = lambda page_id, status: (
+        None if page_id == "page-fail" else {"properties": {"Status": {"status": {"name": status}}}}
+    )
+    status_manager = StatusTransitionManager(mock_notion_client)
+
+    updates = [
+        ("page-a", TaskStatus.IN_PROGRESS.value, TaskStatus.DONE.value),
+        ("page-fail", TaskStatus.IN_PROGRESS.value, TaskStatus.DONE.value),
+        ("page-b", TaskStatus.IN_PROGRESS.value, TaskStatus.FAILED.value),
+    ]
+    results = status_manager.transition_batch(updates)
+
+    assert [r.page_id for r in results] == ["page-a", "page-fail", "page-b"], "Results should keep input order"
+    assert [r.result for r in results] == [TransitionResult.SUCCESS, TransitionResult.FAILED, TransitionResult.SUCCESS]
+    assert status_manager.transition_batch([]) == [], "Empty batch should return no results"
+
+    print("✅ Concurrent batch transition test passed")
+
+
 if __name__ == "__main__":
     print("🧪 Running Status Transition Management unit tests...")
 
@@ -118,7 +312,15 @@ if __name__ == "__main__":
         test_transition_validation()
         test_status_extraction()
         test_statistics()
+        test_history_is_bounded()
+        test_rollback_statistics_follow_history()
         test_thread_safety()
+        test_single_threaded_manager()
+        test_read_write_lock()
+        test_trusted_from_status_skips_page_fetch()
+        test_batch_transition_rollback()
+        test_transitions_on_different_pages_overlap()
+        test_transition_batch()
 
         print("🎉 All unit tests passed successfully!")
         sys.exit(0)
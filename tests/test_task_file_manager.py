@@ -327,7 +327,7 @@ class TestTaskFileManager(unittest.TestCase):
 
         # Verify consistent checksums
         self.assertEqual(checksum1, checksum2)
-        self.assertEqual(len(checksum1), 32)  # MD5 hex digest length
+        self.assertEqual(len(checksum1), 64)  # 256-bit hex digest length
 
     def test_operation_statistics(self):
         """Test operation statistics tracking."""
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the task locking system
+"""
+
+import sys
+import threading
+from unittest.mock import Mock, patch
+
+from src.utils.task_locking import DatabaseTaskLockManager, InMemoryTaskLockManager, LockResult, safe_task_claim, with_task_lock
+
+
+def test_lock_and_release():
+    """Test that a task can be locked, is refused to other owners, and can be released"""
+    lock_manager = InMemoryTaskLockManager()
+
+    first = lock_manager.try_lock_task("task-1", "owner-a")
+    assert first.result == LockResult.SUCCESS
+    assert first.task_lock.owner_id == "owner-a"
+
+    second = lock_manager.try_lock_task("task-1", "owner-b")
+    assert second.result == LockResult.ALREADY_LOCKED
+    assert second.existing_owner == "owner-a"
+
+    assert not lock_manager.release_lock("task-1", "owner-b"), "Only the owner may release a lock"
+    assert lock_manager.release_lock("task-1", "owner-a")
+    assert lock_manager.get_task_lock("task-1") is None
+
+    metrics = lock_manager.get_metrics()
+    assert metrics.total_attempts == 2
+    assert metrics.successful_locks == 1
+    assert metrics.failed_locks == 1
+
+    print("✅ Lock and release test passed")
+
+
+def test_renewal_and_expired_reclaim():
+    """Test that the owner can renew its lock and an expired lock can be claimed by another owner"""
+    lock_manager = InMemoryTaskLockManager()
+
+    first = lock_manager.try_lock_task("task-1", "owner-a")
+    renewed = lock_manager.try_lock_task("task-1", "owner-a")
+    assert renewed.result == LockResult.SUCCESS
+    assert renewed.task_lock is first.task_lock
+    assert renewed.task_lock.lock_version == 2
+
+    lock_manager.try_lock_task("task-2", "owner-a", timeout_minutes=0)
+    reclaimed = lock_manager.try_lock_task("task-2", "owner-b")
+    assert reclaimed.result == LockResult.SUCCESS
+    assert lock_manager.get_task_lock("task-2").owner_id == "owner-b"
+
+    print("✅ Renewal and expired reclaim test passed")
+
+
+def test_cleanup_stale_locks():
+    """Test that cleanup removes expired and stale locks but keeps renewed and live ones"""
+    lock_manager = InMemoryTaskLockManager()
+
+    lock_manager.try_lock_task("expired", "owner-a", timeout_minutes=0)
+    lock_manager.try_lock_task("renewed", "owner-a", timeout_minutes=0)
+    lock_manager.try_lock_task("renewed", "owner-a", timeout_minutes=30)
+    lock_manager.try_lock_task("live", "owner-a")
+    lock_manager.try_lock_task("released", "owner-a", timeout_minutes=0)
+    lock_manager.release_lock("released", "owner-a")
+
+    assert lock_manager.cleanup_stale_locks() == 1
+    assert sorted(lock_manager.get_active_locks()) == ["live", "renewed"]
+
+    # With a zero stale timeout every remaining lock is stale
+    assert lock_manager.cleanup_stale_locks(stale_timeout_minutes=0) == 2
+    assert lock_manager.get_active_locks() == {}
+    assert lock_manager.get_metrics().stale_locks_cleaned == 3
+
+    print("✅ Stale lock cleanup test passed")
+
+
+def test_locks_across_shards():
+    """Test that locks spread over shards are all visible, cleaned and released"""
+    lock_manager = InMemoryTaskLockManager()
+    task_ids = [f"task-{i}" for i in range(100)]
+
+    for task_id in task_ids:
+        assert lock_manager.try_lock_task(task_id, "owner-a").result == LockResult.SUCCESS
+
+    assert sorted(lock_manager.get_active_locks()) == sorted(task_ids)
+    assert lock_manager.cleanup_stale_locks() == 0
+    assert lock_manager.force_release_all_locks() == len(task_ids)
+    assert lock_manager.get_active_locks() == {}
+
+    print("✅ Sharded locks test passed")
+
+
+def test_try_lock_many():
+    """Test that a batch lock returns one result per task in order and counts every attempt"""
+    lock_manager = InMemoryTaskLockManager()
+    lock_manager.try_lock_task("task-b", "owner-b")
+    task_ids = ["task-a", "task-b", "task-c"] + [f"task-{i}" for i in range(40)]
+
+    results = lock_manager.try_lock_many(task_ids, "owner-a")
+
+    assert [result.result for result in results[:3]] == [LockResult.SUCCESS, LockResult.ALREADY_LOCKED, LockResult.SUCCESS]
+    assert all(result.result == LockResult.SUCCESS for result in results[3:])
+    assert results[1].existing_owner == "owner-b"
+
+    metrics = lock_manager.get_metrics()
+    assert metrics.total_attempts == len(task_ids) + 1
+    assert metrics.successful_locks == len(task_ids)
+    assert metrics.failed_locks == 1
+
+    print("✅ Batch lock test passed")
+
+
+def test_concurrent_claims_have_one_winner():
+    """Test that concurrent owners racing for the same task produce exactly one lock"""
+    lock_manager = InMemoryTaskLockManager()
+    start = threading.Barrier(8)
+    results = []
+
+    def claim(owner_id):
+        start.wait()
+        results.append(lock_manager.try_lock_task("task-1", owner_id).result)
+
+    threads = [threading.Thread(target=claim, args=(f"owner-{i}",)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results.count(LockResult.SUCCESS) == 1
+    assert results.count(LockResult.ALREADY_LOCKED) == 7
+
+    print("✅ Concurrent claim test passed")
+
+
+def test_with_task_lock():
+    """Test that the lock context releases on exit, also on errors, and refuses held tasks"""
+    lock_manager = InMemoryTaskLockManager()
+
+    with with_task_lock(lock_manager, "task-1", "owner-a") as task_lock:
+        assert task_lock.owner_id == "owner-a"
+        assert lock_manager.get_task_lock("task-1") is task_lock
+    assert lock_manager.get_task_lock("task-1") is None
+
+    lock_manager.try_lock_task("task-2", "owner-b")
+    assert safe_task_claim(lock_manager, "task-2", "owner-a", lambda task_id: task_id) == (False, None)
+
+    def failing_processor(task_id):
+        raise ValueError("boom")
+
+    assert safe_task_claim(lock_manager, "task-3", "owner-a", failing_processor) == (False, "boom")
+    assert lock_manager.get_task_lock("task-3") is None
+
+    print("✅ Lock context test passed")
+
+
+def test_database_lock_retries_lost_races():
+    """Test that the database manager retries a lost race but gives up on a real conflict"""
+    lock_manager = DatabaseTaskLockManager(Mock())
+    lock_manager._get_task_status = Mock(return_value="Queued to run")
+    lock_manager._atomic_status_update = Mock(side_effect=[False, False, True])
+
+    with patch("src.utils.task_locking.time.sleep") as sleep:
+        result = lock_manager.try_lock_task("task-1", "owner-a")
+
+    assert result.result == LockResult.SUCCESS
+    assert lock_manager._atomic_status_update.call_count == 3
+    assert sleep.call_count == 2
+
+    record = lock_manager._lock_metadata_record(result.task_lock)
+    assert record["locked_by"] == "owner-a"
+    assert record["expires_at"] > record["locked_at"]
+
+    lock_manager._get_task_status.return_value = "In progress"
+    lock_manager._atomic_status_update = Mock(return_value=False)
+
+    with patch("src.utils.task_locking.time.sleep") as sleep:
+        result = lock_manager.try_lock_task("task-2", "owner-a")
+
+    assert result.result == LockResult.ALREADY_LOCKED
+    assert lock_manager._atomic_status_update.call_count == 1
+    sleep.assert_not_called()
+
+    print("✅ Database lock retry test passed")
+
+
+if __name__ == "__main__":
+    print("🧪 Running task locking unit tests...")
+
+    try:
+        test_lock_and_release()
+        test_renewal_and_expired_reclaim()
+        test_cleanup_stale_locks()
+        test_locks_across_shards()
+        test_try_lock_many()
+        test_concurrent_claims_have_one_winner()
+        test_with_task_lock()
+        test_database_lock_retries_lost_races()
+
+        print("🎉 All unit tests passed successfully!")
+        sys.exit(0)
+
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        import traceback
+
+        traceback.print_exc()
+        sys.exit(1)